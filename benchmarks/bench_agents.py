@@ -0,0 +1,240 @@
+"""
+Offline latency benchmark of the agent layer
+Runs AnxietyKillerAgent and AskMeAgent against FakeLLM (see
+benchmarks/fake_llm.py), so the numbers are pure application and
+railtracks overhead: agent construction, prompt building, rt.call round
+trips with and without tool calls, the ChatWorker thread and event loop,
+and throughput under concurrent requests.
+
+Usage: python -m benchmarks.bench_agents [--repeat N] [--latency S] [--tokens-per-second R] [--json PATH]
+"""
+import os
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+from benchmarks.bench_data_manager import git_commit
+from benchmarks.fake_llm import FakeLLM, FakeAnxietyKillerAgent, FakeAskMeAgent
+from src.utils import DataManager
+
+CONCURRENCY_LEVELS = (1, 4, 16)
+
+
+def stage_result(samples, simulated=None):
+    """Milliseconds statistics; overhead excludes the simulated model time"""
+    ms = [s * 1000 for s in samples]
+    result = {"runs": len(ms), "median_ms": statistics.median(ms), "min_ms": min(ms)}
+    if simulated is not None:
+        overhead = [(s - sim) * 1000 for s, sim in zip(samples, simulated)]
+        result["overhead_ms"] = statistics.median(overhead)
+    return result
+
+
+def rich_context(data_manager):
+    """A chat context as large as the widget builds for a busy user"""
+    tasks = [t.to_dict() for t in data_manager.get_all_tasks()[:20]]
+    mentions = {
+        f"task:{t['id']}": {"type": "task", "title": t["title"], "category": t["category"],
+                            "due_date": t["due_date"], "description": t["description"]}
+        for t in tasks[:5]
+    }
+    mentions["person:p1"] = {"type": "person", "name": "Alex", "personal_info": "Friend from work",
+                             "birthday": "1990-04-01", "events": ["Lunch", "Move"],
+                             "custom_fields": {"team": "design"}}
+    return {"tasks": tasks, "recent_diary": "Felt calm today. " * 20, "mentions": mentions}
+
+
+async def time_calls(llm, call, repeat):
+    """Await call() repeat times; returns (wall seconds, simulated model seconds) per run"""
+    samples, simulated = [], []
+    for _ in range(repeat):
+        llm.reset()
+        start = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - start)
+        simulated.append(llm.simulated_seconds)
+    return samples, simulated
+
+
+async def measure_calls(data_manager, repeat):
+    """Round trips through rt.call with a zero-latency model"""
+    results = {}
+    context = rich_context(data_manager)
+
+    llm = FakeLLM()
+    agent = FakeAnxietyKillerAgent(llm, data_manager)
+    await agent.chat("warm up")
+
+    results["call[text]"] = stage_result(*await time_calls(llm, lambda: agent.chat("I feel stuck"), repeat))
+    results["call[text, rich context]"] = stage_result(
+        *await time_calls(llm, lambda: agent.chat("I feel stuck", context), repeat))
+
+    for tool_count in (1, 3):
+        llm.tool_script = [[
+            {"name": "create_task_tool", "arguments": {"title": f"Benchmark task {i}", "category": "someday_maybe"}}
+            for i in range(tool_count)
+        ]]
+        results[f"call[{tool_count} tool]"] = stage_result(
+            *await time_calls(llm, lambda: agent.chat("Remind me to call the dentist"), repeat))
+    llm.tool_script = []
+
+    ask_llm = FakeLLM()
+    ask_me = FakeAskMeAgent(ask_llm)
+    await ask_me.ask("warm up")
+    history = [{"role": "user" if i % 2 == 0 else "assistant", "content": f"Message {i}"} for i in range(20)]
+    results["ask[20 message history]"] = stage_result(
+        *await time_calls(ask_llm, lambda: ask_me.ask("Why is the sky blue?", history), repeat))
+
+    # Per tool call: extra time of a tool turn over the plain reply, without model time
+    text_overhead = results["call[text]"]["overhead_ms"]
+    for tool_count in (1, 3):
+        stage = results[f"call[{tool_count} tool]"]
+        stage["per_tool_ms"] = (stage["overhead_ms"] - text_overhead) / tool_count
+    return results
+
+
+def measure_worker(data_manager, repeat):
+    """The ChatWorker path: a QThread plus a new event loop for every message"""
+    from PyQt6.QtCore import QCoreApplication
+    from src.ui.anxiety_killer_widget import ChatWorker
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    llm = FakeLLM()
+    agent = FakeAnxietyKillerAgent(llm, data_manager)
+    samples, simulated = [], []
+    for _ in range(repeat):
+        llm.reset()
+        worker = ChatWorker(agent, "I feel stuck")
+        start = time.perf_counter()
+        worker.start()
+        worker.wait()
+        samples.append(time.perf_counter() - start)
+        simulated.append(llm.simulated_seconds)
+        app.processEvents()
+    return stage_result(samples, simulated)
+
+
+async def measure_throughput(data_manager, latency, tokens_per_second, reply_tokens):
+    """Requests per second at several concurrency levels with a realistic model delay"""
+    results = {}
+    for concurrency in CONCURRENCY_LEVELS:
+        llm = FakeLLM(latency=latency, tokens_per_second=tokens_per_second, reply_tokens=reply_tokens)
+        agent = FakeAnxietyKillerAgent(llm, data_manager)
+        requests = max(16, concurrency * 2)
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async def one(i):
+            async with semaphore:
+                start = time.perf_counter()
+                await agent.chat(f"Message {i}")
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+
+        model_seconds = llm.calls[0]["simulated_s"]
+        results[f"concurrency={concurrency}"] = {
+            "requests": requests,
+            "throughput_rps": requests / elapsed,
+            "ideal_rps": concurrency / model_seconds,
+            "mean_latency_ms": statistics.fmean(latencies) * 1000,
+            "model_ms": model_seconds * 1000,
+        }
+    return results
+
+
+def run(repeat, latency, tokens_per_second, reply_tokens):
+    """Run every stage from a scratch directory (railtracks writes ./.railtracks)"""
+    warnings.filterwarnings("ignore")
+    # Each ChatWorker loop is closed with railtracks' publisher task still pending
+    logging.getLogger("asyncio").setLevel(logging.CRITICAL)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bba-agent-bench-") as tmp:
+        os.chdir(tmp)
+        try:
+            data_manager = DataManager(str(Path(tmp) / "data"), fsync=False)
+            from src.models import Task
+            for i in range(50):
+                data_manager.save_task(Task(id=f"task{i}", title=f"Task {i}", description="Something to do",
+                                            category="today_must", due_date="2024-06-01"))
+
+            stages = {}
+            llm = FakeLLM()
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                agent = FakeAnxietyKillerAgent(llm, data_manager)
+                samples.append(time.perf_counter() - start)
+            stages["agent_init"] = stage_result(samples)
+
+            context = rich_context(data_manager)
+            for name, ctx in (("prompt_build[no context]", None), ("prompt_build[rich context]", context)):
+                samples = []
+                for _ in range(repeat * 10):
+                    start = time.perf_counter()
+                    agent.build_message("I feel stuck", ctx)
+                    samples.append(time.perf_counter() - start)
+                stages[name] = stage_result(samples)
+
+            stages.update(asyncio.run(measure_calls(data_manager, repeat)))
+            stages["chat_worker[text]"] = measure_worker(data_manager, repeat)
+            stages["chat_worker[text]"]["thread_and_loop_ms"] = (
+                stages["chat_worker[text]"]["overhead_ms"] - stages["call[text]"]["overhead_ms"]
+            )
+            throughput = asyncio.run(measure_throughput(data_manager, latency, tokens_per_second, reply_tokens))
+            data_manager.close()
+        finally:
+            os.chdir(cwd)
+
+    return {
+        "benchmark": "agents",
+        "commit": git_commit(),
+        "model": {"latency_s": latency, "tokens_per_second": tokens_per_second, "reply_tokens": reply_tokens},
+        "stages": stages,
+        "throughput": throughput,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="runs per stage")
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated time to first token (s)")
+    parser.add_argument("--tokens-per-second", type=float, default=400, help="simulated output rate")
+    parser.add_argument("--reply-tokens", type=int, default=40, help="tokens in each simulated reply")
+    parser.add_argument("--json", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    report = run(args.repeat, args.latency, args.tokens_per_second, args.reply_tokens)
+
+    print(f"{'stage':<30}{'median ms':>11}{'overhead ms':>13}  notes")
+    for name, r in report["stages"].items():
+        overhead = f"{r['overhead_ms']:>13.2f}" if "overhead_ms" in r else f"{'':>13}"
+        notes = ""
+        if "per_tool_ms" in r:
+            notes = f"{r['per_tool_ms']:.2f} ms per tool call"
+        elif "thread_and_loop_ms" in r:
+            notes = f"{r['thread_and_loop_ms']:.2f} ms thread + event loop"
+        print(f"{name:<30}{r['median_ms']:>11.2f}{overhead}  {notes}")
+
+    print(f"\n{'throughput':<20}{'req/s':>8}{'ideal':>8}{'mean latency ms':>17}")
+    for name, r in report["throughput"].items():
+        print(f"{name:<20}{r['throughput_rps']:>8.1f}{r['ideal_rps']:>8.1f}{r['mean_latency_ms']:>17.1f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Benchmark of DataManager operations on synthetic user profiles
+Generates a seeded profile (see benchmarks/synthetic.py), then times cold
+(fresh DataManager over a pristine copy of the data) and warm operations.
+Results can be written as JSON and compared across commits.
+
+Usage: python -m benchmarks.bench_data_manager [--profile small|medium|large]
+           [--tasks N] [--repeat N] [--engine atomic|journal] [--no-fsync]
+           [--json PATH] [--compare PATH]
+"""
+import argparse
+import inspect
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import PROFILES, generate_profile
+from src.models import Task
+from src.utils import DataManager
+
+
+def git_commit():
+    """Current commit hash, or None outside a git checkout"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Older commits' DataManager lacks some options; the benchmark runs against those too
+DATA_MANAGER_PARAMS = inspect.signature(DataManager.__init__).parameters
+STORAGE_ENGINES = getattr(DataManager, "STORAGE_ENGINES", ("atomic",))
+
+
+def open_manager(data_dir, fsync=True, engine="atomic"):
+    """A DataManager passed only the options this version accepts"""
+    kwargs = {}
+    if "fsync" in DATA_MANAGER_PARAMS:
+        kwargs["fsync"] = fsync
+    if "storage_engine" in DATA_MANAGER_PARAMS:
+        kwargs["storage_engine"] = engine
+    return DataManager(str(data_dir), **kwargs)
+
+
+def close_manager(data_manager):
+    """Close a DataManager if this version can"""
+    close = getattr(data_manager, "close", None)
+    if close is not None:
+        close()
+
+
+def summarize(samples):
+    """Milliseconds statistics for a list of durations in seconds"""
+    ms = [s * 1000 for s in samples]
+    return {"runs": len(ms), "min_ms": min(ms), "median_ms": statistics.median(ms),
+            "mean_ms": statistics.fmean(ms), "max_ms": max(ms)}
+
+
+class DataManagerBenchmark:
+    """Times DataManager operations against one generated profile"""
+
+    def __init__(self, pristine_dir, work_dir, engine, fsync, repeat):
+        self.pristine_dir = Path(pristine_dir)
+        self.work_dir = Path(work_dir)
+        self.engine = engine
+        self.fsync = fsync
+        self.repeat = repeat
+        self.results = {}
+
+    def fresh_manager(self):
+        """A DataManager over an untouched copy of the profile"""
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+        shutil.copytree(self.pristine_dir, self.work_dir)
+        return open_manager(self.work_dir, self.fsync, self.engine)
+
+    def measure(self, name, operation, setup=None, repeat=None):
+        """Time operation(state) repeat times; setup() builds untimed state for each run"""
+        samples = []
+        for i in range(repeat or self.repeat):
+            state = setup() if setup else i
+            start = time.perf_counter()
+            operation(state)
+            samples.append(time.perf_counter() - start)
+            if isinstance(state, DataManager):
+                close_manager(state)
+        self.results[name] = summarize(samples)
+
+    def run(self):
+        # Cold: every run opens a fresh DataManager, so parsing and index builds are included
+        self.measure("get_tasks_by_category[cold]",
+                     lambda dm: dm.get_tasks_by_category("today_must"), self.fresh_manager)
+        self.measure("get_focus_stats[cold]", lambda dm: dm.get_focus_stats(), self.fresh_manager)
+        self.measure("get_chat_history[cold]",
+                     lambda dm: dm.get_chat_history("anxiety_killer", limit=50), self.fresh_manager)
+        self.measure("get_setting[cold]", lambda dm: dm.get_setting("todolists", []), self.fresh_manager)
+
+        # Warm: one manager whose caches are already populated
+        dm = self.fresh_manager()
+        tasks = dm.get_all_tasks()
+        dm.get_focus_stats()
+        dm.get_chat_history("anxiety_killer", limit=1)
+        todolists = dm.get_setting("todolists", [])
+        listed = [task_id for todolist in todolists for task_id in todolist.get("tasks", [])]
+        warm_repeat = self.repeat * 10
+
+        self.measure("get_task[warm]", lambda i: dm.get_task(tasks[i % len(tasks)].id), repeat=warm_repeat)
+        self.measure("get_tasks_by_category[warm]",
+                     lambda i: dm.get_tasks_by_category("today_must"), repeat=warm_repeat)
+        self.measure("get_focus_stats[warm]", lambda i: dm.get_focus_stats(), repeat=warm_repeat)
+        self.measure("get_chat_history[warm]",
+                     lambda i: dm.get_chat_history("anxiety_killer", limit=50))
+        self.measure("get_chat_history[full]", lambda i: dm.get_chat_history("ask_me", "conv0"))
+        self.measure("get_setting[warm]", lambda i: dm.get_setting("todolists", []), repeat=warm_repeat)
+
+        # Writes
+        def update_task(i):
+            task = tasks[i % len(tasks)]
+            task.completed = not task.completed
+            dm.save_task(task)
+
+        self.measure("save_task[update]", update_task)
+        self.measure("save_task[insert]", lambda i: dm.save_task(
+            Task(id=f"bench{i:06d}", title=f"Benchmark task {i}", description="", category="today_must")))
+        self.measure("remove_task_from_all_todolists",
+                     lambda i: dm.remove_task_from_all_todolists(listed[i % len(listed)]))
+        self.measure("save_chat_message",
+                     lambda i: dm.save_chat_message("anxiety_killer", "user", f"Benchmark message {i}"))
+        close_manager(dm)
+        shutil.rmtree(self.work_dir)
+        return self.results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="small", help="synthetic data size")
+    parser.add_argument("--tasks", type=int, help="override the profile's task count")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the generated data")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per cold/write measurement")
+    parser.add_argument("--engine", choices=STORAGE_ENGINES, default="atomic")
+    parser.add_argument("--no-fsync", action="store_true", help="skip fsync on writes")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare medians against")
+    args = parser.parse_args()
+
+    overrides = {"tasks": args.tasks} if args.tasks else {}
+    with tempfile.TemporaryDirectory(prefix="bba-bench-") as tmp:
+        counts = generate_profile(Path(tmp) / "pristine", args.profile, args.seed, **overrides)
+        benchmark = DataManagerBenchmark(Path(tmp) / "pristine", Path(tmp) / "work",
+                                         args.engine, not args.no_fsync, args.repeat)
+        results = benchmark.run()
+
+    print(f"profile {args.profile}: " + ", ".join(f"{k}={v}" for k, v in counts.items()
+                                                  if k not in ("profile", "seed")))
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    print(f"{'operation':<34}{'median ms':>12}{'min ms':>12}{'runs':>6}" + (f"{'vs base':>10}" if baseline else ""))
+    for name, r in results.items():
+        line = f"{name:<34}{r['median_ms']:>12.3f}{r['min_ms']:>12.3f}{r['runs']:>6}"
+        if name in baseline and baseline[name]["median_ms"]:
+            line += f"{r['median_ms'] / baseline[name]['median_ms']:>9.2f}x"
+        print(line)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"benchmark": "data_manager", "commit": git_commit(), "engine": args.engine,
+                       "fsync": not args.no_fsync, "data": counts, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
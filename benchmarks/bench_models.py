@@ -0,0 +1,83 @@
+"""
+Micro-benchmark for model (de)serialization
+Compares the hand-written to_dict/from_dict fast paths with the previous
+dataclasses.asdict() / cls(**data) approach, per record.
+
+Usage: python -m benchmarks.bench_models [--number N] [--json PATH]
+"""
+import argparse
+import dataclasses
+import json
+import sys
+import timeit
+from datetime import datetime
+
+from src.models import Task, DiaryEntry, Person, FocusSession
+
+
+def sample_records():
+    """Build one representative record per model"""
+    now = datetime.now().isoformat()
+    return {
+        "Task": Task(
+            id="20240101120000000000", title="Write report", description="Quarterly numbers",
+            category="future_date", due_date="2024-01-05", tags=["work", "writing"],
+            subtasks=["outline", "draft", "review"]
+        ),
+        "DiaryEntry": DiaryEntry(
+            date="2024-01-01", content="Today was a good day. " * 20,
+            ai_summary="A calm and productive day.", completed_tasks=["Write report"],
+            highlights=["Walk in the park"]
+        ),
+        "Person": Person(
+            id="person1", name="Alex", personal_info="Met at work", birthday="1990-04-01",
+            events=["Lunch on Friday"], custom_fields={"team": "design"}
+        ),
+        "FocusSession": FocusSession(
+            id="20240101120000000000", start_time=now, duration_minutes=25,
+            actual_duration_seconds=1500, completed=True, points_earned=25, end_time=now
+        ),
+    }
+
+
+def per_record_us(stmt, number):
+    """Time a callable and return microseconds per call"""
+    return timeit.timeit(stmt, number=number) / number * 1e6
+
+
+def run(number):
+    """Run the benchmark and return results keyed by model"""
+    results = {}
+    for name, record in sample_records().items():
+        cls = type(record)
+        data = record.to_dict()
+        results[name] = {
+            "to_dict_asdict_us": per_record_us(lambda: dataclasses.asdict(record), number),
+            "to_dict_fast_us": per_record_us(record.to_dict, number),
+            "from_dict_kwargs_us": per_record_us(lambda: cls(**data), number),
+            "from_dict_fast_us": per_record_us(lambda: cls.from_dict(data), number),
+            "has_instance_dict": hasattr(record, "__dict__"),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="iterations per measurement")
+    parser.add_argument("--json", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    results = run(args.number)
+
+    print(f"{'model':<14}{'asdict':>10}{'to_dict':>10}{'cls(**)':>10}{'from_dict':>11}  (us/record)")
+    for name, r in results.items():
+        print(f"{name:<14}{r['to_dict_asdict_us']:>10.2f}{r['to_dict_fast_us']:>10.2f}"
+              f"{r['from_dict_kwargs_us']:>10.2f}{r['from_dict_fast_us']:>11.2f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"benchmark": "models", "number": args.number, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+Offscreen benchmark of widget refresh paths
+Builds the MainWindow over a seeded synthetic profile (see
+benchmarks/synthetic.py) without a display, then measures wall time,
+widget counts and peak Python memory of each refresh path and compares
+them with a stored baseline. Timings are machine specific: refresh the
+baseline with --update-baseline on the machine that runs the comparison.
+
+Usage: python -m benchmarks.bench_ui [--profile small|medium|large] [--tasks N]
+           [--repeat N] [--baseline PATH] [--update-baseline] [--tolerance F] [--json PATH]
+"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import QCoreApplication, QEvent
+
+from benchmarks.synthetic import PROFILES, generate_profile
+from benchmarks.bench_data_manager import git_commit
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# Differences below this are timer noise, whatever the ratio
+MIN_REGRESSION_MS = 1.0
+
+
+def max_rss_mib():
+    """Peak resident set size of this process, or None where unavailable"""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def flush_events(app):
+    """Run pending layout/paint work and deleteLater() destructions"""
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+def refresh_paths(window):
+    """Map each benchmarked path to (widget it refreshes, prepare(run), refresh())"""
+    data_manager = window.data_manager
+    calendar_widget = window.lazy_tabs[2].ensure_built()
+    focus_widget = window.lazy_tabs[3].ensure_built()
+    smart_input = window.anxiety_killer_widget.message_input
+    stickers = data_manager.get_setting("user_stickers", {})
+    queries = ["a", "re", "rep", "clean k", "list 1", "zz"]
+
+    def earn_sticker(run):
+        # Change one count per run, as earning a sticker would
+        updated = dict(stickers)
+        name = sorted(updated)[run % len(updated)]
+        updated[name] += 1 + run
+        data_manager.save_setting("user_stickers", updated)
+
+    return {
+        "TodoWidget.load_tasks": (window.todo_widget, None, window.todo_widget.load_tasks),
+        "MainWindow.load_sidebar_todolists": (
+            window.sidebar_todolists_container, None, window.load_sidebar_todolists
+        ),
+        "CalendarWidget.load_tasks": (calendar_widget, None, calendar_widget.load_tasks),
+        "FocusWidget.update_sticker_display": (focus_widget, earn_sticker, focus_widget.update_sticker_display),
+        "SmartInputWidget.get_completion_items": (
+            smart_input, None, lambda: [smart_input.get_completion_items(q) for q in queries]
+        ),
+    }
+
+
+def measure(app, target, prepare, refresh, repeat):
+    """Time refresh() repeat times, then record widget counts and peak memory of one more run"""
+    samples = []
+    for run in range(repeat):
+        if prepare:
+            prepare(run)
+        flush_events(app)
+        gc.collect()
+        start = time.perf_counter()
+        refresh()
+        flush_events(app)
+        samples.append(time.perf_counter() - start)
+
+    # tracemalloc slows allocation down, so memory is measured in a separate run
+    if prepare:
+        prepare(repeat)
+    flush_events(app)
+    gc.collect()
+    tracemalloc.start()
+    refresh()
+    flush_events(app)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ms = [s * 1000 for s in samples]
+    return {
+        "runs": repeat,
+        "median_ms": statistics.median(ms),
+        "min_ms": min(ms),
+        "widgets": len(target.findChildren(QWidget)),
+        "peak_kib": peak / 1024,
+    }
+
+
+def find_regressions(results, baseline, tolerance):
+    """List human-readable regressions of results against a baseline"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        # The fastest run is the least affected by scheduler and GC noise
+        if (result["min_ms"] > base["min_ms"] * (1 + tolerance)
+                and result["min_ms"] - base["min_ms"] > MIN_REGRESSION_MS):
+            regressions.append(f"{name}: {result['min_ms']:.1f} ms (baseline {base['min_ms']:.1f} ms)")
+        if result["widgets"] > base["widgets"]:
+            regressions.append(f"{name}: {result['widgets']} widgets (baseline {base['widgets']})")
+        if result["peak_kib"] > base["peak_kib"] * (1 + tolerance) + 64:
+            regressions.append(f"{name}: {result['peak_kib']:.0f} KiB peak (baseline {base['peak_kib']:.0f} KiB)")
+    return regressions
+
+
+def run(profile, tasks, seed, repeat):
+    """Build the window over a synthetic profile and measure every refresh path"""
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bba-ui-bench-") as tmp:
+        overrides = {"tasks": tasks} if tasks else {}
+        counts = generate_profile(Path(tmp) / "data", profile, seed, **overrides)
+
+        # MainWindow opens ./data, so run from the temporary directory
+        os.chdir(tmp)
+        try:
+            from src.ui.main_window import MainWindow
+
+            start = time.perf_counter()
+            window = MainWindow()
+            window.show()
+            flush_events(app)
+            startup_ms = (time.perf_counter() - start) * 1000
+
+            results = {
+                name: measure(app, target, prepare, refresh, repeat)
+                for name, (target, prepare, refresh) in refresh_paths(window).items()
+            }
+            window.close()
+            flush_events(app)
+        finally:
+            os.chdir(cwd)
+
+    return {
+        "benchmark": "ui",
+        "commit": git_commit(),
+        "data": counts,
+        "startup_ms": startup_ms,
+        "max_rss_mib": max_rss_mib(),
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="small", help="synthetic data size")
+    parser.add_argument("--tasks", type=int, help="override the profile's task count")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the generated data")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per refresh path")
+    parser.add_argument("--baseline", help="baseline JSON (default: benchmarks/baselines/ui_<profile>.json)")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown/growth ratio")
+    parser.add_argument("--json", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    report = run(args.profile, args.tasks, args.seed, args.repeat)
+    baseline_path = Path(args.baseline or BASELINE_DIR / f"ui_{args.profile}.json")
+
+    max_rss = f"{report['max_rss_mib']:.0f} MiB" if report["max_rss_mib"] is not None else "n/a"
+    print(f"startup {report['startup_ms']:.1f} ms, max RSS {max_rss}")
+    print(f"{'refresh path':<40}{'median ms':>11}{'min ms':>10}{'widgets':>9}{'peak KiB':>10}")
+    for name, r in report["results"].items():
+        print(f"{name:<40}{r['median_ms']:>11.2f}{r['min_ms']:>10.2f}{r['widgets']:>9}{r['peak_kib']:>10.0f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        baseline_path.parent.mkdir(exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline written to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"\nNo baseline at {baseline_path}; run with --update-baseline to create one")
+        return 0
+
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = find_regressions(report["results"], baseline["results"], args.tolerance)
+    if regressions:
+        print(f"\nREGRESSIONS against {baseline_path} (commit {baseline.get('commit')}):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"\nNo regressions against {baseline_path} (commit {baseline.get('commit')})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Deterministic offline stand-in for an rt.llm provider
+FakeLLM answers from a script instead of the network: each call sleeps
+for a configurable latency plus output tokens / token rate, and can reply
+with scripted tool calls before the final text. Every call is recorded so
+benchmarks can subtract the simulated model time from what they measured.
+"""
+import asyncio
+import time
+
+from railtracks.llm import AssistantMessage, ModelBase, ModelProvider, Response, ToolCall, UserMessage
+from railtracks.llm.response import MessageInfo
+
+from src.agents.anxiety_killer import AnxietyKillerAgent
+from src.agents.ask_me import AskMeAgent
+
+
+class FakeLLM(ModelBase):
+    """Scripted model with simulated latency and token rate
+
+    Args:
+        latency: Seconds before the first token (time to first byte).
+        tokens_per_second: Output rate; 0 means output takes no time.
+        reply_tokens: Length of the final text reply in tokens (words).
+        tool_script: One entry per tool-calling turn before the final reply,
+            each a list of {"name": ..., "arguments": {...}} calls. The turn
+            is chosen by counting assistant turns since the last user message,
+            so concurrent conversations each follow the script independently.
+    """
+
+    def __init__(self, latency=0.0, tokens_per_second=0.0, reply_tokens=40, tool_script=None):
+        super().__init__()
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.reply_tokens = reply_tokens
+        self.tool_script = tool_script or []
+        self.calls = []  # one dict per model call
+
+    def model_name(self) -> str:
+        return "fake"
+
+    def model_provider(self) -> ModelProvider:
+        return ModelProvider.UNKNOWN
+
+    @classmethod
+    def model_gateway(cls) -> ModelProvider:
+        return ModelProvider.UNKNOWN
+
+    @property
+    def simulated_seconds(self) -> float:
+        """Total time spent 'in the model' across all recorded calls"""
+        return sum(call["simulated_s"] for call in self.calls)
+
+    def reset(self):
+        """Forget the recorded calls"""
+        self.calls = []
+
+    def _plan(self, messages, tools):
+        """Pick this turn's tool calls (or None for the final reply) and its simulated duration"""
+        turn = 0
+        for message in reversed(list(messages)):
+            if isinstance(message, UserMessage):
+                break
+            if isinstance(message, AssistantMessage):
+                turn += 1
+
+        tool_calls = None
+        if tools and turn < len(self.tool_script):
+            tool_calls = [
+                ToolCall(identifier=f"call_{turn}_{i}", name=call["name"], arguments=call["arguments"])
+                for i, call in enumerate(self.tool_script[turn])
+            ]
+        output_tokens = 10 * len(tool_calls) if tool_calls else self.reply_tokens
+        duration = self.latency
+        if self.tokens_per_second:
+            duration += output_tokens / self.tokens_per_second
+        return tool_calls, output_tokens, duration
+
+    def _respond(self, messages, tool_calls, output_tokens, start, duration):
+        content = tool_calls if tool_calls else " ".join(["ok"] * self.reply_tokens)
+        input_tokens = sum(len(str(message.content)) for message in messages) // 4
+        self.calls.append({
+            "start": start,
+            "simulated_s": duration,
+            "messages": len(messages),
+            "tool_calls": len(tool_calls or []),
+            "input_tokens": input_tokens,
+        })
+        return Response(
+            AssistantMessage(content),
+            MessageInfo(input_tokens=input_tokens, output_tokens=output_tokens,
+                        latency=duration, model_name=self.model_name(), total_cost=0.0),
+        )
+
+    def _chat_with_tools(self, messages, tools):
+        tool_calls, output_tokens, duration = self._plan(messages, tools)
+        start = time.perf_counter()
+        time.sleep(duration)
+        return self._respond(messages, tool_calls, output_tokens, start, duration)
+
+    async def _achat_with_tools(self, messages, tools):
+        tool_calls, output_tokens, duration = self._plan(messages, tools)
+        start = time.perf_counter()
+        await asyncio.sleep(duration)
+        return self._respond(messages, tool_calls, output_tokens, start, duration)
+
+    def _chat(self, messages):
+        return self._chat_with_tools(messages, None)
+
+    async def _achat(self, messages):
+        return await self._achat_with_tools(messages, None)
+
+    def _structured(self, messages, schema):
+        raise NotImplementedError("FakeLLM does not support structured output")
+
+    async def _astructured(self, messages, schema):
+        raise NotImplementedError("FakeLLM does not support structured output")
+
+
+class FakeAnxietyKillerAgent(AnxietyKillerAgent):
+    """AnxietyKillerAgent wired to a FakeLLM instead of a provider SDK"""
+
+    def __init__(self, fake_llm, data_manager=None, user_preferences=""):
+        self.fake_llm = fake_llm
+        super().__init__(llm_provider="fake", user_preferences=user_preferences, data_manager=data_manager)
+
+    def _create_llm(self):
+        return self.fake_llm
+
+
+class FakeAskMeAgent(AskMeAgent):
+    """AskMeAgent wired to a FakeLLM instead of a provider SDK"""
+
+    def __init__(self, fake_llm, custom_instructions=""):
+        self.fake_llm = fake_llm
+        super().__init__(llm_provider="fake", custom_instructions=custom_instructions)
+
+    def _create_llm(self):
+        return self.fake_llm
@@ -0,0 +1,85 @@
+"""
+Startup import-time report
+Imports what main.py imports before the first window is shown, in a fresh
+interpreter with -X importtime, and reports the slowest modules and
+whether the LLM stack (railtracks, provider SDKs) was loaded.
+
+Usage: python -m benchmarks.import_time [--top N] [--statement CODE] [--json PATH]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+STARTUP_STATEMENT = "from src.ui import MainWindow"
+
+# Packages that should only load once an agent is initialized with an API key
+DEFERRED_PACKAGES = ("railtracks", "litellm", "openai", "anthropic", "google.genai")
+
+
+def parse_importtime(stderr):
+    """Parse -X importtime output into {module: (self_us, cumulative_us)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def run(statement):
+    """Import statement in a fresh interpreter and return the report"""
+    env = dict(os.environ, LITELLM_LOCAL_MODEL_COST_MAP="True")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, env=env
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Import failed:\n{proc.stderr[-2000:]}")
+
+    modules = parse_importtime(proc.stderr)
+    return {
+        "statement": statement,
+        "total_ms": sum(self_us for self_us, _ in modules.values()) / 1000,
+        "module_count": len(modules),
+        "deferred_loaded": [
+            name for name in DEFERRED_PACKAGES if name in modules
+        ],
+        "modules": {
+            name: {"self_ms": self_us / 1000, "cumulative_ms": cumulative_us / 1000}
+            for name, (self_us, cumulative_us) in modules.items()
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=15, help="number of slowest modules to list")
+    parser.add_argument("--statement", default=STARTUP_STATEMENT, help="import statement to measure")
+    parser.add_argument("--json", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    report = run(args.statement)
+
+    print(f"{report['statement']}: {report['total_ms']:.1f} ms across {report['module_count']} modules")
+    print(f"{'module':<50}{'self ms':>10}{'cumul. ms':>12}")
+    slowest = sorted(report["modules"].items(), key=lambda item: item[1]["cumulative_ms"], reverse=True)
+    for name, times in slowest[:args.top]:
+        print(f"{name:<50}{times['self_ms']:>10.1f}{times['cumulative_ms']:>12.1f}")
+
+    if report["deferred_loaded"]:
+        print(f"\nWARNING: loaded at startup: {', '.join(report['deferred_loaded'])}")
+    else:
+        print(f"\nNot loaded at startup: {', '.join(DEFERRED_PACKAGES)}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"benchmark": "import_time", "results": report}, f, indent=2)
+
+    return 1 if report["deferred_loaded"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Seeded synthetic user profiles for benchmarks
+Writes TinyDB JSON files directly (one write per store) so even the
+100k-task profile is generated in seconds, then DataManager reads them
+as if a long-time user had built them up.
+"""
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROFILES = {
+    "small": {"tasks": 1_000, "todolists": 20, "people": 50,
+              "focus_days": 90, "chat_messages": 2_000},
+    "medium": {"tasks": 10_000, "todolists": 100, "people": 200,
+               "focus_days": 365, "chat_messages": 20_000},
+    "large": {"tasks": 100_000, "todolists": 500, "people": 500,
+              "focus_days": 3 * 365, "chat_messages": 100_000},
+}
+
+CATEGORIES = ["today_must", "future_date", "long_term", "someday_maybe"]
+AGENTS = ["anxiety_killer", "ask_me"]
+
+_VERBS = ["Write", "Call", "Clean", "Plan", "Review", "Buy", "Fix", "Read", "Email", "Organize",
+          "Prepare", "Book", "Pay", "Update", "Practice", "Finish", "Sort", "Walk", "Cook", "Study"]
+_OBJECTS = ["report", "dentist", "kitchen", "trip", "budget", "groceries", "bike", "chapter", "landlord",
+            "desk", "presentation", "flights", "rent", "resume", "guitar", "essay", "laundry", "dog",
+            "dinner", "exam", "garden", "taxes", "inbox", "photos", "car"]
+_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn",
+          "Robin", "Drew", "Kai", "Noa", "Lee", "Max", "Rene", "Sky", "Ari", "Jules"]
+_WORDS = ("today I felt a bit overwhelmed but managed to get some things done and the walk "
+          "helped me calm down before the meeting so tomorrow I want to start earlier").split()
+
+
+def _table(records):
+    """TinyDB table layout: {doc_id: document}"""
+    return {str(doc_id): record for doc_id, record in enumerate(records, start=1)}
+
+
+def _write_store(path, tables):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(tables, f)
+
+
+def _sentence(rng, words):
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def make_tasks(rng, count, today):
+    """Tasks spread over all categories, about a third of them completed"""
+    tasks = []
+    for i in range(count):
+        category = rng.choice(CATEGORIES)
+        created = today - timedelta(days=rng.randint(0, 3 * 365))
+        due = (today + timedelta(days=rng.randint(-30, 90))).strftime("%Y-%m-%d") \
+            if category in ("today_must", "future_date") else None
+        completed = rng.random() < 0.3
+        tasks.append({
+            "id": f"task{i:07d}",
+            "title": f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)} {i}",
+            "description": _sentence(rng, rng.randint(0, 12)),
+            "category": category,
+            "completed": completed,
+            "created_at": created.isoformat(),
+            "due_date": due,
+            "start_date": None,
+            "completed_at": (created + timedelta(days=1)).isoformat() if completed else None,
+            "tags": rng.sample(_OBJECTS, rng.randint(0, 2)),
+            "subtasks": [],
+            "order": i,
+        })
+    return tasks
+
+
+def make_todolists(rng, count, task_ids, today):
+    """Todo lists, the two default ones first, each holding up to 30 tasks"""
+    todolists = [
+        {"id": "default_daily", "name": "📅 Today's Tasks", "description": "", "tasks": [],
+         "created_at": today.isoformat(), "is_default": "daily", "auto_managed": True},
+        {"id": "default_longterm", "name": "🎯 Daily Habits", "description": "", "tasks": [],
+         "created_at": today.isoformat(), "is_default": "longterm", "auto_managed": True},
+    ]
+    for i in range(count):
+        todolists.append({
+            "id": f"list{i:05d}",
+            "name": f"{rng.choice(_OBJECTS).capitalize()} list {i}",
+            "description": "",
+            "tasks": rng.sample(task_ids, min(len(task_ids), rng.randint(0, 30))),
+            "created_at": today.isoformat(),
+            "show_in_sidebar": i < 5,
+        })
+    return todolists
+
+
+def make_people(rng, count):
+    return [{
+        "id": f"person{i:05d}",
+        "name": f"{rng.choice(_NAMES)} {chr(65 + i % 26)}. {i}",
+        "personal_info": _sentence(rng, 10),
+        "birthday": f"{rng.randint(1960, 2005)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "birthday_reminder": rng.random() < 0.5,
+        "preferences": _sentence(rng, 5),
+        "events": [_sentence(rng, 6) for _ in range(rng.randint(0, 3))],
+        "custom_fields": {},
+    } for i in range(count)]
+
+
+def make_focus_sessions(rng, days, today):
+    """Zero to six sessions per day, most of them completed"""
+    sessions = []
+    for day_offset in range(days, 0, -1):
+        day = today - timedelta(days=day_offset)
+        start = day.replace(hour=8)
+        for _ in range(rng.randint(0, 6)):
+            start += timedelta(minutes=rng.randint(30, 120))
+            planned = rng.choice([15, 25, 25, 45])
+            completed = rng.random() < 0.8
+            seconds = planned * 60 if completed else rng.randint(60, planned * 60)
+            sessions.append({
+                "id": start.strftime("%Y%m%d%H%M%S%f"),
+                "start_time": start.isoformat(),
+                "duration_minutes": planned,
+                "actual_duration_seconds": seconds,
+                "completed": completed,
+                "points_earned": seconds // 60 if completed else 0,
+                "end_time": (start + timedelta(seconds=seconds)).isoformat(),
+                "task_name": None,
+            })
+    return sessions
+
+
+def make_chat_messages(rng, count, today):
+    """Alternating user/assistant messages over both agents, oldest first"""
+    messages = []
+    start = today - timedelta(minutes=count * 10)
+    for i in range(count):
+        agent = AGENTS[(i // 40) % len(AGENTS)]
+        messages.append({
+            "agent": agent,
+            "conversation_id": "main" if agent == "anxiety_killer" else f"conv{(i // 200) % 20}",
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": _sentence(rng, rng.randint(5, 60)),
+            "timestamp": (start + timedelta(minutes=i * 10)).isoformat(),
+        })
+    return messages
+
+
+def make_diary_entries(rng, days, today):
+    return [{
+        "date": (today - timedelta(days=day_offset)).strftime("%Y-%m-%d"),
+        "content": " ".join(_sentence(rng, 15) for _ in range(rng.randint(1, 8))),
+        "ai_summary": "",
+        "mood": None,
+        "completed_tasks": [],
+        "highlights": [],
+        "created_at": today.isoformat(),
+        "updated_at": today.isoformat(),
+    } for day_offset in range(days, 0, -1) if rng.random() < 0.6]
+
+
+def generate_profile(data_dir, profile="small", seed=0, **overrides):
+    """Write a synthetic data directory and return the record counts
+
+    overrides replace single PROFILES sizes, e.g. tasks=50_000.
+    """
+    sizes = dict(PROFILES[profile], **overrides)
+    rng = random.Random(seed)
+    today = datetime(2024, 6, 1, 12, 0, 0)
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks = make_tasks(rng, sizes["tasks"], today)
+    todolists = make_todolists(rng, sizes["todolists"], [t["id"] for t in tasks], today)
+    people = make_people(rng, sizes["people"])
+    sessions = make_focus_sessions(rng, sizes["focus_days"], today)
+    messages = make_chat_messages(rng, sizes["chat_messages"], today)
+    entries = make_diary_entries(rng, sizes["focus_days"], today)
+    settings = [
+        {"key": "todolists", "value": todolists},
+        {"key": "user_points", "value": sum(s["points_earned"] for s in sessions)},
+        {"key": "user_stickers", "value": {f"sticker_{i:03d}": rng.randint(1, 9) for i in range(40)}},
+    ]
+
+    _write_store(data_dir / "tasks.json", {"_default": _table(tasks)})
+    _write_store(data_dir / "social.json", {"_default": _table(people)})
+    _write_store(data_dir / "focus.json", {"_default": _table(sessions)})
+    _write_store(data_dir / "chat_history.json", {"_default": _table(messages)})
+    _write_store(data_dir / "diary.json", {"_default": _table(entries)})
+    _write_store(data_dir / "settings.json", {"_default": _table(settings)})
+
+    return {
+        "profile": profile,
+        "seed": seed,
+        "tasks": len(tasks),
+        "todolists": len(todolists),
+        "people": len(people),
+        "focus_sessions": len(sessions),
+        "chat_messages": len(messages),
+        "diary_entries": len(entries),
+    }
@@ -2,31 +2,94 @@
 ByeByeAnxiety - ADHD Life Assistant
 Main entry point for the application
 """
+import time
+LAUNCH_TIME = time.perf_counter()
+
+import argparse
 import sys
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QEvent, QTimer
+
+from src.utils.startup_profiler import startup_profiler
+from src.utils.data_metrics import data_metrics
+
+
+class FirstPaintWatcher(QObject):
+    """Marks the window's first paint, then 'interactive' once the event loop is idle"""
+    
+    def __init__(self, window, on_interactive):
+        super().__init__(window)
+        self.on_interactive = on_interactive
+        window.installEventFilter(self)
+    
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            startup_profiler.mark("first_paint")
+            # Runs after the pending startup work queued on the event loop
+            QTimer.singleShot(0, self.mark_interactive)
+        return False
+    
+    def mark_interactive(self):
+        startup_profiler.mark("interactive")
+        self.on_interactive()
+
 
-from src.ui import MainWindow
+def report_startup(trace_path):
+    """Write the startup trace and print the summary table"""
+    startup_profiler.write_trace(trace_path)
+    print(startup_profiler.summary())
+    print(f"\nFirst paint: {startup_profiler.mark_time('first_paint') * 1000:.1f} ms, "
+          f"interactive: {startup_profiler.mark_time('interactive') * 1000:.1f} ms")
+    print(f"Chrome trace written to {trace_path} (open in chrome://tracing or ui.perfetto.dev)", flush=True)
 
 
 def main():
     """Main application entry point"""
+    parser = argparse.ArgumentParser(description="ByeByeAnxiety - ADHD Life Assistant")
+    parser.add_argument(
+        "--profile-startup", nargs="?", const="startup_trace.json", metavar="TRACE_PATH",
+        help="record startup spans, write a Chrome trace JSON (default: startup_trace.json) and print a summary"
+    )
+    parser.add_argument(
+        "--data-metrics", nargs="?", const="data_metrics.json", metavar="JSON_PATH",
+        help="record data store metrics from launch and write them as JSON on exit (default: data_metrics.json)"
+    )
+    args, qt_args = parser.parse_known_args()
+    
+    if args.profile_startup:
+        startup_profiler.enable(origin=LAUNCH_TIME)
+    if args.data_metrics:
+        # DataManager instances created from now on record into data_metrics
+        data_metrics.enabled = True
+    
+    with startup_profiler.span("import src.ui"):
+        from src.ui import MainWindow
+    
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
     
     # Create application
-    app = QApplication(sys.argv)
-    app.setApplicationName("ByeByeAnxiety")
-    app.setOrganizationName("ByeByeAnxiety")
-    
-    # Set application style
-    app.setStyle("Fusion")
+    with startup_profiler.span("QApplication"):
+        app = QApplication(sys.argv[:1] + qt_args)
+        app.setApplicationName("ByeByeAnxiety")
+        app.setOrganizationName("ByeByeAnxiety")
+        
+        # Set application style
+        app.setStyle("Fusion")
     
     # Create and show main window
-    window = MainWindow()
-    window.show()
+    with startup_profiler.span("MainWindow"):
+        window = MainWindow()
+    with startup_profiler.span("show"):
+        window.show()
+    
+    if args.profile_startup:
+        FirstPaintWatcher(window, lambda: report_startup(args.profile_startup))
+    if args.data_metrics:
+        app.aboutToQuit.connect(lambda: data_metrics.dump(args.data_metrics))
     
     # Run application
     sys.exit(app.exec())
@@ -34,4 +97,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
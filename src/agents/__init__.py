@@ -1,7 +1,24 @@
 """AI Agents for ByeByeAnxiety"""
 
-from .anxiety_killer import AnxietyKillerAgent
-from .ask_me import AskMeAgent
+import importlib
+
+# Agents pull in railtracks and the LLM provider SDKs, which take seconds to
+# import, so each agent module is loaded on first attribute access
+_LAZY_ATTRIBUTES = {
+    'AnxietyKillerAgent': '.anxiety_killer',
+    'AskMeAgent': '.ask_me',
+}
 
 __all__ = ['AnxietyKillerAgent', 'AskMeAgent']
 
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -2,10 +2,13 @@
 Anxiety Killer Agent - Main emotional support and task management AI assistant
 """
 import railtracks as rt
+from railtracks.middleware import Middleware
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
 
+from src.utils.agent_telemetry import agent_telemetry, observe_model_turn
+
 
 class AnxietyKillerAgent:
     """AI agent that provides emotional support and helps manage tasks and anxiety"""
@@ -453,18 +456,15 @@ Remember: The user is doing their best, and every step forward deserves recognit
         if self.user_preferences:
             base_system_message += f"\n\nUser Preferences:\n{self.user_preferences}"
         
-        # Select LLM based on provider
-        if self.llm_provider == "gemini":
-            llm = rt.llm.GeminiLLM("gemini-2.5-flash", api_key=self.api_key)
-        else:  # anthropic/claude
-            llm = rt.llm.AnthropicLLM("claude-3-5-sonnet-20241022", api_key=self.api_key)
+        llm = self._create_llm()
         
         # Create the agent
         self.agent = rt.agent_node(
             name="Anxiety Killer",
             llm=llm,
             system_message=base_system_message,
-            tool_nodes=tools
+            tool_nodes=tools,
+            model_middleware=[Middleware(observe_model_turn)]
         )
     
     def create_task_tool(self, title: str, description: str, category: str = "today_must", 
@@ -569,17 +569,28 @@ Remember: The user is doing their best, and every step forward deserves recognit
         else:
             return f"Added information about {person_name} to social book (data manager not available)"
     
-    async def chat(self, message: str, context: Optional[Dict[str, Any]] = None) -> str:
+    async def chat(self, message: str, context: Optional[Dict[str, Any]] = None,
+                   feature: str = "chat") -> str:
         """
         Send a message to the agent and get a response.
         
         Args:
             message: User's message
             context: Optional context (diary entries, tasks, etc.)
+            feature: App feature the call is recorded under in agent telemetry
         
         Returns:
             Agent's response
         """
+        full_message = self.build_message(message, context)
+        
+        # Call the agent
+        async with agent_telemetry.track("anxiety_killer", feature):
+            response = await rt.call(self.agent, full_message)
+        return response.text
+    
+    def build_message(self, message: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """Append the context (tasks, diary, mentioned items) to the user's message"""
         # Add context to message if provided
         full_message = message
         if context:
@@ -630,9 +641,7 @@ Remember: The user is doing their best, and every step forward deserves recognit
             
             full_message = message + context_str
         
-        # Call the agent
-        response = await rt.call(self.agent, full_message)
-        return response.text
+        return full_message
     
     async def generate_daily_summary(self, diary_content: str, context: str) -> str:
         """
@@ -659,7 +668,8 @@ Create a summary that:
 
 Keep it concise but heartfelt (under 150 words)."""
 
-        response = await rt.call(self.agent, summary_prompt)
+        async with agent_telemetry.track("anxiety_killer", "summary"):
+            response = await rt.call(self.agent, summary_prompt)
         return response.text
     
     async def suggest_task_breakdown(self, task_title: str, task_description: str) -> List[str]:
@@ -685,7 +695,8 @@ Provide 3-5 concrete, actionable subtasks. Each subtask should:
 
 Format your response as a simple numbered list."""
 
-        response = await rt.call(self.agent, breakdown_prompt)
+        async with agent_telemetry.track("anxiety_killer", "breakdown"):
+            response = await rt.call(self.agent, breakdown_prompt)
         # Parse the response into a list
         lines = response.text.strip().split('\n')
         subtasks = [line.strip('0123456789. ') for line in lines if line.strip() and line[0].isdigit()]
@@ -696,6 +707,13 @@ Format your response as a simple numbered list."""
         self.user_preferences = new_preferences
         self._initialize_agent()
     
+    def _create_llm(self):
+        """Create the LLM for the configured provider"""
+        if self.llm_provider == "gemini":
+            return rt.llm.GeminiLLM("gemini-2.5-flash", api_key=self.api_key)
+        # anthropic/claude
+        return rt.llm.AnthropicLLM("claude-3-5-sonnet-20241022", api_key=self.api_key)
+    
     def update_api_key(self, api_key: str, provider: str):
         """Update API key and provider"""
         self.api_key = api_key
@@ -2,9 +2,12 @@
 Ask Me Agent - Specialized learning assistant for ADHD-friendly knowledge exploration
 """
 import railtracks as rt
+from railtracks.middleware import Middleware
 from typing import Optional
 from datetime import datetime
 
+from src.utils.agent_telemetry import agent_telemetry, observe_model_turn
+
 
 class AskMeAgent:
     """AI agent specialized in breaking down complex topics for ADHD learners"""
@@ -55,17 +58,14 @@ Remember:
         if self.custom_instructions:
             base_system_message += f"\n\nCustom Instructions:\n{self.custom_instructions}"
         
-        # Select LLM based on provider
-        if self.llm_provider == "gemini":
-            llm = rt.llm.GeminiLLM("gemini-2.5-flash", api_key=self.api_key)
-        else:  # anthropic/claude
-            llm = rt.llm.AnthropicLLM("claude-3-5-sonnet-20241022", api_key=self.api_key)
+        llm = self._create_llm()
         
         # Create the agent (no tools needed for Ask Me)
         self.agent = rt.agent_node(
             name="Ask Me",
             llm=llm,
-            system_message=base_system_message
+            system_message=base_system_message,
+            model_middleware=[Middleware(observe_model_turn)]
         )
     
     async def ask(self, question: str, conversation_history: Optional[list] = None) -> str:
@@ -89,9 +89,11 @@ Remember:
                     messages.append(rt.llm.AssistantMessage(msg['content']))
             # Add current question
             messages.append(rt.llm.UserMessage(question))
-            response = await rt.call(self.agent, messages)
         else:
-            response = await rt.call(self.agent, question)
+            messages = question
+        
+        async with agent_telemetry.track("ask_me", "ask"):
+            response = await rt.call(self.agent, messages)
         
         return response.text
     
@@ -114,7 +116,8 @@ Remember to:
 4. Use examples
 5. Keep it engaging"""
 
-        response = await rt.call(self.agent, prompt)
+        async with agent_telemetry.track("ask_me", "explain"):
+            response = await rt.call(self.agent, prompt)
         return response.text
     
     async def break_down_concept(self, concept: str) -> str:
@@ -137,7 +140,8 @@ Structure your response as:
 
 Keep each section short and clear."""
 
-        response = await rt.call(self.agent, prompt)
+        async with agent_telemetry.track("ask_me", "concept"):
+            response = await rt.call(self.agent, prompt)
         return response.text
     
     def update_instructions(self, new_instructions: str):
@@ -145,6 +149,13 @@ Keep each section short and clear."""
         self.custom_instructions = new_instructions
         self._initialize_agent()
     
+    def _create_llm(self):
+        """Create the LLM for the configured provider"""
+        if self.llm_provider == "gemini":
+            return rt.llm.GeminiLLM("gemini-2.5-flash", api_key=self.api_key)
+        # anthropic/claude
+        return rt.llm.AnthropicLLM("claude-3-5-sonnet-20241022", api_key=self.api_key)
+    
     def update_api_key(self, api_key: str, provider: str):
         """Update API key and provider"""
         self.api_key = api_key
@@ -1,10 +1,10 @@
 """Diary data model"""
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import List, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class DiaryEntry:
     """Represents a diary entry for a specific date"""
     date: str  # YYYY-MM-DD format
@@ -18,12 +18,29 @@ class DiaryEntry:
     
     def to_dict(self) -> dict:
         """Convert entry to dictionary"""
-        return asdict(self)
+        # Hand-written instead of asdict() to avoid its recursive deep copy
+        return {
+            "date": self.date,
+            "content": self.content,
+            "ai_summary": self.ai_summary,
+            "mood": self.mood,
+            "completed_tasks": list(self.completed_tasks),
+            "highlights": list(self.highlights),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'DiaryEntry':
         """Create entry from dictionary"""
-        return cls(**data)
+        # Remove any unknown fields
+        if not _DIARY_FIELDS.issuperset(data):
+            data = {k: v for k, v in data.items() if k in _DIARY_FIELDS}
+        entry = cls(**data)
+        # Don't share list objects with the caller's dictionary
+        entry.completed_tasks = list(entry.completed_tasks)
+        entry.highlights = list(entry.highlights)
+        return entry
     
     def update_content(self, new_content: str):
         """Update diary content"""
@@ -47,3 +64,5 @@ class DiaryEntry:
             self.completed_tasks.append(task_title)
             self.updated_at = datetime.now().isoformat()
 
+
+_DIARY_FIELDS = frozenset(f.name for f in fields(DiaryEntry))
@@ -1,10 +1,10 @@
 """Focus session data model"""
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from typing import List, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class FocusSession:
     """Represents a focus/pomodoro session"""
     id: str
@@ -18,23 +18,34 @@ class FocusSession:
     
     def to_dict(self) -> dict:
         """Convert session to dictionary"""
-        return asdict(self)
+        # Hand-written instead of asdict() to avoid its recursive deep copy
+        return {
+            "id": self.id,
+            "start_time": self.start_time,
+            "duration_minutes": self.duration_minutes,
+            "actual_duration_seconds": self.actual_duration_seconds,
+            "completed": self.completed,
+            "points_earned": self.points_earned,
+            "end_time": self.end_time,
+            "task_name": self.task_name,
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'FocusSession':
         """Create session from dictionary"""
-        # Handle legacy data format
+        # Fast path: current format without extra fields
+        if _SESSION_FIELDS.issuperset(data):
+            return cls(**data)
+        
+        # Handle legacy data format (without mutating the caller's dictionary)
+        data = dict(data)
         if 'planned_duration' in data:
             data['duration_minutes'] = data.pop('planned_duration')
         if 'actual_duration' in data and 'actual_duration_seconds' not in data:
             data['actual_duration_seconds'] = data.pop('actual_duration')
         
         # Remove any unknown fields
-        valid_fields = {
-            'id', 'start_time', 'duration_minutes', 'actual_duration_seconds',
-            'completed', 'points_earned', 'end_time', 'task_name'
-        }
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+        filtered_data = {k: v for k, v in data.items() if k in _SESSION_FIELDS}
         
         return cls(**filtered_data)
     
@@ -48,12 +59,16 @@ class FocusSession:
         self.points_earned = minutes
 
 
+_SESSION_FIELDS = frozenset(f.name for f in fields(FocusSession))
+
+
 @dataclass
 class FocusStats:
     """Statistics for focus sessions"""
     total_sessions: int = 0
     total_minutes: int = 0
     total_points: int = 0
+    completed_sessions: int = 0
     completion_rate: float = 0.0
     sessions_history: List[dict] = field(default_factory=list)
     
@@ -65,15 +80,4 @@ class FocusStats:
     def from_dict(cls, data: dict) -> 'FocusStats':
         """Create stats from dictionary"""
         return cls(**data)
-    
-    def add_session(self, session: FocusSession):
-        """Add a completed session to stats"""
-        self.total_sessions += 1
-        self.total_minutes += session.actual_duration_seconds // 60
-        self.total_points += session.points_earned
-        self.sessions_history.append(session.to_dict())
-        # Recalculate completion rate
-        if self.total_sessions > 0:
-            completed = sum(1 for s in self.sessions_history if s.get('completed', False))
-            self.completion_rate = completed / self.total_sessions
 
@@ -1,10 +1,10 @@
 """Social book data model"""
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """Represents a person in the social book"""
     id: str
@@ -21,12 +21,32 @@ class Person:
     
     def to_dict(self) -> dict:
         """Convert person to dictionary"""
-        return asdict(self)
+        # Hand-written instead of asdict() to avoid its recursive deep copy
+        return {
+            "id": self.id,
+            "name": self.name,
+            "personal_info": self.personal_info,
+            "birthday": self.birthday,
+            "birthday_reminder": self.birthday_reminder,
+            "preferences": self.preferences,
+            "events": list(self.events),
+            "notes": self.notes,
+            "custom_fields": dict(self.custom_fields),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Person':
         """Create person from dictionary"""
-        return cls(**data)
+        # Remove any unknown fields
+        if not _PERSON_FIELDS.issuperset(data):
+            data = {k: v for k, v in data.items() if k in _PERSON_FIELDS}
+        person = cls(**data)
+        # Don't share containers with the caller's dictionary
+        person.events = list(person.events)
+        person.custom_fields = dict(person.custom_fields)
+        return person
     
     def update_field(self, field_name: str, value: str):
         """Update a field"""
@@ -46,3 +66,5 @@ class Person:
         self.birthday_reminder = enabled
         self.updated_at = datetime.now().isoformat()
 
+
+_PERSON_FIELDS = frozenset(f.name for f in fields(Person))
@@ -1,11 +1,11 @@
 """Task data model"""
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import List, Optional
 from datetime import datetime
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a task/todo item"""
     id: str
@@ -23,12 +23,33 @@ class Task:
     
     def to_dict(self) -> dict:
         """Convert task to dictionary"""
-        return asdict(self)
+        # Hand-written instead of asdict() to avoid its recursive deep copy
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "category": self.category,
+            "completed": self.completed,
+            "created_at": self.created_at,
+            "due_date": self.due_date,
+            "start_date": self.start_date,
+            "completed_at": self.completed_at,
+            "tags": list(self.tags),
+            "subtasks": list(self.subtasks),
+            "order": self.order,
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Task':
         """Create task from dictionary"""
-        return cls(**data)
+        # Remove any unknown fields
+        if not _TASK_FIELDS.issuperset(data):
+            data = {k: v for k, v in data.items() if k in _TASK_FIELDS}
+        task = cls(**data)
+        # Don't share list objects with the caller's dictionary
+        task.tags = list(task.tags)
+        task.subtasks = list(task.subtasks)
+        return task
     
     def mark_complete(self):
         """Mark task as completed"""
@@ -51,6 +72,9 @@ class Task:
             self.subtasks.remove(subtask)
 
 
+_TASK_FIELDS = frozenset(f.name for f in fields(Task))
+
+
 class TaskCategory:
     """Task category constants"""
     TODAY_MUST = "today_must"
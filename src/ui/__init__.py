@@ -1,17 +1,23 @@
 """UI components for ByeByeAnxiety"""
 
-from .main_window import MainWindow
-from .anxiety_killer_widget import AnxietyKillerWidget
-from .ask_me_widget import AskMeWidget
-from .todo_widget import TodoWidget
-from .todolist_widget import TodoListWidget
-from .focus_widget import FocusWidget
-from .diary_widget import DiaryWidget
-from .social_widget import SocialWidget
-from .settings_dialog import SettingsDialog
-from .floating_window import FloatingWindow
-from .draggable_task_item import DraggableTaskItem
-from .droppable_todolist_item import DroppableTodoListItem
+import importlib
+
+# Widgets are imported on first attribute access, so importing one
+# component does not load every other widget module
+_LAZY_ATTRIBUTES = {
+    'MainWindow': '.main_window',
+    'AnxietyKillerWidget': '.anxiety_killer_widget',
+    'AskMeWidget': '.ask_me_widget',
+    'TodoWidget': '.todo_widget',
+    'TodoListWidget': '.todolist_widget',
+    'FocusWidget': '.focus_widget',
+    'DiaryWidget': '.diary_widget',
+    'SocialWidget': '.social_widget',
+    'SettingsDialog': '.settings_dialog',
+    'FloatingWindow': '.floating_window',
+    'DraggableTaskItem': '.draggable_task_item',
+    'DroppableTodoListItem': '.droppable_todolist_item',
+}
 
 __all__ = [
     'MainWindow', 'AnxietyKillerWidget', 'AskMeWidget', 'TodoWidget', 
@@ -19,3 +25,14 @@ __all__ = [
     'SettingsDialog', 'FloatingWindow', 'DraggableTaskItem', 'DroppableTodoListItem'
 ]
 
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -2,12 +2,11 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
                              QLineEdit, QPushButton, QComboBox, QScrollArea,
                              QLabel, QFrame)
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
 from PyQt6.QtGui import QTextCursor
 import asyncio
 from datetime import datetime
 
-from src.agents import AnxietyKillerAgent
 from src.ui.smart_input_widget import SmartInputWidget
 
 
@@ -49,9 +48,9 @@ class AnxietyKillerWidget(QWidget):
         self.agent = None
         self.current_worker = None
         self.chat_history = []
+        self.history_loaded = False
         
         self.setup_ui()
-        self.load_chat_history()
     
     def setup_ui(self):
         """Setup the UI"""
@@ -133,6 +132,9 @@ class AnxietyKillerWidget(QWidget):
     
     def initialize_agent(self, api_key: str, provider: str = "gemini", preferences: str = ""):
         """Initialize the AI agent"""
+        # Imported here so railtracks and the LLM SDKs load only once an agent is needed
+        from src.agents import AnxietyKillerAgent
+        
         try:
             self.agent = AnxietyKillerAgent(
                 llm_provider=provider,
@@ -140,12 +142,23 @@ class AnxietyKillerWidget(QWidget):
                 user_preferences=preferences,
                 data_manager=self.data_manager
             )
+            # Earlier messages go above the greeting
+            self.load_chat_history()
             self.add_system_message("Anxiety Killer is ready! I can help you create tasks, update your diary, and provide emotional support. How can I help you today? 😊")
         except Exception as e:
             self.add_system_message(f"Error initializing agent: {str(e)}")
     
+    def showEvent(self, event):
+        """Load chat history the first time the widget is shown, after it paints"""
+        super().showEvent(event)
+        if not self.history_loaded:
+            QTimer.singleShot(0, self.load_chat_history)
+    
     def load_chat_history(self):
-        """Load chat history from database"""
+        """Load chat history from database, once"""
+        if self.history_loaded:
+            return
+        self.history_loaded = True
         history = self.data_manager.get_chat_history("anxiety_killer", limit=50)
         for msg in history:
             if msg['role'] == 'user':
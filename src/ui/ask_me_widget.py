@@ -2,13 +2,11 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
                              QLineEdit, QPushButton, QListWidget, QSplitter,
                              QLabel, QListWidgetItem)
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
 from PyQt6.QtGui import QTextCursor
 import asyncio
 from datetime import datetime
 
-from src.agents import AskMeAgent
-
 
 class AskMeWorker(QThread):
     """Worker thread for async Ask Me operations"""
@@ -45,9 +43,9 @@ class AskMeWidget(QWidget):
         self.current_worker = None
         self.conversations = {}  # conversation_id -> messages
         self.current_conversation_id = None
+        self.conversations_loaded = False
         
         self.setup_ui()
-        self.load_conversations()
     
     def setup_ui(self):
         """Setup the UI"""
@@ -176,6 +174,9 @@ class AskMeWidget(QWidget):
     
     def initialize_agent(self, api_key: str, provider: str = "gemini", instructions: str = ""):
         """Initialize the AI agent"""
+        # Imported here so railtracks and the LLM SDKs load only once an agent is needed
+        from src.agents import AskMeAgent
+        
         try:
             self.agent = AskMeAgent(
                 llm_provider=provider,
@@ -186,6 +187,13 @@ class AskMeWidget(QWidget):
         except Exception as e:
             self.add_system_message(f"Error initializing agent: {str(e)}")
     
+    def showEvent(self, event):
+        """Load the conversation list the first time the widget is shown, after it paints"""
+        super().showEvent(event)
+        if not self.conversations_loaded:
+            self.conversations_loaded = True
+            QTimer.singleShot(0, self.load_conversations)
+    
     def load_conversations(self):
         """Load conversation list"""
         conv_ids = self.data_manager.get_all_conversations("ask_me")
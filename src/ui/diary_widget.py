@@ -1,27 +1,57 @@
 """Diary widget"""
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QTextEdit, QCalendarWidget, QLabel, QMessageBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QLocale
+from PyQt6.QtCore import Qt, pyqtSignal, QLocale, QDate, QThread, QTimer
 from PyQt6.QtGui import QTextCharFormat, QColor
 from datetime import datetime
 
 from src.models import DiaryEntry
 
 
+class DiarySaveWorker(QThread):
+    """Worker thread for persisting diary entries off the GUI thread"""
+    entry_saved = pyqtSignal(str, bool)  # date, has content
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, data_manager, entry):
+        super().__init__()
+        self.data_manager = data_manager
+        self.entry = entry
+    
+    def run(self):
+        """Save the entry snapshot"""
+        try:
+            self.data_manager.save_diary_entry(self.entry)
+            self.entry_saved.emit(self.entry.date, bool(self.entry.content))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
 class DiaryWidget(QWidget):
     """Diary management widget"""
     
     ai_summary_requested = pyqtSignal(str, str)  # date, content
     
+    AUTOSAVE_DELAY_MS = 1500  # Idle time after the last keystroke before saving
+    
     def __init__(self, data_manager, parent=None):
         super().__init__(parent)
         self.data_manager = data_manager
         self.current_date = datetime.now().strftime("%Y-%m-%d")
         self.current_entry = None
         
+        # Autosave state
+        self.is_dirty = False
+        self.save_worker = None
+        self.pending_saves = {}  # date -> entry snapshot waiting for the worker
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(self.AUTOSAVE_DELAY_MS)
+        self.autosave_timer.timeout.connect(self.flush_entry)
+        
+        self.entry_loaded = False
+        
         self.setup_ui()
-        self.load_entry(self.current_date)
-        self.highlight_dates_with_entries()
     
     def setup_ui(self):
         """Setup the UI"""
@@ -37,6 +67,7 @@ class DiaryWidget(QWidget):
         # Set locale to English to force weekday names in English
         self.calendar.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
         self.calendar.clicked.connect(self.date_selected)
+        self.calendar.currentPageChanged.connect(self.highlight_dates_with_entries)
         self.calendar.setStyleSheet("""
             QCalendarWidget {
                 background-color: white;
@@ -132,6 +163,8 @@ class DiaryWidget(QWidget):
     def date_selected(self, date):
         """Handle date selection"""
         date_str = date.toString("yyyy-MM-dd")
+        # Persist unsaved edits of the previous date before switching
+        self.flush_entry()
         self.load_entry(date_str)
     
     def load_entry(self, date_str: str):
@@ -139,9 +172,18 @@ class DiaryWidget(QWidget):
         self.current_date = date_str
         self.date_label.setText(f"📅 {date_str}")
         
-        # Load entry from database
-        entry = self.data_manager.get_diary_entry(date_str)
+        # Unsaved snapshots of this date are newer than the database
+        entry = self.pending_saves.get(date_str)
+        if entry is None and self.save_worker and self.save_worker.entry.date == date_str:
+            entry = self.save_worker.entry
+        if entry is not None:
+            # Copy so further typing doesn't change the queued snapshot
+            entry = DiaryEntry.from_dict(entry.to_dict())
+        else:
+            entry = self.data_manager.get_diary_entry(date_str)
         
+        # Programmatic edits must not mark the entry dirty
+        self.entry_editor.blockSignals(True)
         if entry:
             self.current_entry = entry
             self.entry_editor.setPlainText(entry.content)
@@ -150,40 +192,118 @@ class DiaryWidget(QWidget):
             self.current_entry = DiaryEntry(date=date_str)
             self.entry_editor.clear()
             self.summary_display.clear()
+        self.entry_editor.blockSignals(False)
+        self.is_dirty = False
     
     def auto_save(self):
         """Auto-save entry on text change"""
-        # Simple debouncing - save after 2 seconds of no typing
-        # For simplicity, we'll save immediately
-        pass
+        # Debounce: every keystroke restarts the idle timer
+        self.is_dirty = True
+        self.autosave_timer.start()
     
     def save_entry(self):
         """Save current entry"""
-        if self.current_entry:
+        self.is_dirty = True
+        self.flush_entry()
+    
+    def flush_entry(self, wait: bool = False):
+        """Persist the current entry if it has unsaved changes
+        
+        Saves run on a worker thread unless wait is True, in which case all
+        outstanding saves are completed before returning.
+        """
+        self.autosave_timer.stop()
+        
+        if self.is_dirty and self.current_entry:
             self.current_entry.update_content(self.entry_editor.toPlainText())
-            self.data_manager.save_diary_entry(self.current_entry)
-            self.highlight_dates_with_entries()
+            self.is_dirty = False
+            # Save a snapshot so further typing doesn't race with the worker
+            snapshot = DiaryEntry.from_dict(self.current_entry.to_dict())
+            self.pending_saves[snapshot.date] = snapshot
+        
+        if wait:
+            if self.save_worker:
+                self.save_worker.wait()
+            while self.pending_saves:
+                _, snapshot = self.pending_saves.popitem()
+                self.data_manager.save_diary_entry(snapshot)
+                self.on_entry_saved(snapshot.date, bool(snapshot.content))
+        else:
+            self.start_next_save()
     
-    def highlight_dates_with_entries(self):
-        """Highlight dates that have diary entries"""
-        entries = self.data_manager.get_all_diary_entries()
+    def start_next_save(self):
+        """Start the worker for the next pending entry, one save at a time"""
+        if self.save_worker or not self.pending_saves:
+            return
         
-        # Create format for dates with entries
+        date_str = next(iter(self.pending_saves))
+        snapshot = self.pending_saves.pop(date_str)
+        self.save_worker = DiarySaveWorker(self.data_manager, snapshot)
+        self.save_worker.entry_saved.connect(self.on_entry_saved)
+        self.save_worker.error_occurred.connect(self.on_save_error)
+        self.save_worker.finished.connect(self.cleanup_save_worker)
+        self.save_worker.start()
+    
+    def on_entry_saved(self, date_str: str, has_content: bool):
+        """Update the calendar after an entry was persisted"""
+        self.update_date_highlight(date_str, has_content)
+    
+    def on_save_error(self, error: str):
+        """Handle a failed background save"""
+        print(f"Error saving diary entry: {error}")
+    
+    def cleanup_save_worker(self):
+        """Release the finished worker and continue with queued saves"""
+        if self.save_worker:
+            self.save_worker.deleteLater()
+            self.save_worker = None
+        self.start_next_save()
+    
+    def showEvent(self, event):
+        """Load today's entry and calendar highlights the first time the tab is shown"""
+        super().showEvent(event)
+        if not self.entry_loaded:
+            self.entry_loaded = True
+            self.load_entry(self.current_date)
+            self.highlight_dates_with_entries()
+    
+    def hideEvent(self, event):
+        """Flush unsaved edits when the diary tab is left"""
+        self.flush_entry()
+        super().hideEvent(event)
+    
+    def entry_format(self):
+        """Get the text format used for dates with entries"""
         format_with_entry = QTextCharFormat()
         format_with_entry.setBackground(QColor("#c8e6c9"))
+        return format_with_entry
+    
+    def update_date_highlight(self, date_str: str, has_entry: bool):
+        """Highlight or clear a single date on the calendar"""
+        date = QDate.fromString(date_str, "yyyy-MM-dd")
+        if date.isValid():
+            self.calendar.setDateTextFormat(date, self.entry_format() if has_entry else QTextCharFormat())
+    
+    def highlight_dates_with_entries(self, *args):
+        """Highlight dates with diary entries in the visible month"""
+        entry_dates = self.data_manager.get_diary_dates()
+        
+        # Reset formats from previously shown months
+        self.calendar.setDateTextFormat(QDate(), QTextCharFormat())
         
-        for entry in entries:
-            if entry.content:  # Only highlight if there's content
-                date_parts = entry.date.split("-")
-                year, month, day = int(date_parts[0]), int(date_parts[1]), int(date_parts[2])
-                from PyQt6.QtCore import QDate
-                date = QDate(year, month, day)
+        # The month grid also shows trailing/leading days of adjacent months
+        first_shown = QDate(self.calendar.yearShown(), self.calendar.monthShown(), 1).addDays(-7)
+        format_with_entry = self.entry_format()
+        for offset in range(6 * 7 + 7):
+            date = first_shown.addDays(offset)
+            if date.toString("yyyy-MM-dd") in entry_dates:
                 self.calendar.setDateTextFormat(date, format_with_entry)
     
     def request_ai_summary(self):
         """Request AI summary for current entry - summarizes chats and tasks, not user content"""
-        # Save current entry first (even if empty)
-        self.save_entry()
+        # Save current entry first (even if empty) so the summary sees it
+        self.is_dirty = True
+        self.flush_entry(wait=True)
         
         # Emit signal to request AI summary (content is not used, but kept for compatibility)
         content = self.entry_editor.toPlainText().strip()
@@ -198,7 +318,8 @@ class DiaryWidget(QWidget):
         if self.current_entry:
             self.current_entry.set_summary(summary)
             self.summary_display.setPlainText(summary)
-            self.data_manager.save_diary_entry(self.current_entry)
+            self.is_dirty = True
+            self.flush_entry()
             
             # Reset button state
             self.summarize_btn.setEnabled(True)
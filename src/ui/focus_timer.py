@@ -0,0 +1,77 @@
+"""Drift-free countdown engine for the focus timer"""
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
+import time
+
+
+class FocusTimerEngine(QObject):
+    """Countdown driven by time.monotonic() deadlines
+
+    Elapsed time is always computed from the start timestamp, so a stalled
+    event loop or late timer only delays a repaint and never loses seconds.
+    The timer wakes up once per displayed second using a coarse timer, and
+    `tick` is only emitted when the whole-second value actually changes.
+    """
+
+    tick = pyqtSignal(int, int)  # remaining seconds, elapsed seconds
+    finished = pyqtSignal(int)  # elapsed seconds
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+        self._start_time = None
+        self._target_seconds = 0
+        self._last_elapsed = -1
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a countdown is in progress"""
+        return self._start_time is not None
+
+    def start(self, target_seconds: int):
+        """Start counting down from target_seconds"""
+        self._start_time = time.monotonic()
+        self._target_seconds = target_seconds
+        self._last_elapsed = -1
+        self._on_timeout()
+
+    def stop(self) -> int:
+        """Stop the countdown and return the elapsed whole seconds"""
+        elapsed = self.elapsed_seconds()
+        self._timer.stop()
+        self._start_time = None
+        return elapsed
+
+    def elapsed_seconds(self) -> int:
+        """Whole seconds elapsed since start, capped at the target"""
+        if self._start_time is None:
+            return 0
+        elapsed = int(time.monotonic() - self._start_time)
+        return min(elapsed, self._target_seconds)
+
+    def remaining_seconds(self) -> int:
+        """Whole seconds left until the deadline"""
+        return max(0, self._target_seconds - self.elapsed_seconds())
+
+    def _on_timeout(self):
+        """Emit a tick if the displayed second changed and schedule the next wake-up"""
+        if self._start_time is None:
+            return
+
+        elapsed = self.elapsed_seconds()
+        if elapsed != self._last_elapsed:
+            self._last_elapsed = elapsed
+            self.tick.emit(self._target_seconds - elapsed, elapsed)
+
+        if elapsed >= self._target_seconds:
+            self._timer.stop()
+            self._start_time = None
+            self.finished.emit(elapsed)
+            return
+
+        # Wake up just after the next whole-second boundary
+        fraction = (time.monotonic() - self._start_time) % 1
+        self._timer.start(int((1 - fraction) * 1000) + 5)
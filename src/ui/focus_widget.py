@@ -1,14 +1,15 @@
 """Focus timer widget (Pomodoro-style)"""
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QLabel, QSpinBox, QProgressBar, QGridLayout,
-                             QScrollArea, QFrame, QMessageBox)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QPixmap, QPainter, QFont
+                             QLabel, QSpinBox, QProgressBar, QFrame, QMessageBox)
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QPainter, QFont
 from datetime import datetime
-import os
 import random
 
 from src.models import FocusSession
+from src.ui.focus_timer import FocusTimerEngine
+from src.ui.sticker_assets import StickerAssetManager
+from src.ui.sticker_collection_view import StickerCollectionView
 
 
 class FocusWidget(QWidget):
@@ -19,15 +20,20 @@ class FocusWidget(QWidget):
     def __init__(self, data_manager, parent=None):
         super().__init__(parent)
         self.data_manager = data_manager
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_timer)
+        self.timer = FocusTimerEngine(self)
+        self.timer.tick.connect(self.update_timer)
+        self.timer.finished.connect(self.on_timer_finished)
         self.is_running = False
         self.elapsed_seconds = 0
         self.target_seconds = 0
         self.current_session = None
         
+        # Sticker images are scanned once and served from a thumbnail cache
+        self.sticker_assets = StickerAssetManager(parent=self)
+        
+        self.stats_loaded = False
+        
         self.setup_ui()
-        self.load_stats()
         self.update_points_display()
     
     def setup_ui(self):
@@ -152,6 +158,13 @@ class FocusWidget(QWidget):
         
         layout.addStretch()
     
+    def showEvent(self, event):
+        """Load focus statistics the first time the tab is shown"""
+        super().showEvent(event)
+        if not self.stats_loaded:
+            self.stats_loaded = True
+            self.load_stats()
+    
     def load_stats(self):
         """Load focus statistics"""
         stats = self.data_manager.get_focus_stats()
@@ -186,38 +199,39 @@ class FocusWidget(QWidget):
         self.stop_btn.setEnabled(True)
         self.duration_spin.setEnabled(False)
         
-        # Start timer (update every second)
-        self.timer.start(1000)
+        # Start timer (ticks once per displayed second, computed from timestamps)
+        self.timer.start(self.target_seconds)
     
-    def update_timer(self):
+    def update_timer(self, remaining, elapsed):
         """Update timer display"""
-        self.elapsed_seconds += 1
+        self.elapsed_seconds = elapsed
         
-        # Calculate remaining time
-        remaining = max(0, self.target_seconds - self.elapsed_seconds)
         minutes = remaining // 60
         seconds = remaining % 60
-        
         self.time_display.setText(f"{minutes:02d}:{seconds:02d}")
         
-        # Update progress
-        progress = int((self.elapsed_seconds / self.target_seconds) * 100)
-        self.progress_bar.setValue(min(progress, 100))
-        
-        # Check if completed
-        if remaining == 0:
-            self.complete_session()
+        # Update progress only when the percentage changes
+        progress = min(int((elapsed / self.target_seconds) * 100), 100)
+        if progress != self.progress_bar.value():
+            self.progress_bar.setValue(progress)
+    
+    def on_timer_finished(self, elapsed):
+        """Handle the countdown reaching its deadline"""
+        self.elapsed_seconds = elapsed
+        self.complete_session()
     
     def stop_timer(self):
         """Stop the timer"""
-        self.timer.stop()
+        if self.timer.is_running:
+            self.elapsed_seconds = self.timer.stop()
         
         if self.current_session:
             self.complete_session()
     
     def complete_session(self):
         """Complete the current session"""
-        self.timer.stop()
+        if self.timer.is_running:
+            self.elapsed_seconds = self.timer.stop()
         self.is_running = False
         
         if self.current_session:
@@ -302,27 +316,18 @@ class FocusWidget(QWidget):
         header.addWidget(self.draw_btn)
         layout.addLayout(header)
         
-        # Sticker collection display
-        scroll = QScrollArea()
-        scroll.setMaximumHeight(120)
-        scroll.setWidgetResizable(True)
-        
-        self.sticker_container = QWidget()
-        self.sticker_layout = QGridLayout(self.sticker_container)
-        self.sticker_layout.setSpacing(5)
-        
-        scroll.setWidget(self.sticker_container)
-        layout.addWidget(scroll)
+        # Sticker collection display - only visible cells are painted
+        self.sticker_view = StickerCollectionView(self.sticker_assets)
+        self.sticker_view.setMaximumHeight(120)
+        self.sticker_view.setStyleSheet("QListView { background-color: white; }")
+        layout.addWidget(self.sticker_view)
         
         self.update_sticker_display()
         return section
     
     def get_available_stickers(self):
         """Get list of available sticker files"""
-        sticker_dir = "img/stickers"
-        if os.path.exists(sticker_dir):
-            return [f for f in os.listdir(sticker_dir) if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
-        return []
+        return self.sticker_assets.available_stickers()
     
     def get_user_points(self):
         """Get user's current points"""
@@ -411,26 +416,13 @@ class FocusWidget(QWidget):
         images_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         for sticker in drawn_stickers:
-            # Handle both with and without extension
-            sticker_path = None
-            if os.path.exists(f"img/stickers/{sticker}"):
-                sticker_path = f"img/stickers/{sticker}"
-            elif os.path.exists(f"img/stickers/{sticker}.JPG"):
-                sticker_path = f"img/stickers/{sticker}.JPG"
-            elif os.path.exists(f"img/stickers/{sticker}.jpg"):
-                sticker_path = f"img/stickers/{sticker}.jpg"
-            elif os.path.exists(f"img/stickers/{sticker}.png"):
-                sticker_path = f"img/stickers/{sticker}.png"
-            
-            if sticker_path and os.path.exists(sticker_path):
-                pixmap = QPixmap(sticker_path)
-                if not pixmap.isNull():
-                    # Scale to 80x80
-                    scaled_pixmap = pixmap.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    image_label = QLabel()
-                    image_label.setPixmap(scaled_pixmap)
-                    image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    images_layout.addWidget(image_label)
+            # Scaled to 80x80; the modal dialog decodes uncached images directly
+            scaled_pixmap = self.sticker_assets.thumbnail(sticker, 80, block=True)
+            if scaled_pixmap:
+                image_label = QLabel()
+                image_label.setPixmap(scaled_pixmap)
+                image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                images_layout.addWidget(image_label)
         
         layout.addLayout(images_layout)
         
@@ -456,89 +448,5 @@ class FocusWidget(QWidget):
     
     def update_sticker_display(self):
         """Update the sticker collection display"""
-        # Clear existing items
-        while self.sticker_layout.count():
-            item = self.sticker_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        stickers = self.get_user_stickers()
-        row, col = 0, 0
-        
-        for sticker_name, count in stickers.items():
-            # Create sticker item - square widget without layout for absolute positioning
-            sticker_widget = QWidget()  # Use QWidget instead of QFrame for simpler absolute positioning
-            sticker_widget.setFixedSize(70, 70)  # Square widget
-            sticker_widget.setStyleSheet("""
-                QWidget {
-                    background-color: white;
-                    border: 1px solid #dee2e6;
-                    border-radius: 5px;
-                }
-            """)
-            
-            # Find sticker image file
-            sticker_path = None
-            if os.path.exists(f"img/stickers/{sticker_name}"):
-                sticker_path = f"img/stickers/{sticker_name}"
-            elif os.path.exists(f"img/stickers/{sticker_name}.JPG"):
-                sticker_path = f"img/stickers/{sticker_name}.JPG"
-            elif os.path.exists(f"img/stickers/{sticker_name}.jpg"):
-                sticker_path = f"img/stickers/{sticker_name}.jpg"
-            elif os.path.exists(f"img/stickers/{sticker_name}.png"):
-                sticker_path = f"img/stickers/{sticker_name}.png"
-            
-            # Display sticker image - square, centered
-            if sticker_path and os.path.exists(sticker_path):
-                pixmap = QPixmap(sticker_path)
-                if not pixmap.isNull():
-                    # Scale to square (60x60) maintaining aspect ratio
-                    scaled_pixmap = pixmap.scaled(
-                        60, 60, 
-                        Qt.AspectRatioMode.KeepAspectRatio, 
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    
-                    # Create image label with parent
-                    image_label = QLabel(sticker_widget)
-                    image_label.setPixmap(scaled_pixmap)
-                    # Position in center: (70-60)/2 = 5px margin on all sides
-                    image_label.setGeometry(0, 0, 70, 70)
-                    image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    image_label.setScaledContents(False)
-                    image_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-            
-            # Count badge - red circle with white number in top-right corner
-            count_label = QLabel(str(count), sticker_widget)
-            count_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Calculate badge size for perfect circle
-            # Minimum 20px, add 4px per digit
-            badge_size = max(20, 16 + len(str(count)) * 4)
-            radius = badge_size // 2  # Half for perfect circle
-            
-            count_label.setStyleSheet(f"""
-                QLabel {{
-                    background-color: #e74c3c;
-                    color: white;
-                    border-radius: {radius}px;
-                    font-size: 11px;
-                    font-weight: bold;
-                    min-width: {badge_size}px;
-                    min-height: {badge_size}px;
-                }}
-            """)
-            
-            # Position in top-right corner: widget is 70x70, badge is badge_size x badge_size
-            # Position: x = 70 - badge_size - 2 (2px margin), y = 2
-            count_label.setGeometry(70 - badge_size - 2, 2, badge_size, badge_size)
-            count_label.raise_()  # Ensure it's on top of image
-            count_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-            
-            self.sticker_layout.addWidget(sticker_widget, row, col)
-            
-            col += 1
-            if col >= 8:  # 8 stickers per row
-                col = 0
-                row += 1
-
+        # The model diffs against the current collection and repaints changed cells only
+        self.sticker_view.set_stickers(self.get_user_stickers())
@@ -0,0 +1,32 @@
+"""Placeholder tab page that builds its real widget on demand"""
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+
+
+class LazyTab(QWidget):
+    """Empty tab page that calls `factory()` the first time it is needed
+
+    The factory returns the real widget, which is then embedded in this
+    page. Until then the page costs one empty QWidget, so tabs the user
+    never opens are never constructed.
+    """
+
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.content = None
+
+        self.content_layout = QVBoxLayout(self)
+        self.content_layout.setContentsMargins(0, 0, 0, 0)
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the real widget has been constructed"""
+        return self.content is not None
+
+    def ensure_built(self) -> QWidget:
+        """Build the real widget if needed and return it"""
+        if self.content is None:
+            self.content = self.factory()
+            self.factory = None
+            self.content_layout.addWidget(self.content)
+        return self.content
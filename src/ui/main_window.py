@@ -2,10 +2,13 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QTabWidget, QLabel, QMessageBox,
                              QScrollArea, QLineEdit)
-from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtCore import Qt, QPoint, QTimer
 from PyQt6.QtGui import QAction
 
 from src.utils import DataManager
+from src.utils import SessionLogManager
+from src.utils.agent_telemetry import agent_telemetry
+from src.utils.startup_profiler import startup_profiler
 from src.ui.floating_window import FloatingWindow
 from src.ui.anxiety_killer_widget import AnxietyKillerWidget
 from src.ui.ask_me_widget import AskMeWidget
@@ -16,14 +19,20 @@ from src.ui.diary_widget import DiaryWidget
 from src.ui.social_widget import SocialWidget
 from src.ui.settings_dialog import SettingsDialog
 from src.ui.calendar_widget import CalendarWidget
+from src.ui.lazy_tab import LazyTab
 
 
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    PREWARM_DELAY_MS = 3000  # Idle time before unopened tabs are built
+    PREWARM_INTERVAL_MS = 200  # Gap between prewarmed tabs
+    
     def __init__(self):
         super().__init__()
-        self.data_manager = DataManager()
+        with startup_profiler.span("DataManager"):
+            self.data_manager = DataManager()
+        agent_telemetry.open(self.data_manager.data_dir)
         
         # Floating windows
         self.anxiety_killer_window = None
@@ -33,13 +42,30 @@ class MainWindow(QMainWindow):
         self.anxiety_killer_widget = None
         self.ask_me_widget = None
         
-        self.setup_ui()
+        # Tab widgets, built on first use (see add_lazy_tab)
+        self.todo_widget = None
+        self.todolist_widget = None
+        self.calendar_widget = None
+        self.focus_widget = None
+        self.diary_widget = None
+        self.social_widget = None
+        
+        with startup_profiler.span("setup_ui"):
+            self.setup_ui()
         self.setup_menu()
-        self.initialize_agents()
+        with startup_profiler.span("initialize_agents"):
+            self.initialize_agents()
         
         # Show floating windows by default
         self.show_anxiety_killer()
         self.show_ask_me()
+        
+        # Build the remaining tabs in the background once the window is idle
+        QTimer.singleShot(self.PREWARM_DELAY_MS, self.prewarm_tabs)
+        
+        # Index, rotate and archive the railtracks session logs off the GUI thread
+        self.session_logs = SessionLogManager()
+        QTimer.singleShot(self.PREWARM_DELAY_MS, self.session_logs.maintain_in_background)
     
     def setup_right_sidebar(self, main_layout):
         """Setup the right sidebar for todo lists"""
@@ -112,8 +138,10 @@ class MainWindow(QMainWindow):
         sidebar_layout.addWidget(drop_info)
         
         # Initialize default todolists and load
-        self.initialize_default_todolists()
-        self.load_sidebar_todolists()
+        with startup_profiler.span("initialize_default_todolists"):
+            self.initialize_default_todolists()
+        with startup_profiler.span("load_sidebar_todolists"):
+            self.load_sidebar_todolists()
         
         main_layout.addWidget(sidebar, 1)  # Takes 1/4 of the space
     
@@ -174,7 +202,7 @@ class MainWindow(QMainWindow):
             
             # Refresh displays
             self.load_sidebar_todolists()
-            if hasattr(self, 'todolist_widget'):
+            if self.todolist_widget:
                 self.todolist_widget.load_todolists()
             
             # Show encouragement
@@ -298,7 +326,7 @@ class MainWindow(QMainWindow):
         self.load_sidebar_todolists()
         
         # Refresh main TodoList tab if it exists
-        if hasattr(self, 'todolist_widget'):
+        if self.todolist_widget:
             self.todolist_widget.load_todolists()
     
     def initialize_default_todolists(self):
@@ -464,35 +492,18 @@ class MainWindow(QMainWindow):
             }
         """)
         
-        # Todo tab
-        self.todo_widget = TodoWidget(self.data_manager)
-        self.todo_widget.task_completed.connect(self.on_task_completed)
-        self.todo_widget.task_uncompleted.connect(self.on_task_uncompleted)
-        self.todo_widget.task_deleted.connect(self.on_task_deleted)
-        tabs.addTab(self.todo_widget, "📋 Tasks")
-        
-        # TodoList tab
-        self.todolist_widget = TodoListWidget(self.data_manager)
-        tabs.addTab(self.todolist_widget, "📚 Todo Lists")
-        
-        # Calendar tab
-        self.calendar_widget = CalendarWidget(self.data_manager)
-        self.calendar_widget.task_scheduled.connect(self.on_task_scheduled)
-        tabs.addTab(self.calendar_widget, "📅 Calendar")
-        
-        # Focus tab
-        self.focus_widget = FocusWidget(self.data_manager)
-        self.focus_widget.session_completed.connect(self.on_focus_completed)
-        tabs.addTab(self.focus_widget, "⏱️ Focus")
-        
-        # Diary tab
-        self.diary_widget = DiaryWidget(self.data_manager)
-        self.diary_widget.ai_summary_requested.connect(self.request_diary_summary)
-        tabs.addTab(self.diary_widget, "📔 Diary")
-        
-        # Social tab
-        self.social_widget = SocialWidget(self.data_manager)
-        tabs.addTab(self.social_widget, "👥 Social Book")
+        # Tabs are built on first selection; the Tasks tab is visible, so build it now
+        self.tabs = tabs
+        self.lazy_tabs = []
+        self.add_lazy_tab(self.build_todo_widget, "📋 Tasks")
+        self.add_lazy_tab(self.build_todolist_widget, "📚 Todo Lists")
+        self.add_lazy_tab(self.build_calendar_widget, "📅 Calendar")
+        self.add_lazy_tab(self.build_focus_widget, "⏱️ Focus")
+        self.add_lazy_tab(self.build_diary_widget, "📔 Diary")
+        self.add_lazy_tab(self.build_social_widget, "👥 Social Book")
+        tabs.currentChanged.connect(self.on_tab_changed)
+        with startup_profiler.span("build visible tab"):
+            self.lazy_tabs[tabs.currentIndex()].ensure_built()
         
         # Create main content area with right sidebar
         main_content = QHBoxLayout()
@@ -580,6 +591,61 @@ class MainWindow(QMainWindow):
         
         layout.addLayout(footer_layout)
     
+    def add_lazy_tab(self, factory, label: str):
+        """Add a placeholder tab that builds its widget with factory() when first shown"""
+        lazy_tab = LazyTab(factory)
+        self.lazy_tabs.append(lazy_tab)
+        self.tabs.addTab(lazy_tab, label)
+    
+    def on_tab_changed(self, index: int):
+        """Build the selected tab's widget on first selection"""
+        if 0 <= index < len(self.lazy_tabs):
+            self.lazy_tabs[index].ensure_built()
+    
+    def prewarm_tabs(self):
+        """Build one remaining tab per idle tick so later tab switches are instant"""
+        for lazy_tab in self.lazy_tabs:
+            if not lazy_tab.is_built:
+                lazy_tab.ensure_built()
+                QTimer.singleShot(self.PREWARM_INTERVAL_MS, self.prewarm_tabs)
+                return
+    
+    def build_todo_widget(self):
+        """Create the Tasks tab"""
+        self.todo_widget = TodoWidget(self.data_manager)
+        self.todo_widget.task_completed.connect(self.on_task_completed)
+        self.todo_widget.task_uncompleted.connect(self.on_task_uncompleted)
+        self.todo_widget.task_deleted.connect(self.on_task_deleted)
+        return self.todo_widget
+    
+    def build_todolist_widget(self):
+        """Create the Todo Lists tab"""
+        self.todolist_widget = TodoListWidget(self.data_manager)
+        return self.todolist_widget
+    
+    def build_calendar_widget(self):
+        """Create the Calendar tab"""
+        self.calendar_widget = CalendarWidget(self.data_manager)
+        self.calendar_widget.task_scheduled.connect(self.on_task_scheduled)
+        return self.calendar_widget
+    
+    def build_focus_widget(self):
+        """Create the Focus tab"""
+        self.focus_widget = FocusWidget(self.data_manager)
+        self.focus_widget.session_completed.connect(self.on_focus_completed)
+        return self.focus_widget
+    
+    def build_diary_widget(self):
+        """Create the Diary tab"""
+        self.diary_widget = DiaryWidget(self.data_manager)
+        self.diary_widget.ai_summary_requested.connect(self.request_diary_summary)
+        return self.diary_widget
+    
+    def build_social_widget(self):
+        """Create the Social Book tab"""
+        self.social_widget = SocialWidget(self.data_manager)
+        return self.social_widget
+    
     def setup_menu(self):
         """Setup menu bar"""
         menubar = self.menuBar()
@@ -616,8 +682,14 @@ class MainWindow(QMainWindow):
         self.anxiety_killer_widget.proactive_message_received.connect(self.handle_proactive_message)
         self.ask_me_widget = AskMeWidget(self.data_manager)
         
-        # Initialize if API key exists
+        # Initialize if API key exists; this imports the LLM stack, so it runs
+        # from the event loop once the window has been shown
         if api_key:
+            QTimer.singleShot(0, lambda: self.start_agents(api_key, provider, preferences, askme_instructions))
+    
+    def start_agents(self, api_key: str, provider: str, preferences: str, askme_instructions: str):
+        """Create both AI agents"""
+        with startup_profiler.span("start_agents"):
             self.anxiety_killer_widget.initialize_agent(api_key, provider, preferences)
             self.ask_me_widget.initialize_agent(api_key, provider, askme_instructions)
     
@@ -815,7 +887,7 @@ Use emojis if appropriate, but keep it natural and supportive."""
         """Generate AI praise message"""
         try:
             if self.anxiety_killer_widget and self.anxiety_killer_widget.agent:
-                response = await self.anxiety_killer_widget.agent.chat(prompt, context={})
+                response = await self.anxiety_killer_widget.agent.chat(prompt, context={}, feature="praise")
                 self.anxiety_killer_widget.send_proactive_message(response)
         except Exception as e:
             print(f"Error generating AI praise: {e}")
@@ -828,7 +900,7 @@ Use emojis if appropriate, but keep it natural and supportive."""
         """Generate AI encouragement message"""
         try:
             if self.anxiety_killer_widget and self.anxiety_killer_widget.agent:
-                response = await self.anxiety_killer_widget.agent.chat(prompt, context={})
+                response = await self.anxiety_killer_widget.agent.chat(prompt, context={}, feature="encouragement")
                 self.anxiety_killer_widget.send_proactive_message(response)
         except Exception as e:
             print(f"Error generating AI encouragement: {e}")
@@ -908,7 +980,7 @@ Use emojis if appropriate, but keep it natural and heartfelt."""
         """Generate AI praise message for todolist completion"""
         try:
             if self.anxiety_killer_widget and self.anxiety_killer_widget.agent:
-                response = await self.anxiety_killer_widget.agent.chat(prompt, context={})
+                response = await self.anxiety_killer_widget.agent.chat(prompt, context={}, feature="praise")
                 self.anxiety_killer_widget.send_proactive_message(response)
         except Exception as e:
             print(f"Error generating AI todolist praise: {e}")
@@ -933,8 +1005,9 @@ Use emojis if appropriate, but keep it natural and heartfelt."""
     
     def on_task_scheduled(self, task_id: str):
         """Handle task scheduling"""
-        # Refresh other widgets
-        self.todo_widget.load_tasks()
+        # Refresh other widgets (an unbuilt Tasks tab loads fresh data when opened)
+        if self.todo_widget:
+            self.todo_widget.load_tasks()
         
         # Show encouragement
         if self.anxiety_killer_widget and self.anxiety_killer_widget.agent:
@@ -1137,6 +1210,13 @@ Let's work through this together step by step."""
         from PyQt6.QtCore import QTimer
         QTimer.singleShot(3000, lambda: self.remove_stay_on_top())
     
+    def closeEvent(self, event):
+        """Persist pending edits before the window closes"""
+        if self.diary_widget:
+            self.diary_widget.flush_entry(wait=True)
+        self.data_manager.close()
+        super().closeEvent(event)
+    
     def remove_stay_on_top(self):
         """Remove stay-on-top flag from Anxiety Killer window"""
         if self.anxiety_killer_window:
@@ -1,13 +1,22 @@
 """Settings dialog"""
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QLineEdit, QTextEdit, QComboBox, QPushButton,
-                             QDialogButtonBox, QTabWidget, QWidget, QMessageBox)
+                             QDialogButtonBox, QTabWidget, QWidget, QMessageBox,
+                             QCheckBox, QFileDialog)
 from PyQt6.QtCore import Qt
+from datetime import datetime, timedelta
+from PyQt6.QtGui import QFontDatabase
+
+from src.utils.agent_telemetry import agent_telemetry
+from src.utils.data_metrics import data_metrics
 
 
 class SettingsDialog(QDialog):
     """Settings configuration dialog"""
     
+    # (label, days) choices for the agent usage rollup; None means all time
+    USAGE_PERIODS = [("Last 24 hours", 1), ("Last 7 days", 7), ("Last 30 days", 30), ("All time", None)]
+    
     def __init__(self, data_manager, parent=None):
         super().__init__(parent)
         self.data_manager = data_manager
@@ -166,6 +175,81 @@ class SettingsDialog(QDialog):
         data_layout.addStretch()
         tabs.addTab(data_tab, "Data Management")
         
+        # Agent Usage tab
+        usage_tab = QWidget()
+        usage_layout = QVBoxLayout(usage_tab)
+        
+        usage_layout.addWidget(QLabel("<h3>Agent Usage</h3>"))
+        
+        usage_info = QLabel(
+            "Latency, tokens and tool calls of AI requests per feature. "
+            "TTFT is the time until the first model response arrives."
+        )
+        usage_info.setWordWrap(True)
+        usage_info.setStyleSheet("color: #7f8c8d; margin-bottom: 10px;")
+        usage_layout.addWidget(usage_info)
+        
+        self.usage_period_combo = QComboBox()
+        for label, days in self.USAGE_PERIODS:
+            self.usage_period_combo.addItem(label, days)
+        self.usage_period_combo.setCurrentIndex(1)
+        self.usage_period_combo.currentIndexChanged.connect(self.refresh_agent_usage)
+        usage_layout.addWidget(self.usage_period_combo)
+        
+        self.usage_view = QTextEdit()
+        self.usage_view.setReadOnly(True)
+        self.usage_view.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.usage_view.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        usage_layout.addWidget(self.usage_view)
+        
+        tabs.addTab(usage_tab, "Agent Usage")
+        
+        # Debug tab
+        debug_tab = QWidget()
+        debug_layout = QVBoxLayout(debug_tab)
+        
+        debug_layout.addWidget(QLabel("<h3>Data Store Metrics</h3>"))
+        
+        debug_info = QLabel(
+            "Counts calls, table scans and bytes written for every data operation. "
+            "Reset, do something in the app, then refresh to see what it cost."
+        )
+        debug_info.setWordWrap(True)
+        debug_info.setStyleSheet("color: #7f8c8d; margin-bottom: 10px;")
+        debug_layout.addWidget(debug_info)
+        
+        self.metrics_check = QCheckBox("Record data store metrics")
+        self.metrics_check.setChecked(self.data_manager.metrics is not None)
+        self.metrics_check.toggled.connect(self.toggle_metrics)
+        debug_layout.addWidget(self.metrics_check)
+        
+        self.metrics_view = QTextEdit()
+        self.metrics_view.setReadOnly(True)
+        self.metrics_view.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.metrics_view.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        debug_layout.addWidget(self.metrics_view)
+        
+        metrics_buttons = QHBoxLayout()
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.refresh_metrics)
+        metrics_buttons.addWidget(refresh_btn)
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self.reset_metrics)
+        metrics_buttons.addWidget(reset_btn)
+        export_btn = QPushButton("Save JSON...")
+        export_btn.clicked.connect(self.export_metrics)
+        metrics_buttons.addWidget(export_btn)
+        metrics_buttons.addStretch()
+        debug_layout.addLayout(metrics_buttons)
+        
+        tabs.addTab(debug_tab, "Debug")
+        tabs.currentChanged.connect(
+            lambda index: self.refresh_metrics() if tabs.widget(index) is debug_tab else None
+        )
+        tabs.currentChanged.connect(
+            lambda index: self.refresh_agent_usage() if tabs.widget(index) is usage_tab else None
+        )
+        
         layout.addWidget(tabs)
         
         # Buttons
@@ -222,6 +306,53 @@ class SettingsDialog(QDialog):
         
         self.accept()
     
+    def refresh_agent_usage(self):
+        """Show the agent call rollup for the selected period"""
+        days = self.usage_period_combo.currentData()
+        since = datetime.now() - timedelta(days=days) if days else None
+        if not agent_telemetry.calls(since):
+            self.usage_view.setPlainText("No AI requests in this period.")
+            return
+        self.usage_view.setPlainText(agent_telemetry.summary(since))
+    
+    def current_metrics(self):
+        """Metrics being recorded, or the last ones recorded in this process"""
+        return self.data_manager.metrics or data_metrics
+    
+    def toggle_metrics(self, enabled: bool):
+        """Start or stop recording data store metrics"""
+        if enabled:
+            self.data_manager.enable_metrics()
+        else:
+            self.data_manager.disable_metrics()
+        self.refresh_metrics()
+    
+    def refresh_metrics(self):
+        """Show the current metrics summary"""
+        metrics = self.current_metrics()
+        if not metrics.methods and not metrics.stores:
+            self.metrics_view.setPlainText(
+                "Nothing recorded yet." if metrics.enabled else "Metrics are off."
+            )
+            return
+        self.metrics_view.setPlainText(metrics.summary())
+    
+    def reset_metrics(self):
+        """Clear the recorded metrics"""
+        self.current_metrics().reset()
+        self.refresh_metrics()
+    
+    def export_metrics(self):
+        """Save the metrics snapshot as JSON"""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Save Data Metrics", "data_metrics.json", "JSON files (*.json)"
+        )
+        if path:
+            try:
+                self.current_metrics().dump(path)
+            except OSError as e:
+                QMessageBox.warning(self, "Save Failed", f"Could not save metrics: {e}")
+    
     def get_settings(self):
         """Get current settings"""
         provider = "anthropic" if self.provider_combo.currentIndex() == 1 else "gemini"
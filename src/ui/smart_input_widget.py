@@ -1,20 +1,47 @@
 """Smart input widget with @ mention support"""
 from PyQt6.QtWidgets import (QTextEdit, QCompleter, QListWidget, QListWidgetItem, 
                              QVBoxLayout, QWidget, QLabel)
-from PyQt6.QtCore import Qt, pyqtSignal, QStringListModel
+from PyQt6.QtCore import Qt, pyqtSignal, QStringListModel, QThread, QTimer
 from PyQt6.QtGui import QTextCursor, QFont
 import re
 
+from src.utils import MentionIndex
+
+
+class CompletionSearchWorker(QThread):
+    """Worker thread that runs one mention search"""
+    results_ready = pyqtSignal(int, list)  # search generation, completion items
+    
+    def __init__(self, mention_index, query, generation, limit):
+        super().__init__()
+        self.mention_index = mention_index
+        self.query = query
+        self.generation = generation
+        self.limit = limit
+    
+    def run(self):
+        """Search the mention index"""
+        try:
+            items = self.mention_index.search(self.query, limit=self.limit)
+        except Exception as e:
+            print(f"Error searching mentions: {e}")
+            items = []
+        self.results_ready.emit(self.generation, items)
+
 
 class SmartInputWidget(QTextEdit):
     """Text input widget with @ mention support for tasks, todolists, and dates"""
     
     message_ready = pyqtSignal(str, dict)  # message, mentions
     
+    MAX_COMPLETIONS = 15
+    COMPLETION_DELAY_MS = 120  # Keystrokes within this window share one search
+    
     def __init__(self, data_manager, parent=None):
         super().__init__(parent)
         self.data_manager = data_manager
         self.mentions = {}  # Store mentioned items
+        self.mention_index = MentionIndex(data_manager)
         
         self.setup_ui()
         self.setup_completer()
@@ -49,6 +76,17 @@ class SmartInputWidget(QTextEdit):
         self.completion_list.setMaximumHeight(150)
         self.completion_list.itemClicked.connect(self.insert_completion)
         self.completion_list.hide()
+        
+        # Debounced search pipeline: every edit bumps the generation, so results
+        # of searches started for older text are dropped when they arrive
+        self.completion_timer = QTimer(self)
+        self.completion_timer.setSingleShot(True)
+        self.completion_timer.setInterval(self.COMPLETION_DELAY_MS)
+        self.completion_timer.timeout.connect(self.check_for_mentions)
+        self.search_generation = 0
+        self.search_at_pos = -1
+        self.pending_search = None  # (query, generation) waiting for the worker
+        self.search_worker = None
     
     def keyPressEvent(self, event):
         """Handle key press events"""
@@ -74,7 +112,7 @@ class SmartInputWidget(QTextEdit):
                     return
             elif event.key() == Qt.Key.Key_Escape:
                 # Hide completion list
-                self.completion_list.hide()
+                self.cancel_completion()
                 return
         
         if event.key() == Qt.Key.Key_Return and not event.modifiers():
@@ -88,13 +126,24 @@ class SmartInputWidget(QTextEdit):
             return
         elif event.key() == Qt.Key.Key_Escape:
             # Hide completion list
-            self.completion_list.hide()
+            self.cancel_completion()
             return
         
+        before = (self.document().revision(), self.textCursor().position())
         super().keyPressEvent(event)
         
-        # Check for @ mentions
-        self.check_for_mentions()
+        # Check for @ mentions once typing pauses; keys that changed neither
+        # the text nor the cursor (modifiers, etc.) don't trigger a search
+        if (self.document().revision(), self.textCursor().position()) != before:
+            self.search_generation += 1
+            self.completion_timer.start()
+    
+    def cancel_completion(self):
+        """Hide the popup and drop any scheduled or running search"""
+        self.completion_timer.stop()
+        self.search_generation += 1
+        self.pending_search = None
+        self.completion_list.hide()
     
     def check_for_mentions(self):
         """Check for @ mentions and show completion"""
@@ -105,7 +154,7 @@ class SmartInputWidget(QTextEdit):
         # Find @ symbol before cursor
         at_pos = text.rfind('@', 0, pos)
         if at_pos == -1:
-            self.completion_list.hide()
+            self.cancel_completion()
             return
         
         # Get text after @
@@ -113,86 +162,64 @@ class SmartInputWidget(QTextEdit):
         
         # Don't show completion if there's a space (mention is complete)
         if ' ' in query:
-            self.completion_list.hide()
+            self.cancel_completion()
+            return
+        
+        # Search in the background; only the newest query is kept waiting
+        self.search_at_pos = at_pos
+        self.pending_search = (query, self.search_generation)
+        self.start_next_search()
+    
+    def start_next_search(self):
+        """Start the pending search if no search is running"""
+        if self.search_worker or not self.pending_search:
             return
         
-        # Get completion items
-        items = self.get_completion_items(query)
+        query, generation = self.pending_search
+        self.pending_search = None
+        self.search_worker = CompletionSearchWorker(
+            self.mention_index, query, generation, self.MAX_COMPLETIONS
+        )
+        self.search_worker.results_ready.connect(self.on_search_results)
+        self.search_worker.finished.connect(self.cleanup_search_worker)
+        self.search_worker.start()
+    
+    def on_search_results(self, generation, items):
+        """Show search results unless the text changed since the search started"""
+        if generation != self.search_generation:
+            return
         
         if items:
-            self.show_completion(items, at_pos)
+            self.show_completion(items, self.search_at_pos)
         else:
             self.completion_list.hide()
     
+    def cleanup_search_worker(self):
+        """Cleanup after a search finishes and run the next one"""
+        if self.search_worker:
+            self.search_worker.deleteLater()
+            self.search_worker = None
+        self.start_next_search()
+    
     def get_completion_items(self, query):
         """Get completion items based on query"""
-        items = []
-        query_lower = query.lower()
-        query_stripped = query.strip()
-        
-        # If query is empty or very short, show default options including dates
-        show_defaults = len(query_stripped) <= 1
-        
-        # Tasks - filter by query
-        all_tasks = []
-        for category in ["today_must", "future_date", "long_term", "someday_maybe"]:
-            tasks = self.data_manager.get_tasks_by_category(category)
-            all_tasks.extend(tasks)
-        
-        for task in all_tasks:
-            # Filter by query - if query is empty, show all; otherwise filter
-            if not query_stripped or query_lower in task.title.lower():
-                items.append({
-                    'type': 'task',
-                    'id': task.id,
-                    'display': f"📋 {task.title}",
-                    'completion': f"task:{task.id}",
-                    'data': task
-                })
-        
-        # Todo Lists - filter by query
-        todolists = self.data_manager.get_setting("todolists", [])
-        for todolist in todolists:
-            # Filter by query
-            if not query_stripped or query_lower in todolist.get('name', '').lower():
-                items.append({
-                    'type': 'todolist',
-                    'id': todolist['id'],
-                    'display': f"📚 {todolist.get('name', 'Unnamed')}",
-                    'completion': f"todolist:{todolist['id']}",
-                    'data': todolist
-                })
-        
-        # People from social book - filter by query
-        try:
-            people = self.data_manager.get_all_people()
-            if people:
-                for person in people:
-                    # Filter by query - check name
-                    if not query_stripped or query_lower in person.name.lower():
-                        items.append({
-                            'type': 'person',
-                            'id': person.id,
-                            'display': f"👤 {person.name}",
-                            'completion': f"person:{person.id}",
-                            'data': person
-                        })
-        except Exception as e:
-            # Social book might not be implemented yet, or error getting people
-            import traceback
-            print(f"Error getting people for mentions: {e}")
-            traceback.print_exc()
-        
-        return items[:15]  # Limit to 15 items
+        return self.mention_index.search(query, limit=self.MAX_COMPLETIONS)
     
     def show_completion(self, items, at_pos):
         """Show completion popup"""
-        self.completion_list.clear()
-        
-        for item in items:
-            list_item = QListWidgetItem(item['display'])
+        # Reuse existing rows instead of rebuilding the list
+        self.completion_list.setUpdatesEnabled(False)
+        for row, item in enumerate(items):
+            list_item = self.completion_list.item(row)
+            if list_item is None:
+                list_item = QListWidgetItem()
+                self.completion_list.addItem(list_item)
+            if list_item.text() != item['display']:
+                list_item.setText(item['display'])
             list_item.setData(Qt.ItemDataRole.UserRole, item)
-            self.completion_list.addItem(list_item)
+        while self.completion_list.count() > len(items):
+            self.completion_list.takeItem(self.completion_list.count() - 1)
+        self.completion_list.setUpdatesEnabled(True)
         
         # Select first item by default
         if self.completion_list.count() > 0:
@@ -245,7 +272,7 @@ class SmartInputWidget(QTextEdit):
         # Also store by display name for reverse lookup
         self.mentions[f"display:{display_name}"] = data
         
-        self.completion_list.hide()
+        self.cancel_completion()
     
     def send_message(self):
         """Send the message with mentions"""
@@ -260,6 +287,7 @@ class SmartInputWidget(QTextEdit):
             # Clear input
             self.clear()
             self.mentions.clear()
+            self.cancel_completion()
     
     def parse_mentions(self, message):
         """Parse @ mentions in the message - supports both code format and friendly names"""
@@ -0,0 +1,155 @@
+"""Sticker image asset manager with a cache of pre-scaled thumbnails"""
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap, QPixmapCache
+import os
+
+
+STICKER_DIR = "img/stickers"
+STICKER_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+
+class StickerLoadWorker(QThread):
+    """Worker thread that decodes and scales sticker images
+
+    QImage can be used outside the GUI thread; the conversion to QPixmap
+    happens in the manager once the image is handed back.
+    """
+    image_loaded = pyqtSignal(str, int, QImage)  # sticker name, size, scaled image
+
+    def __init__(self, requests):
+        super().__init__()
+        self.requests = requests  # list of (name, path, size)
+
+    def run(self):
+        """Decode each requested image and scale it to its display size"""
+        for name, path, size in self.requests:
+            image = QImage(path)
+            if image.isNull():
+                continue
+            scaled = image.scaled(
+                size, size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self.image_loaded.emit(name, size, scaled)
+
+
+class StickerAssetManager(QObject):
+    """Scans the sticker directory and serves cached thumbnails"""
+
+    thumbnail_ready = pyqtSignal(str, int)  # sticker name, size
+
+    def __init__(self, sticker_dir: str = STICKER_DIR, parent=None):
+        super().__init__(parent)
+        self.sticker_dir = sticker_dir
+        self._files = {}  # file name and extension-less name -> path
+        self._stickers = []
+        self._dir_mtime = None
+        self._pending = {}  # (name, size) -> path waiting for a worker
+        self._in_flight = set()
+        self.current_worker = None
+
+    def refresh(self) -> bool:
+        """Rescan the sticker directory if it changed; returns True on rescan"""
+        try:
+            mtime = os.stat(self.sticker_dir).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if mtime == self._dir_mtime and self._dir_mtime is not None:
+            return False
+
+        self._dir_mtime = mtime
+        self._files = {}
+        self._stickers = []
+        if mtime is not None:
+            for file_name in sorted(os.listdir(self.sticker_dir)):
+                if not file_name.lower().endswith(STICKER_EXTENSIONS):
+                    continue
+                path = os.path.join(self.sticker_dir, file_name)
+                self._stickers.append(file_name)
+                self._files[file_name] = path
+                # Older collections stored names without the extension
+                self._files.setdefault(os.path.splitext(file_name)[0], path)
+        return True
+
+    def available_stickers(self) -> list:
+        """Get the list of available sticker file names"""
+        self.refresh()
+        return list(self._stickers)
+
+    def sticker_path(self, name: str):
+        """Resolve a sticker name to its image path, or None"""
+        self.refresh()
+        return self._files.get(name)
+
+    @staticmethod
+    def cache_key(name: str, size: int) -> str:
+        """Get the QPixmapCache key for a sticker thumbnail"""
+        return f"sticker:{size}:{name}"
+
+    def thumbnail(self, name: str, size: int, block: bool = False):
+        """Get a scaled thumbnail for a sticker
+
+        Returns the cached pixmap when available. Otherwise the image is
+        decoded in the background and thumbnail_ready is emitted, and None is
+        returned -- unless block is True, which decodes on the calling thread.
+        """
+        pixmap = QPixmapCache.find(self.cache_key(name, size))
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
+        path = self.sticker_path(name)
+        if not path:
+            return None
+
+        if block:
+            image = QImage(path)
+            if image.isNull():
+                return None
+            pixmap = QPixmap.fromImage(image.scaled(
+                size, size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            ))
+            QPixmapCache.insert(self.cache_key(name, size), pixmap)
+            return pixmap
+
+        if (name, size) not in self._in_flight:
+            self._pending[(name, size)] = path
+            self._start_worker()
+        return None
+
+    def preload(self, names, size: int):
+        """Schedule background decoding for several stickers"""
+        for name in names:
+            self.thumbnail(name, size)
+
+    def _start_worker(self):
+        """Hand all pending requests to a new worker if none is running"""
+        if self.current_worker or not self._pending:
+            return
+
+        requests = [(name, path, size) for (name, size), path in self._pending.items()]
+        self._in_flight.update(self._pending.keys())
+        self._pending = {}
+
+        self.current_worker = StickerLoadWorker(requests)
+        self.current_worker.image_loaded.connect(self._on_image_loaded)
+        self.current_worker.finished.connect(self._cleanup_worker)
+        self.current_worker.start()
+
+    def _on_image_loaded(self, name: str, size: int, image: QImage):
+        """Convert a decoded image to a pixmap and cache it (GUI thread)"""
+        QPixmapCache.insert(self.cache_key(name, size), QPixmap.fromImage(image))
+        self._in_flight.discard((name, size))
+        self.thumbnail_ready.emit(name, size)
+
+    def _cleanup_worker(self):
+        """Release the finished worker and pick up new requests"""
+        if self.current_worker:
+            for name, _, size in self.current_worker.requests:
+                self._in_flight.discard((name, size))
+            self.current_worker.deleteLater()
+            self.current_worker = None
+        self._start_worker()
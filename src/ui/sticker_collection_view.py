@@ -0,0 +1,153 @@
+"""Virtualized sticker collection grid (model, delegate and view)"""
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QRect
+from PyQt6.QtGui import QColor, QPen, QFont
+
+
+CELL_SIZE = 70
+THUMBNAIL_SIZE = 60
+
+
+class StickerCollectionModel(QAbstractListModel):
+    """List model of owned sticker types and their counts"""
+
+    CountRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []
+        self._counts = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._names):
+            return None
+        name = self._names[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return name
+        if role == self.CountRole:
+            return self._counts[name]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"{name} x{self._counts[name]}"
+        return None
+
+    def set_stickers(self, stickers: dict):
+        """Sync the model with a {sticker name: count} mapping
+
+        Only rows whose count changed are signalled, so the view repaints
+        single cells instead of rebuilding the grid.
+        """
+        # Remove sticker types that are no longer owned
+        for row in range(len(self._names) - 1, -1, -1):
+            name = self._names[row]
+            if stickers.get(name, 0) <= 0:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._names[row]
+                del self._counts[name]
+                self.endRemoveRows()
+
+        # Update counts in place
+        for row, name in enumerate(self._names):
+            if stickers[name] != self._counts[name]:
+                self._counts[name] = stickers[name]
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [self.CountRole])
+
+        # Append newly collected sticker types
+        new_names = [name for name, count in stickers.items()
+                     if count > 0 and name not in self._counts]
+        if new_names:
+            first = len(self._names)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_names) - 1)
+            for name in new_names:
+                self._names.append(name)
+                self._counts[name] = stickers[name]
+            self.endInsertRows()
+
+    def refresh_sticker(self, name: str):
+        """Signal that a sticker's image became available"""
+        if name in self._counts:
+            index = self.index(self._names.index(name))
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+
+class StickerDelegate(QStyledItemDelegate):
+    """Paints a sticker thumbnail with a red count badge"""
+
+    def __init__(self, sticker_assets, parent=None):
+        super().__init__(parent)
+        self.sticker_assets = sticker_assets
+
+    def sizeHint(self, option, index):
+        return QSize(CELL_SIZE, CELL_SIZE)
+
+    def paint(self, painter, option, index):
+        name = index.data(Qt.ItemDataRole.DisplayRole)
+        count = index.data(StickerCollectionModel.CountRole)
+        cell = QRect(option.rect.x(), option.rect.y(), CELL_SIZE, CELL_SIZE)
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing, True)
+
+        # Card background
+        painter.setPen(QPen(QColor("#dee2e6"), 1))
+        painter.setBrush(QColor("white"))
+        painter.drawRoundedRect(cell.adjusted(0, 0, -1, -1), 5, 5)
+
+        # Thumbnail, centered; decoded in the background if not cached yet
+        pixmap = self.sticker_assets.thumbnail(name, THUMBNAIL_SIZE)
+        if pixmap:
+            x = cell.x() + (CELL_SIZE - pixmap.width()) // 2
+            y = cell.y() + (CELL_SIZE - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+
+        # Count badge - red circle with white number in top-right corner
+        text = str(count)
+        badge_size = max(20, 16 + len(text) * 4)
+        badge = QRect(cell.right() - badge_size - 2, cell.y() + 2, badge_size, badge_size)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#e74c3c"))
+        painter.drawEllipse(badge)
+
+        font = QFont(painter.font())
+        font.setPixelSize(11)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, text)
+
+        painter.restore()
+
+
+class StickerCollectionView(QListView):
+    """Icon-mode list view that only paints visible sticker cells"""
+
+    def __init__(self, sticker_assets, parent=None):
+        super().__init__(parent)
+        self.sticker_model = StickerCollectionModel(self)
+        self.setModel(self.sticker_model)
+        self.setItemDelegate(StickerDelegate(sticker_assets, self))
+
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setMovement(QListView.Movement.Static)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setWrapping(True)
+        self.setUniformItemSizes(True)
+        self.setSpacing(5)
+        self.setGridSize(QSize(CELL_SIZE + 5, CELL_SIZE + 5))
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+        sticker_assets.thumbnail_ready.connect(self.on_thumbnail_ready)
+
+    def set_stickers(self, stickers: dict):
+        """Show the given {sticker name: count} collection"""
+        self.sticker_model.set_stickers(stickers)
+
+    def on_thumbnail_ready(self, name: str, size: int):
+        """Repaint the cell whose thumbnail just finished decoding"""
+        if size == THUMBNAIL_SIZE:
+            self.sticker_model.refresh_sticker(name)
@@ -1,6 +1,9 @@
 """Utilities for ByeByeAnxiety"""
 
 from .data_manager import DataManager
+from .data_metrics import DataMetrics
+from .focus_analytics import FocusAnalytics
+from .mention_index import MentionIndex
+from .session_logs import SessionLogManager
 
-__all__ = ['DataManager']
-
+__all__ = ['DataManager', 'DataMetrics', 'FocusAnalytics', 'MentionIndex', 'SessionLogManager']
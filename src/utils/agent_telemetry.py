@@ -0,0 +1,223 @@
+"""Agent call telemetry: latency, tokens and tool calls per feature"""
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import json
+import os
+import threading
+import time
+
+
+@dataclass(slots=True)
+class AgentCall:
+    """One rt.call made for an app feature (chat, ask, praise, ...)
+
+    Calls aren't streamed, so ttft_ms is the time until the first model
+    response arrives; later model turns (after tool calls) add to latency_ms.
+    """
+    timestamp: str
+    agent: str
+    feature: str
+    latency_ms: float = 0.0
+    ttft_ms: Optional[float] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    tool_calls: int = 0
+    model_turns: int = 0
+    cost: float = 0.0
+    error: Optional[str] = None
+    started: float = 0.0  # perf_counter() at the start of the call; not stored
+
+    def to_row(self) -> list:
+        """Compact JSON row, fields in declaration order"""
+        return [self.timestamp, self.agent, self.feature, round(self.latency_ms, 1),
+                None if self.ttft_ms is None else round(self.ttft_ms, 1),
+                self.input_tokens, self.output_tokens, self.tool_calls, self.model_turns,
+                round(self.cost, 6), self.error]
+
+    @classmethod
+    def from_row(cls, row: list) -> "AgentCall":
+        return cls(*row)
+
+
+class AgentTelemetryStore:
+    """Append-only JSON-lines file of AgentCall rows
+
+    Rows are appended without fsync: losing the last few on a crash is
+    fine for telemetry. When the file outgrows max_bytes, opening it drops
+    rows older than retention_days.
+    """
+
+    def __init__(self, path, retention_days: int = 90, max_bytes: int = 2 * 1024 * 1024):
+        self.path = Path(path)
+        self.retention_days = retention_days
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        if self.path.exists() and self.path.stat().st_size > max_bytes:
+            self.trim()
+
+    def append(self, call: AgentCall) -> None:
+        line = json.dumps(call.to_row(), separators=(",", ":")) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def load(self, since: Optional[datetime] = None) -> List[AgentCall]:
+        """Calls made at or after since (all calls if None), oldest first"""
+        if not self.path.exists():
+            return []
+        cutoff = since.isoformat() if since else ""
+        calls = []
+        with self._lock:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        row = json.loads(line)
+                    except ValueError:
+                        # Torn last line from a crash
+                        continue
+                    if row[0] >= cutoff:
+                        calls.append(AgentCall.from_row(row))
+        return calls
+
+    def trim(self) -> None:
+        """Drop rows older than the retention period"""
+        kept = self.load(datetime.now() - timedelta(days=self.retention_days))
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with self._lock:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for call in kept:
+                    f.write(json.dumps(call.to_row(), separators=(",", ":")) + "\n")
+            os.replace(temp_path, self.path)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def rollup(calls: List[AgentCall]) -> Dict[str, Dict[str, Any]]:
+    """Aggregate calls per feature, most total latency first"""
+    by_feature = {}
+    for call in calls:
+        by_feature.setdefault(call.feature, []).append(call)
+
+    result = {}
+    for feature, feature_calls in by_feature.items():
+        latencies = sorted(c.latency_ms for c in feature_calls)
+        ttfts = [c.ttft_ms for c in feature_calls if c.ttft_ms is not None]
+        result[feature] = {
+            "agent": feature_calls[-1].agent,
+            "calls": len(feature_calls),
+            "errors": sum(1 for c in feature_calls if c.error),
+            "total_latency_ms": sum(latencies),
+            "p50_ms": _percentile(latencies, 0.5),
+            "p95_ms": _percentile(latencies, 0.95),
+            "mean_ttft_ms": sum(ttfts) / len(ttfts) if ttfts else None,
+            "input_tokens": sum(c.input_tokens for c in feature_calls),
+            "output_tokens": sum(c.output_tokens for c in feature_calls),
+            "tool_calls": sum(c.tool_calls for c in feature_calls),
+            "cost": sum(c.cost for c in feature_calls),
+        }
+    return dict(sorted(result.items(), key=lambda item: -item[1]["total_latency_ms"]))
+
+
+# The AgentCall being tracked in the current task, seen by observe_model_turn
+_current_call: ContextVar[Optional[AgentCall]] = ContextVar("current_agent_call", default=None)
+
+
+class AgentTelemetry:
+    """Collects an AgentCall for every tracked rt.call
+
+    Agents wrap rt.call in track(agent, feature) and install
+    observe_model_turn as model middleware, which adds each model
+    response's tokens and tool calls to the call being tracked. Calls are
+    kept in memory until open() attaches a store in the data directory.
+    """
+
+    FILE_NAME = "agent_telemetry.jsonl"
+    MAX_RECENT = 500
+
+    def __init__(self):
+        self.store = None
+        self.recent = []  # calls made in this process, newest last
+        self._lock = threading.Lock()
+
+    def open(self, data_dir) -> None:
+        """Persist calls to agent_telemetry.jsonl in data_dir"""
+        self.store = AgentTelemetryStore(Path(data_dir) / self.FILE_NAME)
+
+    @asynccontextmanager
+    async def track(self, agent: str, feature: str):
+        """Record the wrapped rt.call as one AgentCall"""
+        call = AgentCall(timestamp=datetime.now().isoformat(timespec="seconds"), agent=agent,
+                         feature=feature, started=time.perf_counter())
+        token = _current_call.set(call)
+        try:
+            yield call
+        except BaseException as e:
+            call.error = type(e).__name__
+            raise
+        finally:
+            _current_call.reset(token)
+            call.latency_ms = (time.perf_counter() - call.started) * 1000
+            self.record(call)
+
+    def record(self, call: AgentCall) -> None:
+        with self._lock:
+            self.recent.append(call)
+            del self.recent[:-self.MAX_RECENT]
+        if self.store is not None:
+            try:
+                self.store.append(call)
+            except OSError as e:
+                print(f"Error saving agent telemetry: {e}")
+
+    def calls(self, since: Optional[datetime] = None) -> List[AgentCall]:
+        """Stored calls since a time, or this process's calls without a store"""
+        if self.store is not None:
+            return self.store.load(since)
+        cutoff = since.isoformat() if since else ""
+        with self._lock:
+            return [call for call in self.recent if call.timestamp >= cutoff]
+
+    def rollup(self, since: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+        return rollup(self.calls(since))
+
+    def summary(self, since: Optional[datetime] = None) -> str:
+        """Format the per-feature rollup as a table"""
+        rows = self.rollup(since)
+        lines = [f"{'feature':<16}{'calls':>7}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'ttft ms':>9}"
+                 f"{'tokens in':>11}{'tokens out':>12}{'tools':>7}"]
+        for feature, r in rows.items():
+            ttft = f"{r['mean_ttft_ms']:>9.0f}" if r["mean_ttft_ms"] is not None else f"{'-':>9}"
+            lines.append(f"{feature:<16}{r['calls']:>7}{r['errors']:>8}{r['p50_ms']:>9.0f}{r['p95_ms']:>9.0f}"
+                         f"{ttft}{r['input_tokens']:>11}{r['output_tokens']:>12}{r['tool_calls']:>7}")
+        return "\n".join(lines)
+
+
+async def observe_model_turn(call, messages, schema, tools):
+    """Model middleware adding each model response to the tracked AgentCall"""
+    response = await call(messages, schema, tools)
+    agent_call = _current_call.get()
+    if agent_call is not None:
+        if agent_call.ttft_ms is None:
+            agent_call.ttft_ms = (time.perf_counter() - agent_call.started) * 1000
+        agent_call.model_turns += 1
+        info = response.message_info
+        if info is not None:
+            agent_call.input_tokens += info.input_tokens or 0
+            agent_call.output_tokens += info.output_tokens or 0
+            agent_call.cost += info.total_cost or 0.0
+        content = response.message.content if response.message is not None else None
+        if isinstance(content, list):
+            agent_call.tool_calls += len(content)
+    return response
+
+
+# Process-wide collector used by the agents and the settings dialog
+agent_telemetry = AgentTelemetry()
@@ -1,58 +1,265 @@
 """Data persistence manager using TinyDB"""
 from tinydb import TinyDB, Query
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from datetime import datetime
 import os
+import threading
+from bisect import bisect_left, bisect_right, insort
 from pathlib import Path
 
 from src.models import Task, DiaryEntry, Person, FocusSession, FocusStats
+from src.utils.storage import AtomicJSONStorage, JournalStorage, JournalCompactor, recover_storage
+from src.utils.data_metrics import DataMetrics, MeteredTable, data_metrics, metered
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy JSON-style data (nested lists/dicts); much cheaper than deepcopy"""
+    if type(value) is dict:
+        return {k: _copy_json(v) if type(v) in (dict, list) else v for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_json(v) if type(v) in (dict, list) else v for v in value]
+    return value
+
+
+class _MeteredTinyDB(TinyDB):
+    """TinyDB whose tables report full scans when metrics are enabled"""
+    
+    table_class = MeteredTable
+
+
+class _LazyDatabase:
+    """DataManager attribute that opens its TinyDB file on first access
+    
+    After the first access the opened database is stored in the instance
+    dictionary under the same name, which shadows this (non-data)
+    descriptor, so later lookups are plain attribute reads.
+    """
+    
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        with instance._open_lock:
+            db = instance.__dict__.get(self.name)
+            if db is None:
+                db = instance._open_db(self.file_name)
+                instance.__dict__[self.name] = db
+        return db
 
 
 class DataManager:
     """Manages all data persistence for the application"""
     
-    def __init__(self, data_dir: str = "data"):
+    STORAGE_ENGINES = ("atomic", "journal")
+    
+    # Public methods that enable_metrics() leaves unwrapped
+    UNMETERED_METHODS = {"close", "add_change_listener", "remove_change_listener",
+                         "enable_metrics", "disable_metrics"}
+    
+    # Databases are opened (and parsed) only when first used
+    tasks_db = _LazyDatabase("tasks.json")
+    diary_db = _LazyDatabase("diary.json")
+    social_db = _LazyDatabase("social.json")
+    focus_db = _LazyDatabase("focus.json")
+    chat_db = _LazyDatabase("chat_history.json")
+    settings_db = _LazyDatabase("settings.json")
+    
+    def __init__(self, data_dir: str = "data", fsync: bool = True, storage_engine: str = "atomic"):
+        """Open the data stores
+        
+        storage_engine "atomic" rewrites a store atomically on every change;
+        "journal" appends changed documents to a journal that a background
+        thread periodically compacts into the store file.
+        """
+        if storage_engine not in self.STORAGE_ENGINES:
+            raise ValueError(f"Unknown storage engine: {storage_engine}")
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self.fsync = fsync
+        self.storage_engine = storage_engine
+        self._compactor = JournalCompactor() if storage_engine == "journal" else None
+        
+        # Repair stores left behind by an interrupted write
+        for action in recover_storage(self.data_dir):
+            print(f"Storage recovery: {action}")
+        
+        self._open_lock = threading.Lock()
+        
+        # In-memory settings, loaded once on first use; save_setting writes through
+        self._settings = None
         
-        # Initialize databases
-        self.tasks_db = TinyDB(self.data_dir / "tasks.json")
-        self.diary_db = TinyDB(self.data_dir / "diary.json")
-        self.social_db = TinyDB(self.data_dir / "social.json")
-        self.focus_db = TinyDB(self.data_dir / "focus.json")
-        self.chat_db = TinyDB(self.data_dir / "chat_history.json")
-        self.settings_db = TinyDB(self.data_dir / "settings.json")
+        # Identity map of Task objects by id, loaded as one snapshot on first use
+        self._task_map = None
+        self._task_lock = threading.RLock()
+        
+        # Running focus statistics, from per-day rollups stored next to the sessions in focus.json
+        self._focus_aggregate = None
+        self._focus_day_ids = {}  # YYYY-MM-DD -> doc id of the day's rollup
+        self._focus_days = []  # sorted days that have a rollup
+        # (start_time, doc_id) pairs sorted by start time (built on first use)
+        self._focus_index = None
+        
+        # Lightweight index of diary dates that have content (built on first use)
+        self._diary_dates = None
+        # Diary entries may be persisted from the diary autosave worker thread
+        self._diary_lock = threading.RLock()
+        
+        # Callables notified as listener(kind, key) after tasks, people or settings change
+        self._change_listeners = []
+        
+        # DataMetrics being recorded into, or None (see enable_metrics)
+        self.metrics = None
+        self._metered_methods = []
+        if data_metrics.enabled:
+            self.enable_metrics()
+    
+    def _open_db(self, file_name: str) -> TinyDB:
+        """Open a TinyDB file with the configured crash-safe storage engine"""
+        if self.storage_engine == "journal":
+            db = _MeteredTinyDB(self.data_dir / file_name, storage=JournalStorage,
+                                fsync=self.fsync, compactor=self._compactor)
+        else:
+            db = _MeteredTinyDB(self.data_dir / file_name, storage=AtomicJSONStorage, fsync=self.fsync)
+        db.storage.metrics = self.metrics
+        return db
+    
+    def _opened_dbs(self) -> List[TinyDB]:
+        return [db for db in (self.__dict__.get(name) for name in
+                              ("tasks_db", "diary_db", "social_db", "focus_db", "chat_db", "settings_db"))
+                if db is not None]
+    
+    def enable_metrics(self, metrics: Optional[DataMetrics] = None) -> DataMetrics:
+        """Start recording call latencies, table scans and bytes written
+        
+        Records into the process-wide data_metrics unless metrics is given.
+        Public methods are wrapped on this instance only, so nothing is
+        timed while metrics are disabled.
+        """
+        if self.metrics is not None:
+            self.disable_metrics()
+        self.metrics = metrics or data_metrics
+        self.metrics.enabled = True
+        for name in dir(type(self)):
+            if name.startswith("_") or name in self.UNMETERED_METHODS:
+                continue
+            if callable(getattr(type(self), name)):
+                self.__dict__[name] = metered(self.metrics, name, getattr(self, name))
+                self._metered_methods.append(name)
+        for db in self._opened_dbs():
+            db.storage.metrics = self.metrics
+        return self.metrics
+    
+    def disable_metrics(self) -> None:
+        """Stop recording and remove the method wrappers; recorded data is kept"""
+        if self.metrics is None:
+            return
+        self.metrics.enabled = False
+        for name in self._metered_methods:
+            del self.__dict__[name]
+        self._metered_methods = []
+        for db in self._opened_dbs():
+            db.storage.metrics = None
+        self.metrics = None
+    
+    def close(self) -> None:
+        """Flush and close all opened data stores"""
+        if self._compactor:
+            self._compactor.stop()
+        for db in self._opened_dbs():
+            db.close()
+    
+    def add_change_listener(self, listener) -> None:
+        """Call listener(kind, key) after data changes
+        
+        kind is "task" or "person" (key is the id), "setting" (key is the
+        setting name) or "reset" after clear_all_data (key is None).
+        """
+        self._change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener) -> None:
+        """Stop notifying a listener added with add_change_listener"""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+    
+    def _notify_change(self, kind: str, key: Optional[str]) -> None:
+        for listener in list(self._change_listeners):
+            try:
+                listener(kind, key)
+            except Exception as e:
+                print(f"Error in data change listener: {e}")
+    
+    @property
+    def focus_daily_db(self):
+        """Table holding one focus rollup document per day"""
+        return self.focus_db.table("daily")
+    
+    @property
+    def _settings_cache(self) -> Dict[str, Any]:
+        """The in-memory settings, read from settings.json on first use"""
+        if self._settings is None:
+            self._settings = self._load_settings_cache()
+        return self._settings
     
     # Task Management
+    def _load_task_map(self) -> Dict[str, Task]:
+        """Get the id -> Task identity map, deserializing all tasks once"""
+        with self._task_lock:
+            if self._task_map is None:
+                self._task_map = {}
+                for record in self.tasks_db.all():
+                    task = Task.from_dict(record)
+                    self._task_map[task.id] = task
+            return self._task_map
+    
+    def _task_list(self) -> List[Task]:
+        """Copy the identity map's tasks under the lock, as agent tools save from worker threads"""
+        with self._task_lock:
+            return list(self._load_task_map().values())
+    
     def save_task(self, task: Task) -> None:
         """Save or update a task"""
-        Task_query = Query()
-        existing = self.tasks_db.search(Task_query.id == task.id)
-        if existing:
-            self.tasks_db.update(task.to_dict(), Task_query.id == task.id)
-        else:
-            self.tasks_db.insert(task.to_dict())
+        with self._task_lock:
+            Task_query = Query()
+            existing = self.tasks_db.search(Task_query.id == task.id)
+            if existing:
+                self.tasks_db.update(task.to_dict(), Task_query.id == task.id)
+            else:
+                self.tasks_db.insert(task.to_dict())
+            
+            # Write-through: the saved object becomes the shared instance
+            if self._task_map is not None:
+                self._task_map[task.id] = task
+        self._notify_change("task", task.id)
     
     def get_task(self, task_id: str) -> Optional[Task]:
-        """Get a task by ID"""
-        Task_query = Query()
-        result = self.tasks_db.search(Task_query.id == task_id)
-        return Task.from_dict(result[0]) if result else None
+        """Get a task by ID
+        
+        Repeated lookups return the same Task object until it is replaced
+        by save_task or removed by delete_task.
+        """
+        return self._load_task_map().get(task_id)
     
     def get_tasks_by_category(self, category: str) -> List[Task]:
         """Get all tasks in a category"""
-        Task_query = Query()
-        results = self.tasks_db.search(Task_query.category == category)
-        return [Task.from_dict(t) for t in results]
+        return [t for t in self._task_list() if t.category == category]
     
     def get_all_tasks(self) -> List[Task]:
         """Get all tasks"""
-        return [Task.from_dict(t) for t in self.tasks_db.all()]
+        return self._task_list()
     
     def delete_task(self, task_id: str) -> None:
         """Delete a task and remove it from all todolists"""
-        Task_query = Query()
-        self.tasks_db.remove(Task_query.id == task_id)
+        with self._task_lock:
+            Task_query = Query()
+            self.tasks_db.remove(Task_query.id == task_id)
+            if self._task_map is not None:
+                self._task_map.pop(task_id, None)
+        self._notify_change("task", task_id)
         
         # Remove task from all todolists
         self.remove_task_from_all_todolists(task_id)
@@ -75,29 +282,49 @@ class DataManager:
     
     def get_tasks_by_date(self, date: str) -> List[Task]:
         """Get tasks for a specific date"""
-        Task_query = Query()
-        results = self.tasks_db.search(Task_query.due_date == date)
-        return [Task.from_dict(t) for t in results]
+        return [t for t in self._task_list() if t.due_date == date]
     
     # Diary Management
     def save_diary_entry(self, entry: DiaryEntry) -> None:
         """Save or update a diary entry"""
-        Entry_query = Query()
-        existing = self.diary_db.search(Entry_query.date == entry.date)
-        if existing:
-            self.diary_db.update(entry.to_dict(), Entry_query.date == entry.date)
-        else:
-            self.diary_db.insert(entry.to_dict())
+        with self._diary_lock:
+            Entry_query = Query()
+            existing = self.diary_db.search(Entry_query.date == entry.date)
+            if existing:
+                self.diary_db.update(entry.to_dict(), Entry_query.date == entry.date)
+            else:
+                self.diary_db.insert(entry.to_dict())
+            
+            # Keep the date index in sync without rescanning the table
+            if self._diary_dates is not None:
+                if entry.content:
+                    self._diary_dates.add(entry.date)
+                else:
+                    self._diary_dates.discard(entry.date)
     
     def get_diary_entry(self, date: str) -> Optional[DiaryEntry]:
         """Get diary entry for a specific date"""
-        Entry_query = Query()
-        result = self.diary_db.search(Entry_query.date == date)
+        with self._diary_lock:
+            Entry_query = Query()
+            result = self.diary_db.search(Entry_query.date == date)
         return DiaryEntry.from_dict(result[0]) if result else None
     
     def get_all_diary_entries(self) -> List[DiaryEntry]:
         """Get all diary entries"""
-        return [DiaryEntry.from_dict(e) for e in self.diary_db.all()]
+        with self._diary_lock:
+            records = self.diary_db.all()
+        return [DiaryEntry.from_dict(e) for e in records]
+    
+    def get_diary_dates(self) -> Set[str]:
+        """Get the dates (YYYY-MM-DD) of all diary entries with content"""
+        with self._diary_lock:
+            if self._diary_dates is None:
+                # Read raw documents only; no DiaryEntry objects are built
+                self._diary_dates = {
+                    e["date"] for e in self.diary_db.all()
+                    if e.get("date") and e.get("content")
+                }
+            return set(self._diary_dates)
     
     # Social Book Management
     def save_person(self, person: Person) -> None:
@@ -108,6 +335,7 @@ class DataManager:
             self.social_db.update(person.to_dict(), Person_query.id == person.id)
         else:
             self.social_db.insert(person.to_dict())
+        self._notify_change("person", person.id)
     
     def get_person(self, person_id: str) -> Optional[Person]:
         """Get a person by ID"""
@@ -123,32 +351,162 @@ class DataManager:
         """Delete a person"""
         Person_query = Query()
         self.social_db.remove(Person_query.id == person_id)
+        self._notify_change("person", person_id)
     
     # Focus Session Management
     def save_focus_session(self, session: FocusSession) -> None:
         """Save a focus session"""
-        self.focus_db.insert(session.to_dict())
-    
-    def get_focus_stats(self) -> FocusStats:
-        """Get focus statistics"""
-        sessions = [FocusSession.from_dict(s) for s in self.focus_db.all()]
-        stats = FocusStats()
-        for session in sessions:
-            if session.completed:
-                stats.add_session(session)
+        aggregate = self._load_focus_aggregate()
+        doc_id = self.focus_db.insert(session.to_dict())
+        if self._focus_index is not None:
+            # Sessions are normally saved in start order, so this is an append
+            insort(self._focus_index, (session.start_time or "", doc_id))
+        
+        # Fold the session into the aggregate; only its day's rollup is written
+        day = self._add_to_focus_aggregate(aggregate, session)
+        bucket = aggregate["daily"][day]
+        if day in self._focus_day_ids:
+            self.focus_daily_db.update(bucket, doc_ids=[self._focus_day_ids[day]])
+        else:
+            self._focus_day_ids[day] = self.focus_daily_db.insert(dict(bucket, date=day))
+            insort(self._focus_days, day)
+    
+    def get_focus_stats(self, include_history: bool = False) -> FocusStats:
+        """Get focus statistics
+        
+        Totals come from the running aggregate; the per-session history is
+        only loaded when include_history is True.
+        """
+        aggregate = self._load_focus_aggregate()
+        stats = FocusStats(
+            total_sessions=aggregate["total_sessions"],
+            total_minutes=aggregate["total_minutes"],
+            total_points=aggregate["total_points"],
+            completed_sessions=aggregate["completed_sessions"],
+        )
+        if aggregate["recorded_sessions"]:
+            stats.completion_rate = aggregate["completed_sessions"] / aggregate["recorded_sessions"]
+        if include_history:
+            stats.sessions_history = [
+                s for s in (FocusSession.from_dict(r).to_dict() for r in self.focus_db.all())
+                if s["completed"]
+            ]
         return stats
     
+    def get_focus_daily_rollups(self, start: Optional[str] = None,
+                                end: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Get per-day focus buckets keyed by YYYY-MM-DD, for days in [start, end] (see FocusAnalytics)"""
+        daily = self._load_focus_aggregate()["daily"]
+        days = self._focus_days
+        first = bisect_left(days, start) if start else 0
+        last = bisect_right(days, end) if end else len(days)
+        return {day: dict(daily[day]) for day in days[first:last]}
+    
+    def get_focus_day_rollup(self, day: str) -> Optional[Dict[str, int]]:
+        """Get the focus bucket of one YYYY-MM-DD day, or None without sessions"""
+        bucket = self._load_focus_aggregate()["daily"].get(day)
+        return dict(bucket) if bucket is not None else None
+    
+    @staticmethod
+    def _empty_focus_aggregate() -> Dict[str, Any]:
+        """Create an empty running aggregate for focus sessions"""
+        return {
+            "total_sessions": 0,
+            "total_minutes": 0,
+            "total_points": 0,
+            "completed_sessions": 0,
+            "recorded_sessions": 0,
+            "daily": {},
+        }
+    
+    @staticmethod
+    def _add_to_focus_aggregate(aggregate: Dict[str, Any], session: FocusSession) -> str:
+        """Add one session to a running aggregate and return its day"""
+        minutes = session.actual_duration_seconds // 60
+        aggregate["recorded_sessions"] += 1
+        
+        day = (session.start_time or "")[:10]
+        bucket = aggregate["daily"].setdefault(
+            day, {"sessions": 0, "completed": 0, "minutes": 0, "points": 0}
+        )
+        bucket["sessions"] += 1
+        
+        # Totals only count completed sessions, matching FocusStats
+        if session.completed:
+            aggregate["total_sessions"] += 1
+            aggregate["completed_sessions"] += 1
+            aggregate["total_minutes"] += minutes
+            aggregate["total_points"] += session.points_earned
+            bucket["completed"] += 1
+            bucket["minutes"] += minutes
+            bucket["points"] += session.points_earned
+        return day
+    
+    @staticmethod
+    def _add_focus_bucket(aggregate: Dict[str, Any], day: str, bucket: Dict[str, int]) -> None:
+        """Add a stored day rollup to a running aggregate"""
+        aggregate["daily"][day] = bucket
+        aggregate["recorded_sessions"] += bucket["sessions"]
+        aggregate["total_sessions"] += bucket["completed"]
+        aggregate["completed_sessions"] += bucket["completed"]
+        aggregate["total_minutes"] += bucket["minutes"]
+        aggregate["total_points"] += bucket["points"]
+    
+    def _load_focus_aggregate(self) -> Dict[str, Any]:
+        """Get the running focus aggregate, rebuilding the day rollups if missing or stale"""
+        if self._focus_aggregate is None:
+            aggregate = self._empty_focus_aggregate()
+            day_ids = {}
+            for record in self.focus_daily_db.all():
+                bucket = {metric: record[metric] for metric in ("sessions", "completed", "minutes", "points")}
+                self._add_focus_bucket(aggregate, record["date"], bucket)
+                day_ids[record["date"]] = record.doc_id
+            
+            if aggregate["recorded_sessions"] != len(self.focus_db):
+                # First run with existing history (or an interrupted write):
+                # fold every session once
+                aggregate = self._empty_focus_aggregate()
+                for record in self.focus_db.all():
+                    self._add_to_focus_aggregate(aggregate, FocusSession.from_dict(record))
+                self.focus_daily_db.truncate()
+                days = list(aggregate["daily"])
+                doc_ids = self.focus_daily_db.insert_multiple(
+                    dict(aggregate["daily"][day], date=day) for day in days
+                )
+                day_ids = dict(zip(days, doc_ids))
+                # Older versions kept every day in a single aggregate document
+                if "aggregates" in self.focus_db.tables():
+                    self.focus_db.drop_table("aggregates")
+            self._focus_aggregate = aggregate
+            self._focus_day_ids = day_ids
+            self._focus_days = sorted(aggregate["daily"])
+        return self._focus_aggregate
+    
     def get_recent_focus_sessions(self, limit: int = 10) -> List[FocusSession]:
         """Get recent focus sessions"""
-        all_sessions = [FocusSession.from_dict(s) for s in self.focus_db.all()]
-        return sorted(all_sessions, key=lambda x: x.start_time, reverse=True)[:limit]
+        index = self._load_focus_index()
+        recent = index[-limit:] if limit > 0 else []
+        return [self._get_focus_session(doc_id) for _, doc_id in reversed(recent)]
     
     def get_focus_sessions_by_date(self, date: str) -> List[FocusSession]:
         """Get focus sessions for a specific date"""
-        all_sessions = [FocusSession.from_dict(s) for s in self.focus_db.all()]
-        # Filter sessions that started on the given date
-        sessions_on_date = [s for s in all_sessions if s.start_time and s.start_time.startswith(date)]
-        return sorted(sessions_on_date, key=lambda x: x.start_time)
+        index = self._load_focus_index()
+        # Sessions that started on the given date form one contiguous slice
+        start = bisect_left(index, (date,))
+        end = bisect_left(index, (date + "\uffff",))
+        return [self._get_focus_session(doc_id) for _, doc_id in index[start:end]]
+    
+    def _load_focus_index(self) -> List[tuple]:
+        """Get the start_time-ordered session index, sorting once on first use"""
+        if self._focus_index is None:
+            self._focus_index = sorted(
+                (record.get("start_time") or "", record.doc_id) for record in self.focus_db.all()
+            )
+        return self._focus_index
+    
+    def _get_focus_session(self, doc_id: int) -> FocusSession:
+        """Load one focus session by its document id"""
+        return FocusSession.from_dict(self.focus_db.get(doc_id=doc_id))
     
     # Chat History Management
     def save_chat_message(self, agent_name: str, role: str, content: str, 
@@ -197,21 +555,34 @@ class DataManager:
         )
     
     # Settings Management
+    def _load_settings_cache(self) -> Dict[str, Any]:
+        """Read all key/value setting records into a dictionary"""
+        return {
+            record['key']: _copy_json(record['value']) for record in self.settings_db.all()
+            if 'key' in record and 'value' in record
+        }
+    
     def save_setting(self, key: str, value: Any) -> None:
         """Save a setting"""
         Setting_query = Query()
-        existing = self.settings_db.search(Setting_query.key == key)
         data = {"key": key, "value": value}
-        if existing:
+        if key in self._settings_cache:
             self.settings_db.update(data, Setting_query.key == key)
         else:
             self.settings_db.insert(data)
+        # Keep a private copy so later changes by the caller don't leak in
+        self._settings_cache[key] = _copy_json(value)
+        self._notify_change("setting", key)
     
     def get_setting(self, key: str, default: Any = None) -> Any:
-        """Get a setting"""
-        Setting_query = Query()
-        result = self.settings_db.search(Setting_query.key == key)
-        return result[0]['value'] if result else default
+        """Get a setting
+        
+        Served from the in-memory cache. Lists and dicts are returned as
+        copies, so callers can modify them freely before saving them back.
+        """
+        if key not in self._settings_cache:
+            return default
+        return _copy_json(self._settings_cache[key])
     
     def get_all_settings(self) -> Dict[str, Any]:
         """Get all settings"""
@@ -224,29 +595,39 @@ class DataManager:
         for record in all_records:
             if 'key' in record and 'value' in record:
                 # New format
-                result[record['key']] = record['value']
+                result[record['key']] = _copy_json(record['value'])
             else:
                 # Old format - the record itself contains the settings
                 for key, value in record.items():
                     if key not in ['doc_id']:  # Skip TinyDB metadata
-                        result[key] = value
+                        result[key] = _copy_json(value)
         
         return result
     
     def clear_all_data(self):
         """Clear all application data (for testing/reset purposes)"""
         # Clear all databases
-        self.tasks_db.truncate()
-        self.diary_db.truncate()
+        with self._task_lock:
+            self.tasks_db.truncate()
+            self._task_map = None
+        with self._diary_lock:
+            self.diary_db.truncate()
         self.social_db.truncate()
         self.focus_db.truncate()
+        self.focus_daily_db.truncate()
+        self._focus_aggregate = None
+        self._focus_day_ids = {}
+        self._focus_days = []
+        self._focus_index = None
         self.chat_db.truncate()
+        self._diary_dates = None
         
         # Clear settings but keep API keys and preferences
         # (or clear everything - user's choice)
         # For now, we'll clear everything except API keys
         all_settings = self.get_all_settings()
         self.settings_db.truncate()
+        self._settings = {}
         
         # Restore only API keys if they exist
         if "gemini_api_key" in all_settings:
@@ -258,4 +639,5 @@ class DataManager:
         self.save_setting("todolists", [])
         self.save_setting("user_points", 0)
         self.save_setting("user_stickers", {})
+        self._notify_change("reset", None)
 
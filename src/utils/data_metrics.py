@@ -0,0 +1,201 @@
+"""Opt-in operation metrics for DataManager: call latencies, scans and writes"""
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, Any
+import json
+import threading
+import time
+
+from tinydb.table import Table
+
+
+class LatencyHistogram:
+    """Call latencies bucketed on fixed millisecond bounds"""
+
+    BOUNDS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self):
+        self.buckets = [0] * (len(self.BOUNDS_MS) + 1)  # last bucket: above every bound
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        self.buckets[bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of calls"""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for i, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return min(self.BOUNDS_MS[i], self.max_ms) if i < len(self.BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max_ms,
+            "buckets": dict(zip([f"<={bound}" for bound in self.BOUNDS_MS] + [f">{self.BOUNDS_MS[-1]}"],
+                                self.buckets)),
+        }
+
+
+class DataMetrics:
+    """Counters for DataManager methods and the stores beneath them
+
+    Method calls are recorded by DataManager.enable_metrics(), which wraps
+    its public methods on the instance; the storages report whole-file
+    writes, journal appends and compactions, and MeteredTable reports every
+    query that walks a whole table. Nothing is recorded (or wrapped) until
+    enabled, so the disabled cost is an attribute check per query or write.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far"""
+        with self._lock:
+            self.started_at = datetime.now()
+            self.methods = {}  # method name -> {"errors": n, "latency": LatencyHistogram}
+            self.stores = {}  # file name -> counters
+
+    def _store(self, store: str) -> Dict[str, int]:
+        counters = self.stores.get(store)
+        if counters is None:
+            counters = self.stores[store] = {
+                "scans": 0, "rows_scanned": 0, "full_writes": 0,
+                "appends": 0, "compactions": 0, "bytes_written": 0,
+            }
+        return counters
+
+    def record_call(self, method: str, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            entry = self.methods.get(method)
+            if entry is None:
+                entry = self.methods[method] = {"errors": 0, "latency": LatencyHistogram()}
+            entry["latency"].record(seconds * 1000)
+            if failed:
+                entry["errors"] += 1
+
+    def record_scan(self, store: str, rows: int) -> None:
+        with self._lock:
+            counters = self._store(store)
+            counters["scans"] += 1
+            counters["rows_scanned"] += rows
+
+    def record_write(self, store: str, nbytes: int, kind: str = "full_writes") -> None:
+        """Count bytes written to a store; kind is full_writes, appends or compactions"""
+        with self._lock:
+            counters = self._store(store)
+            counters[kind] += 1
+            counters["bytes_written"] += nbytes
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Everything recorded, as JSON-ready data"""
+        with self._lock:
+            return {
+                "started_at": self.started_at.isoformat(),
+                "taken_at": datetime.now().isoformat(),
+                "methods": {
+                    name: dict(entry["latency"].to_dict(), errors=entry["errors"])
+                    for name, entry in sorted(self.methods.items())
+                },
+                "stores": {name: dict(counters) for name, counters in sorted(self.stores.items())},
+            }
+
+    def dump(self, path: str) -> None:
+        """Write snapshot() as JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+    def summary(self) -> str:
+        """Format the snapshot as two tables"""
+        data = self.snapshot()
+        lines = [f"{'method':<34}{'calls':>7}{'mean ms':>10}{'p95 ms':>9}{'max ms':>9}{'errors':>8}"]
+        for name, m in sorted(data["methods"].items(), key=lambda item: -item[1]["count"] * item[1]["mean_ms"]):
+            lines.append(f"{name:<34}{m['count']:>7}{m['mean_ms']:>10.3f}{m['p95_ms']:>9.2f}"
+                         f"{m['max_ms']:>9.2f}{m['errors']:>8}")
+        lines.append("")
+        lines.append(f"{'store':<24}{'scans':>7}{'rows':>10}{'writes':>8}{'appends':>9}{'KiB written':>13}")
+        for name, s in data["stores"].items():
+            lines.append(f"{name:<24}{s['scans']:>7}{s['rows_scanned']:>10}{s['full_writes']:>8}"
+                         f"{s['appends']:>9}{s['bytes_written'] / 1024:>13.1f}")
+        return "\n".join(lines)
+
+
+def metered(metrics: DataMetrics, name: str, method):
+    """Wrap a bound method so each call is timed into metrics"""
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = method(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            metrics.record_call(name, time.perf_counter() - start, failed)
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    wrapper.__wrapped__ = method
+    return wrapper
+
+
+class MeteredTable(Table):
+    """TinyDB table that reports queries walking the whole table
+
+    Reporting goes to the `metrics` attribute of the table's storage, which
+    is None unless metrics are enabled. Lookups by doc id, inserts and
+    cached search results don't scan and aren't counted.
+    """
+
+    def _record_scan(self, metrics) -> None:
+        metrics.record_scan(self._storage.path.name, len(self._read_table()))
+
+    def search(self, cond):
+        metrics = getattr(self._storage, "metrics", None)
+        if metrics is not None and self._query_cache.get(cond) is None:
+            self._record_scan(metrics)
+        return super().search(cond)
+
+    def __iter__(self):
+        # all() iterates the table
+        metrics = getattr(self._storage, "metrics", None)
+        if metrics is not None:
+            self._record_scan(metrics)
+        return super().__iter__()
+
+    def get(self, cond=None, doc_id=None, doc_ids=None):
+        metrics = getattr(self._storage, "metrics", None)
+        if metrics is not None and cond is not None and doc_id is None and doc_ids is None:
+            self._record_scan(metrics)
+        return super().get(cond, doc_id, doc_ids)
+
+    def update(self, fields, cond=None, doc_ids=None):
+        metrics = getattr(self._storage, "metrics", None)
+        if metrics is not None and cond is not None and doc_ids is None:
+            self._record_scan(metrics)
+        return super().update(fields, cond, doc_ids)
+
+    def remove(self, cond=None, doc_ids=None):
+        metrics = getattr(self._storage, "metrics", None)
+        if metrics is not None and cond is not None and doc_ids is None:
+            self._record_scan(metrics)
+        return super().remove(cond, doc_ids)
+
+
+# Process-wide metrics; DataManager instances record into it once enabled
+data_metrics = DataMetrics()
@@ -0,0 +1,105 @@
+"""Focus analytics over precomputed per-day rollups"""
+from typing import List, Dict, Any, Union
+from datetime import date, datetime, timedelta
+
+
+DateLike = Union[str, date, datetime]
+
+METRICS = ("sessions", "completed", "minutes", "points")
+
+
+def _to_date(value: DateLike) -> date:
+    """Convert a YYYY-MM-DD string, date or datetime to a date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value[:10], "%Y-%m-%d").date()
+
+
+def _empty_bucket() -> Dict[str, Any]:
+    """Create a zeroed rollup bucket"""
+    return {metric: 0 for metric in METRICS}
+
+
+def _add_bucket(total: Dict[str, Any], bucket: Dict[str, Any]) -> None:
+    """Add one bucket's counters into another"""
+    for metric in METRICS:
+        total[metric] += bucket.get(metric, 0)
+
+
+def _with_completion(bucket: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the completion rate to a bucket"""
+    bucket["completion_rate"] = bucket["completed"] / bucket["sessions"] if bucket["sessions"] else 0.0
+    return bucket
+
+
+class FocusAnalytics:
+    """Daily, weekly and monthly focus rollups
+
+    Reads the per-day buckets DataManager maintains on every saved
+    session, so queries never load raw FocusSession records.
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+
+    def _daily_buckets(self, start: date, end: date) -> Dict[str, Dict[str, int]]:
+        """Stored buckets of the days in [start, end]"""
+        return self.data_manager.get_focus_daily_rollups(start.isoformat(), end.isoformat())
+
+    def day(self, day: DateLike) -> Dict[str, Any]:
+        """Get the rollup for a single day"""
+        bucket = _empty_bucket()
+        _add_bucket(bucket, self.data_manager.get_focus_day_rollup(_to_date(day).isoformat()) or {})
+        return _with_completion(bucket)
+
+    def daily(self, start: DateLike, end: DateLike) -> List[Dict[str, Any]]:
+        """Get one rollup per day in [start, end], including empty days"""
+        current, last = _to_date(start), _to_date(end)
+        buckets = self._daily_buckets(current, last)
+        result = []
+        while current <= last:
+            key = current.isoformat()
+            bucket = _empty_bucket()
+            _add_bucket(bucket, buckets.get(key, {}))
+            bucket["date"] = key
+            result.append(_with_completion(bucket))
+            current += timedelta(days=1)
+        return result
+
+    def range_totals(self, start: DateLike, end: DateLike) -> Dict[str, Any]:
+        """Sum all rollups in [start, end]"""
+        total = _empty_bucket()
+        for bucket in self._daily_buckets(_to_date(start), _to_date(end)).values():
+            _add_bucket(total, bucket)
+        return _with_completion(total)
+
+    def weekly(self, start: DateLike, end: DateLike) -> List[Dict[str, Any]]:
+        """Get rollups per week (Monday start) overlapping [start, end]"""
+        weeks = {}
+        for bucket in self.daily(start, end):
+            day = _to_date(bucket["date"])
+            week_start = (day - timedelta(days=day.weekday())).isoformat()
+            _add_bucket(weeks.setdefault(week_start, _empty_bucket()), bucket)
+        return [_with_completion(dict(bucket, week_start=key)) for key, bucket in weeks.items()]
+
+    def monthly(self, start: DateLike, end: DateLike) -> List[Dict[str, Any]]:
+        """Get rollups per calendar month overlapping [start, end]"""
+        months = {}
+        for bucket in self.daily(start, end):
+            month = bucket["date"][:7]
+            _add_bucket(months.setdefault(month, _empty_bucket()), bucket)
+        return [_with_completion(dict(bucket, month=key)) for key, bucket in months.items()]
+
+    def year_heatmap(self, year: int, metric: str = "minutes") -> List[int]:
+        """Get one value per day of the year (Jan 1 first), ready for a heatmap"""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown focus metric: {metric}")
+        current, last = date(year, 1, 1), date(year, 12, 31)
+        buckets = self._daily_buckets(current, last)
+        values = []
+        while current <= last:
+            values.append(buckets.get(current.isoformat(), {}).get(metric, 0))
+            current += timedelta(days=1)
+        return values
@@ -0,0 +1,225 @@
+"""In-memory search index for @ mentions"""
+from typing import List, Dict, Any, Optional, Set, Tuple
+from bisect import bisect_left, insort
+import heapq
+import threading
+
+
+TASK_CATEGORIES = ["today_must", "future_date", "long_term", "someday_maybe"]
+
+
+def _trigrams(text: str) -> Set[str]:
+    """All three-character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _is_subsequence(query: str, text: str) -> bool:
+    """Whether all characters of query appear in text, in order"""
+    chars = iter(text)
+    return all(char in chars for char in query)
+
+
+class MentionIndex:
+    """Prefix and trigram index over tasks, todo lists and people
+
+    Built from the DataManager on first search and then kept current
+    through its change listeners, so typing a mention never rescans the
+    databases. Results are ranked prefix > substring > fuzzy (characters
+    in order), and each tier is only searched while the limit is not yet
+    reached.
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self._lock = threading.RLock()
+        self._items = None  # (type, id) -> completion item
+        self._order = {}  # (type, id) -> rank of the item in the default listing
+        self._ordered = []  # sorted (rank, key) pairs: the default listing
+        self._names = []  # sorted (lowercase name, key) pairs for prefix lookup
+        self._indexed_name = {}  # (type, id) -> lowercase name the item was indexed under
+        self._trigram_postings = {}  # trigram -> keys of items whose name contains it
+        self._next_order = 0
+
+        data_manager.add_change_listener(self.on_data_changed)
+
+    def close(self):
+        """Stop following data changes"""
+        self.data_manager.remove_change_listener(self.on_data_changed)
+
+    # Building
+    @staticmethod
+    def _task_item(task) -> Dict[str, Any]:
+        return {
+            'type': 'task',
+            'id': task.id,
+            'display': f"📋 {task.title}",
+            'completion': f"task:{task.id}",
+            'data': task
+        }
+
+    @staticmethod
+    def _todolist_item(todolist) -> Dict[str, Any]:
+        return {
+            'type': 'todolist',
+            'id': todolist['id'],
+            'display': f"📚 {todolist.get('name', 'Unnamed')}",
+            'completion': f"todolist:{todolist['id']}",
+            'data': todolist
+        }
+
+    @staticmethod
+    def _person_item(person) -> Dict[str, Any]:
+        return {
+            'type': 'person',
+            'id': person.id,
+            'display': f"👤 {person.name}",
+            'completion': f"person:{person.id}",
+            'data': person
+        }
+
+    @staticmethod
+    def _item_name(item) -> str:
+        data = item['data']
+        if item['type'] == 'task':
+            return data.title
+        if item['type'] == 'todolist':
+            return data.get('name', '')
+        return data.name
+
+    def _load(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Get the indexed items, building the index on first use"""
+        with self._lock:
+            if self._items is None:
+                self._items = {}
+                self._order = {}
+                self._ordered = []
+                self._names = []
+                self._indexed_name = {}
+                self._trigram_postings = {}
+                self._next_order = 0
+
+                # Same order as the unfiltered popup: tasks, todo lists, people
+                for category in TASK_CATEGORIES:
+                    for task in self.data_manager.get_tasks_by_category(category):
+                        self._add(self._task_item(task))
+                self._add_todolists()
+                try:
+                    for person in self.data_manager.get_all_people():
+                        self._add(self._person_item(person))
+                except Exception as e:
+                    print(f"Error getting people for mentions: {e}")
+            return self._items
+
+    def _add_todolists(self):
+        for todolist in self.data_manager.get_setting("todolists", []):
+            self._add(self._todolist_item(todolist))
+
+    def _add(self, item, order: Optional[int] = None):
+        key = (item['type'], item['id'])
+        name = self._item_name(item).lower()
+        if order is None:
+            order = self._next_order
+            self._next_order += 1
+        self._items[key] = item
+        self._order[key] = order
+        self._indexed_name[key] = name
+        insort(self._ordered, (order, key))
+        insort(self._names, (name, key))
+        for trigram in _trigrams(name):
+            self._trigram_postings.setdefault(trigram, set()).add(key)
+
+    def _remove(self, key) -> Optional[int]:
+        """Remove an item and return its order, or None if it was not indexed"""
+        item = self._items.pop(key, None)
+        if item is None:
+            return None
+        # Items share objects with the DataManager, which may have been edited in place
+        name = self._indexed_name.pop(key)
+        index = bisect_left(self._names, (name, key))
+        if index < len(self._names) and self._names[index] == (name, key):
+            del self._names[index]
+        for trigram in _trigrams(name):
+            postings = self._trigram_postings.get(trigram)
+            if postings:
+                postings.discard(key)
+                if not postings:
+                    del self._trigram_postings[trigram]
+        order = self._order.pop(key)
+        index = bisect_left(self._ordered, (order, key))
+        if index < len(self._ordered) and self._ordered[index] == (order, key):
+            del self._ordered[index]
+        return order
+
+    def on_data_changed(self, kind: str, key: Optional[str]):
+        """Apply a DataManager change to the index"""
+        with self._lock:
+            if self._items is None:
+                return  # Not built yet; the first search reads current data
+
+            if kind == "task":
+                order = self._remove(("task", key))
+                task = self.data_manager.get_task(key)
+                if task and task.category in TASK_CATEGORIES:
+                    self._add(self._task_item(task), order)
+            elif kind == "person":
+                order = self._remove(("person", key))
+                person = self.data_manager.get_person(key)
+                if person:
+                    self._add(self._person_item(person), order)
+            elif kind == "setting" and key == "todolists":
+                for item_key in [k for k in self._items if k[0] == "todolist"]:
+                    self._remove(item_key)
+                self._add_todolists()
+            elif kind == "reset":
+                self._items = None
+
+    # Searching
+    def search(self, query: str, limit: int = 15) -> List[Dict[str, Any]]:
+        """Get up to limit completion items matching query, best matches first"""
+        query = query.strip().lower()
+        with self._lock:
+            items = self._load()
+            if not query:
+                return [items[key] for _, key in self._ordered[:limit]]
+
+            order = self._order
+            names = self._names
+            results = []
+
+            def take(keys) -> bool:
+                """Append the first keys in default order; True once the limit is reached"""
+                for key in heapq.nsmallest(limit - len(results), keys, key=order.__getitem__):
+                    results.append(items[key])
+                return len(results) >= limit
+
+            # 1. Names starting with the query (exact matches first)
+            exact, prefixed = [], []
+            index = bisect_left(names, (query,))
+            while index < len(names) and names[index][0].startswith(query):
+                name, key = names[index]
+                (exact if name == query else prefixed).append(key)
+                index += 1
+            if take(exact) or take(prefixed):
+                return results
+            seen = set(exact) | set(prefixed)
+
+            # 2. Names containing the query, then 3. fuzzy matches (characters in order),
+            # in one pass over the default listing that stops once the limit is filled
+            candidates = None  # keys whose names contain all of the query's trigrams
+            if len(query) >= 3:
+                postings = sorted((self._trigram_postings.get(t, set()) for t in _trigrams(query)), key=len)
+                candidates = set.intersection(*postings) if postings[0] else set()
+            remaining = limit - len(results)
+            containing, fuzzy = [], []
+            for _, key in self._ordered:
+                if key in seen:
+                    continue
+                name = self._indexed_name[key]
+                if (candidates is None or key in candidates) and query in name:
+                    containing.append(key)
+                    if len(containing) >= remaining:
+                        break
+                elif len(fuzzy) < remaining and _is_subsequence(query, name):
+                    fuzzy.append(key)
+            results.extend(items[key] for key in (containing + fuzzy)[:remaining])
+            return results
@@ -0,0 +1,311 @@
+"""Rotation, compaction and indexing of railtracks session logs"""
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+
+
+def railtracks_home() -> Path:
+    """The .railtracks directory railtracks writes to
+
+    Mirrors railtracks.paths.resolve_railtracks_home without importing
+    railtracks, which the app loads only when an agent is first used:
+    RAILTRACKS_HOME/.railtracks if set, else the nearest existing
+    .railtracks in the working directory or its parents, else
+    ./.railtracks.
+    """
+    env = os.environ.get("RAILTRACKS_HOME")
+    if env:
+        return Path(env).absolute() / ".railtracks"
+    current = Path.cwd()
+    for directory in [current, *current.parents]:
+        candidate = directory / ".railtracks"
+        if candidate.is_dir():
+            return candidate
+    return current / ".railtracks"
+
+
+class SessionLogManager:
+    """Keeps the .railtracks directory small and searchable
+
+    railtracks saves every session as a JSON file (with the full system
+    prompt and message list of each model call), plus an event log in newer
+    versions. This manager:
+
+    - indexes each session once in index.jsonl (id, time, agent, latency,
+      tokens, where it is stored), so lookups don't open every file;
+    - rotates sessions older than max_age_days, or the oldest ones while raw
+      files exceed max_bytes, into gzip archives in archive/. An archive's
+      first line maps prompt hashes to system prompts, which sessions then
+      reference instead of repeating the text;
+    - deletes archives older than archive_max_age_days.
+
+    Files changed in the last SETTLE_SECONDS may still be written by a
+    running session and are left alone.
+    """
+
+    INDEX_NAME = "index.jsonl"
+    ARCHIVE_DIR = "archive"
+    SETTLE_SECONDS = 60
+
+    def __init__(self, root=None, max_age_days: int = 7, max_bytes: int = 20 * 1024 * 1024,
+                 archive_max_age_days: int = 90):
+        self.root = Path(root).absolute() if root is not None else railtracks_home()
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+        self.archive_max_age_days = archive_max_age_days
+        self._lock = threading.Lock()
+        self._index = None  # session id -> index row
+
+    # Locating raw session files
+
+    def _session_files(self) -> Dict[str, Path]:
+        """Session id -> session JSON for both railtracks layouts"""
+        files = {}
+        # Older railtracks: .railtracks/<session id>.json
+        for path in self.root.glob("*.json"):
+            files[path.stem] = path
+        # Newer railtracks: .railtracks/data/sessions/_<session id>.json
+        for path in (self.root / "data" / "sessions").glob("*.json"):
+            files[path.stem.lstrip("_")] = path
+        return files
+
+    def _event_file(self, session_id: str) -> Path:
+        return self.root / "data" / "events" / f"{session_id}.jsonl"
+
+    # Index
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / self.INDEX_NAME
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if self._index is None:
+            self._index = {}
+            if self.index_path.exists():
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            row = json.loads(line)
+                        except ValueError:
+                            continue
+                        self._index[row["id"]] = row
+        return self._index
+
+    def _save_index(self) -> None:
+        temp_path = self.index_path.with_name(self.INDEX_NAME + ".tmp")
+        rows = sorted(self._index.values(), key=lambda row: row["time"])
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, separators=(",", ":")) + "\n")
+        os.replace(temp_path, self.index_path)
+
+    @staticmethod
+    def summarize(session: Dict[str, Any]) -> Dict[str, Any]:
+        """Index row for a parsed session"""
+        start, end = session.get("start_time"), session.get("end_time")
+        runs = session.get("runs") or []
+        input_tokens = output_tokens = llm_calls = 0
+        for run in runs:
+            for node in run.get("nodes") or []:
+                internals = (node.get("details") or {}).get("internals") or {}
+                for call in internals.get("llm_details") or []:
+                    llm_calls += 1
+                    input_tokens += call.get("input_tokens") or 0
+                    output_tokens += call.get("output_tokens") or 0
+        return {
+            "id": session.get("session_id"),
+            "time": datetime.fromtimestamp(start).isoformat(timespec="seconds") if start else "",
+            "agent": runs[0].get("name") if runs else None,
+            "status": runs[0].get("status") if runs else None,
+            "latency_s": round(end - start, 3) if start and end else None,
+            "llm_calls": llm_calls,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+        }
+
+    def update_index(self) -> int:
+        """Index raw sessions not indexed yet; returns how many were added"""
+        index = self._load_index()
+        settled = time.time() - self.SETTLE_SECONDS
+        files = self._session_files()
+        # Forget raw sessions whose files were deleted by hand
+        removed = [sid for sid, row in index.items() if "archive" not in row and sid not in files]
+        for session_id in removed:
+            del index[session_id]
+        added = 0
+        for session_id, path in files.items():
+            if session_id in index or path.stat().st_mtime > settled:
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    session = json.load(f)
+            except (ValueError, OSError) as e:
+                print(f"Error reading session log {path.name}: {e}")
+                continue
+            row = self.summarize(session)
+            row["id"] = session_id
+            row["file"] = str(path.relative_to(self.root))
+            row["bytes"] = path.stat().st_size + self._event_bytes(session_id)
+            index[session_id] = row
+            added += 1
+        if added or removed:
+            self._save_index()
+        return added
+
+    def _event_bytes(self, session_id: str) -> int:
+        event_file = self._event_file(session_id)
+        return event_file.stat().st_size if event_file.exists() else 0
+
+    def sessions(self, since: Optional[datetime] = None, agent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Index rows, oldest first, optionally filtered by start time and agent"""
+        with self._lock:
+            rows = list(self._load_index().values())
+        cutoff = since.isoformat() if since else ""
+        return sorted((row for row in rows if row["time"] >= cutoff and (agent is None or row["agent"] == agent)),
+                      key=lambda row: row["time"])
+
+    def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """The full session, from its raw file or its archive"""
+        with self._lock:
+            row = self._load_index().get(session_id)
+        if row is None:
+            return None
+        if "archive" not in row:
+            with open(self.root / row["file"], "r", encoding="utf-8") as f:
+                return json.load(f)
+        with gzip.open(self.root / self.ARCHIVE_DIR / row["archive"], "rt", encoding="utf-8") as f:
+            prompts = json.loads(f.readline())["prompts"]
+            for line in f:
+                record = json.loads(line)
+                if record["session"].get("session_id") == session_id:
+                    return self._restore_prompts(record["session"], prompts)
+        return None
+
+    # Compaction
+
+    @staticmethod
+    def _system_messages(session: Dict[str, Any]):
+        for run in session.get("runs") or []:
+            for node in run.get("nodes") or []:
+                internals = (node.get("details") or {}).get("internals") or {}
+                for call in internals.get("llm_details") or []:
+                    for message in call.get("input") or []:
+                        if message.get("role") == "system":
+                            yield message
+
+    def _dedupe_prompts(self, session: Dict[str, Any], prompts: Dict[str, str]) -> Dict[str, Any]:
+        """Replace system prompt texts with {"prompt": hash}, collecting texts in prompts"""
+        for message in self._system_messages(session):
+            content = message.get("content")
+            if isinstance(content, str):
+                digest = hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+                prompts[digest] = content
+                message["content"] = {"prompt": digest}
+        return session
+
+    def _restore_prompts(self, session: Dict[str, Any], prompts: Dict[str, str]) -> Dict[str, Any]:
+        for message in self._system_messages(session):
+            content = message.get("content")
+            if isinstance(content, dict) and "prompt" in content:
+                message["content"] = prompts.get(content["prompt"], "")
+        return session
+
+    def _sessions_to_rotate(self) -> List[Dict[str, Any]]:
+        """Raw sessions over the age limit, then the oldest ones over the size budget"""
+        raw = sorted((row for row in self._load_index().values() if "archive" not in row),
+                     key=lambda row: row["time"])
+        cutoff = (datetime.now() - timedelta(days=self.max_age_days)).isoformat()
+        total = sum(row.get("bytes", 0) for row in raw)
+        rotate = []
+        for row in raw:
+            if row["time"] < cutoff or total > self.max_bytes:
+                rotate.append(row)
+                total -= row.get("bytes", 0)
+        return rotate
+
+    def compact(self) -> int:
+        """Move rotated sessions into a new archive; returns how many were moved"""
+        rows = self._sessions_to_rotate()
+        if not rows:
+            return 0
+
+        archive_dir = self.root / self.ARCHIVE_DIR
+        archive_dir.mkdir(exist_ok=True)
+        # Unique even for compactions in the same second or from another process
+        name = f"sessions-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{uuid.uuid4().hex[:8]}.jsonl.gz"
+        prompts = {}
+        records = []
+        for row in rows:
+            try:
+                with open(self.root / row["file"], "r", encoding="utf-8") as f:
+                    session = json.load(f)
+                events = []
+                event_file = self._event_file(row["id"])
+                if event_file.exists():
+                    with open(event_file, "r", encoding="utf-8") as f:
+                        events = [json.loads(line) for line in f if line.strip()]
+            except (ValueError, OSError) as e:
+                print(f"Error reading session log {row['file']}: {e}")
+                continue
+            records.append((row, {"session": self._dedupe_prompts(session, prompts), "events": events}))
+
+        # Write the archive completely before touching the index or raw files
+        temp_path = archive_dir / (name + ".tmp")
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"prompts": prompts}) + "\n")
+            for _, record in records:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        os.replace(temp_path, archive_dir / name)
+
+        for row, _ in records:
+            row["archive"] = name
+            file = row.pop("file")
+            (self.root / file).unlink(missing_ok=True)
+            self._event_file(row["id"]).unlink(missing_ok=True)
+        self._save_index()
+        return len(records)
+
+    def expire_archives(self) -> int:
+        """Delete archives older than archive_max_age_days with their index rows"""
+        archive_dir = self.root / self.ARCHIVE_DIR
+        cutoff = time.time() - self.archive_max_age_days * 86400
+        expired = {path.name for path in archive_dir.glob("*.jsonl.gz") if path.stat().st_mtime < cutoff}
+        if not expired:
+            return 0
+        index = self._load_index()
+        for session_id in [sid for sid, row in index.items() if row.get("archive") in expired]:
+            del index[session_id]
+        self._save_index()
+        for name in expired:
+            (archive_dir / name).unlink()
+        return len(expired)
+
+    def maintain(self) -> Dict[str, int]:
+        """Index, rotate and expire; returns the counts of each step"""
+        if not self.root.is_dir():
+            return {"indexed": 0, "archived": 0, "expired_archives": 0}
+        with self._lock:
+            return {
+                "indexed": self.update_index(),
+                "archived": self.compact(),
+                "expired_archives": self.expire_archives(),
+            }
+
+    def maintain_in_background(self) -> threading.Thread:
+        """Run maintain() on a daemon thread"""
+        def run():
+            try:
+                self.maintain()
+            except Exception as e:
+                print(f"Error maintaining session logs: {e}")
+
+        thread = threading.Thread(target=run, name="session-log-maintenance", daemon=True)
+        thread.start()
+        return thread
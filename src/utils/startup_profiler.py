@@ -0,0 +1,94 @@
+"""Startup tracing: named spans and marks from launch to interactive"""
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+import json
+import os
+import threading
+import time
+
+
+class StartupProfiler:
+    """Records named, nestable timing spans during startup
+
+    Disabled by default, in which case span() and mark() cost one
+    attribute check. Times are relative to the origin passed to enable(),
+    normally the perf_counter() value main.py takes as its first statement.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.spans = []  # (name, start_s, duration_s, depth, thread id)
+        self.marks = []  # (name, time_s)
+        self._depth = threading.local()
+
+    def enable(self, origin: Optional[float] = None):
+        """Start recording spans and marks, timed from origin (a perf_counter() value)"""
+        if origin is not None:
+            self.origin = origin
+        self.enabled = True
+
+    def now(self) -> float:
+        """Seconds since the profiler origin"""
+        return time.perf_counter() - self.origin
+
+    @contextmanager
+    def span(self, name: str):
+        """Record the time spent in a with-block"""
+        if not self.enabled:
+            yield
+            return
+
+        depth = getattr(self._depth, "value", 0)
+        self._depth.value = depth + 1
+        start = self.now()
+        try:
+            yield
+        finally:
+            self._depth.value = depth
+            self.spans.append((name, start, self.now() - start, depth, threading.get_ident()))
+
+    def mark(self, name: str):
+        """Record an instant such as first paint"""
+        if self.enabled:
+            self.marks.append((name, self.now()))
+
+    def mark_time(self, name: str) -> Optional[float]:
+        """Seconds from origin to the first mark with this name"""
+        return next((t for mark, t in self.marks if mark == name), None)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Build a Chrome trace (chrome://tracing, Perfetto) of the recording"""
+        pid = os.getpid()
+        events = [
+            {"name": name, "ph": "X", "ts": start * 1e6, "dur": duration * 1e6,
+             "pid": pid, "tid": tid, "cat": "startup"}
+            for name, start, duration, _, tid in self.spans
+        ]
+        events.extend(
+            {"name": name, "ph": "i", "ts": t * 1e6, "pid": pid,
+             "tid": threading.main_thread().ident, "s": "g", "cat": "startup"}
+            for name, t in self.marks
+        )
+        events.sort(key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def summary(self) -> str:
+        """Format spans and marks as a table in start order"""
+        rows = [(start, f"{'  ' * depth}{name}", f"{duration * 1000:10.1f}")
+                for name, start, duration, depth, _ in self.spans]
+        rows.extend((t, f"* {name}", f"{'':>10}") for name, t in self.marks)
+        rows.sort(key=lambda row: row[0])
+
+        lines = [f"{'start ms':>10}  {'dur ms':>10}  span", "-" * 60]
+        lines.extend(f"{start * 1000:10.1f}  {duration}  {label}" for start, label, duration in rows)
+        return "\n".join(lines)
+
+    def write_trace(self, path: str):
+        """Write the Chrome trace JSON to path"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, indent=1)
+
+
+# Process-wide profiler used by main.py and the startup code paths
+startup_profiler = StartupProfiler()
@@ -0,0 +1,449 @@
+"""Crash-safe JSON storage engines for TinyDB"""
+from tinydb.storages import Storage
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from pathlib import Path
+import json
+import os
+import threading
+import weakref
+
+
+TEMP_SUFFIX = ".tmp"
+JOURNAL_SUFFIX = ".journal"
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename by syncing the containing directory (POSIX only)"""
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _load_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Parse a JSON store; returns None for an empty file, raises if corrupt"""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    if not text.strip():
+        return None
+    return json.loads(text)
+
+
+def _copy_doc(value: Any) -> Any:
+    """Copy a JSON document, including TrackedDicts, as plain dicts and lists"""
+    if isinstance(value, dict):
+        return {k: _copy_doc(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_doc(v) for v in value]
+    return value
+
+
+def _quarantine(path: Path) -> Path:
+    """Move a corrupt file aside so it can be inspected later"""
+    target = path.with_name(f"{path.name}.corrupt-{datetime.now().strftime('%Y%m%d%H%M%S')}")
+    os.replace(path, target)
+    return target
+
+
+def recover_storage(data_dir) -> List[str]:
+    """Repair JSON stores after an interrupted write
+
+    A leftover temp file means the process stopped while replacing a
+    store. If the store itself is unreadable but the temp file is complete,
+    the temp file is promoted; otherwise it is discarded. Returns a list of
+    human-readable actions taken.
+    """
+    actions = []
+    for temp_path in Path(data_dir).glob(f"*.json{TEMP_SUFFIX}"):
+        path = temp_path.with_suffix("")
+        try:
+            if path.exists():
+                _load_json(path)
+            else:
+                raise FileNotFoundError(path)
+        except (ValueError, OSError):
+            try:
+                _load_json(temp_path)
+                os.replace(temp_path, path)
+                actions.append(f"Restored {path.name} from an unfinished write")
+                continue
+            except (ValueError, OSError):
+                if path.exists():
+                    actions.append(f"Moved corrupt {path.name} to {_quarantine(path).name}")
+        if temp_path.exists():
+            temp_path.unlink()
+            actions.append(f"Removed stale {temp_path.name}")
+    
+    # An unfinished journal rewrite leaves the original journal intact
+    for temp_path in Path(data_dir).glob(f"*.json{JOURNAL_SUFFIX}{TEMP_SUFFIX}"):
+        temp_path.unlink()
+        actions.append(f"Removed stale {temp_path.name}")
+    return actions
+
+
+class AtomicJSONStorage(Storage):
+    """TinyDB storage that never leaves a half-written file behind
+
+    Every write goes to a temp file in the same directory which then
+    atomically replaces the store with os.replace(), so a crash leaves
+    either the old or the new version. With fsync enabled the temp file
+    (and the directory entry) are flushed to disk before and after the
+    rename. The parsed data is kept in memory, as this process is the
+    store's only writer, so reads don't re-parse the file.
+    """
+
+    def __init__(self, path, fsync: bool = True, **kwargs):
+        super().__init__()
+        self.path = Path(path)
+        self.temp_path = self.path.with_name(self.path.name + TEMP_SUFFIX)
+        self.fsync = fsync
+        self.kwargs = kwargs
+        self.metrics = None  # DataMetrics receiving write counts, when enabled
+        self._data = None
+        self._loaded = False
+
+        if not self.path.exists():
+            self.path.touch()
+
+    def read(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        if not self._loaded:
+            try:
+                self._data = _load_json(self.path)
+            except ValueError:
+                # Truncated by an older in-place writer: keep a copy, start empty
+                moved = _quarantine(self.path)
+                print(f"Warning: {self.path.name} was corrupt and has been moved to {moved.name}")
+                self.path.touch()
+                self._data = None
+            self._loaded = True
+        return self._data
+
+    def write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        serialized = json.dumps(data, **self.kwargs)
+        try:
+            with open(self.temp_path, "w", encoding="utf-8") as f:
+                f.write(serialized)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            os.replace(self.temp_path, self.path)
+            if self.fsync:
+                _fsync_dir(self.path.parent)
+            if self.metrics is not None:
+                self.metrics.record_write(self.path.name, len(serialized.encode("utf-8")))
+        except OSError:
+            # Our cached copy may no longer match the file; reload next time
+            self._loaded = False
+            raise
+        self._data = data
+        self._loaded = True
+
+    def close(self) -> None:
+        pass
+
+
+class TrackedDict(dict):
+    """Document dict that remembers whether it was modified in place"""
+
+    __slots__ = ("dirty",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty = False
+
+    def __setitem__(self, key, value):
+        self.dirty = True
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.dirty = True
+        super().__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        self.dirty = True
+        super().update(*args, **kwargs)
+
+    def pop(self, *args):
+        self.dirty = True
+        return super().pop(*args)
+
+    def popitem(self):
+        self.dirty = True
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self.dirty = True
+        return super().setdefault(key, default)
+
+    def clear(self):
+        self.dirty = True
+        super().clear()
+
+
+class JournalCompactor:
+    """Background thread that periodically compacts journal storages"""
+
+    def __init__(self, interval: float = 30.0):
+        self.interval = interval
+        self._storages = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def register(self, storage: "JournalStorage") -> None:
+        """Add a storage to compact, starting the thread on first use"""
+        with self._lock:
+            self._storages.add(storage)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="journal-compactor", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the background thread and wait for a running compaction"""
+        self._stop.set()
+        with self._lock:
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                storages = list(self._storages)
+            for storage in storages:
+                try:
+                    if storage.needs_compaction():
+                        storage.compact()
+                except Exception as e:
+                    print(f"Error compacting {storage.path.name}: {e}")
+
+
+class JournalStorage(Storage):
+    """Event-sourced TinyDB storage: snapshot file plus append-only journal
+
+    Each write appends only the documents that changed (put/delete records,
+    one JSON object per line) to `<store>.journal` instead of rewriting the
+    store, so disk writes are proportional to the change. Changed documents
+    are found without serializing: loaded documents are TrackedDicts that
+    flag in-place updates, inserts arrive as plain dicts, and only the table
+    TinyDB actually rewrote is scanned.
+
+    Startup loads the snapshot (`<store>`) and replays the journal; a torn
+    last line from a crash is ignored. Compaction -- from the background
+    JournalCompactor, or on close -- atomically rewrites the snapshot and
+    keeps only journal records appended after it was taken.
+    """
+
+    def __init__(self, path, fsync: bool = True, compactor: JournalCompactor = None,
+                 compact_bytes: int = 256 * 1024, **kwargs):
+        super().__init__()
+        self.path = Path(path)
+        self.temp_path = self.path.with_name(self.path.name + TEMP_SUFFIX)
+        self.journal_path = self.path.with_name(self.path.name + JOURNAL_SUFFIX)
+        self.fsync = fsync
+        self.compact_bytes = compact_bytes
+        self.kwargs = kwargs
+        self.metrics = None  # DataMetrics receiving write counts, when enabled
+
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()  # one compaction at a time; they share temp_path
+        self._data = None
+        self._loaded = False
+        self._snapshot = {}  # copy of the data as journaled, for compaction
+        self._tables = {}  # table name -> table dict object last written
+        self._doc_ids = {}  # table name -> set of doc ids last written
+        self._journal = None
+        self._journal_bytes = 0
+
+        if not self.path.exists():
+            self.path.touch()
+        if compactor is not None:
+            compactor.register(self)
+
+    # Loading
+
+    def _load(self):
+        try:
+            data = _load_json(self.path)
+        except ValueError:
+            moved = _quarantine(self.path)
+            print(f"Warning: {self.path.name} was corrupt and has been moved to {moved.name}")
+            self.path.touch()
+            data = None
+        data = data or {}
+
+        valid_bytes = 0
+        if self.journal_path.exists():
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn write at the end of the journal
+                        break
+                    self._apply(data, record)
+                    valid_bytes += len(line)
+            if valid_bytes != self.journal_path.stat().st_size:
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(valid_bytes)
+
+        for name, table in data.items():
+            for doc_id, doc in table.items():
+                table[doc_id] = TrackedDict(doc)
+        self._remember(data)
+        self._snapshot = _copy_doc(data)
+        self._journal_bytes = valid_bytes
+        self._data = data if data else None
+        self._loaded = True
+
+    @staticmethod
+    def _apply(data: Dict[str, Any], record: Dict[str, Any]) -> None:
+        """Apply one journal record to the in-memory data"""
+        op, name = record["op"], record["t"]
+        if op == "put":
+            data.setdefault(name, {})[record["id"]] = record["doc"]
+        elif op == "del":
+            data.get(name, {}).pop(record["id"], None)
+        elif op == "clear":
+            data[name] = {}
+        elif op == "drop":
+            data.pop(name, None)
+
+    def _remember(self, data: Dict[str, Any]) -> None:
+        """Record the table objects and doc ids as last written"""
+        self._tables = {name: table for name, table in data.items()}
+        self._doc_ids = {name: set(table) for name, table in data.items()}
+
+    # Storage interface
+
+    def read(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            return self._data
+
+    def write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            records = []
+            for name in list(self._tables):
+                if name not in data:
+                    records.append({"op": "drop", "t": name})
+                    del self._tables[name]
+                    del self._doc_ids[name]
+
+            for name, table in data.items():
+                # TinyDB replaces the dict of the table it modified; others are untouched
+                if self._tables.get(name) is table:
+                    continue
+
+                previous_ids = self._doc_ids.get(name, set())
+                if previous_ids and not table:
+                    records.append({"op": "clear", "t": name})
+                else:
+                    new_docs = 0
+                    for doc_id, doc in table.items():
+                        if doc_id not in previous_ids:
+                            new_docs += 1
+                            records.append({"op": "put", "t": name, "id": doc_id, "doc": doc})
+                        elif type(doc) is not TrackedDict or doc.dirty:
+                            records.append({"op": "put", "t": name, "id": doc_id, "doc": doc})
+                    # Only look for removed ids when the counts say some are missing
+                    if len(table) - new_docs < len(previous_ids):
+                        for doc_id in previous_ids.difference(table):
+                            records.append({"op": "del", "t": name, "id": doc_id})
+
+                for doc_id, doc in table.items():
+                    if type(doc) is not TrackedDict:
+                        table[doc_id] = TrackedDict(doc)
+                    else:
+                        doc.dirty = False
+                self._tables[name] = table
+                self._doc_ids[name] = set(table)
+
+            if records:
+                self._append(records)
+                for record in records:
+                    if record["op"] == "put":
+                        record = dict(record, doc=_copy_doc(record["doc"]))
+                    self._apply(self._snapshot, record)
+            self._data = data
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the journal"""
+        payload = "".join(json.dumps(r, **self.kwargs) + "\n" for r in records).encode("utf-8")
+        if self._journal is None:
+            self._journal = open(self.journal_path, "ab")
+        self._journal.write(payload)
+        self._journal.flush()
+        if self.fsync:
+            os.fsync(self._journal.fileno())
+        self._journal_bytes += len(payload)
+        if self.metrics is not None:
+            self.metrics.record_write(self.path.name, len(payload), "appends")
+
+    # Compaction
+
+    def needs_compaction(self) -> bool:
+        """Whether the journal has grown past the compaction threshold"""
+        return self._journal_bytes >= self.compact_bytes
+
+    def compact(self) -> None:
+        """Fold the journal into a new snapshot"""
+        # Taken before _lock, never while holding it
+        with self._compact_lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        with self._lock:
+            if not self._loaded or not self._journal_bytes:
+                return
+            # TinyDB edits the documents read() returned without holding our lock,
+            # so serialize the copy maintained by write() instead
+            serialized = json.dumps(self._snapshot, **self.kwargs)
+            journal_offset = self._journal_bytes
+
+        # Write the snapshot outside the lock so writers aren't blocked on disk I/O
+        with open(self.temp_path, "w", encoding="utf-8") as f:
+            f.write(serialized)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(self.temp_path, self.path)
+        if self.fsync:
+            _fsync_dir(self.path.parent)
+        if self.metrics is not None:
+            self.metrics.record_write(self.path.name, len(serialized.encode("utf-8")), "compactions")
+
+        with self._lock:
+            # Keep records appended while the snapshot was being written.
+            # Replaying records already in the snapshot is harmless, as they're idempotent.
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            with open(self.journal_path, "rb") as f:
+                f.seek(journal_offset)
+                tail = f.read()
+            journal_temp = self.journal_path.with_name(self.journal_path.name + TEMP_SUFFIX)
+            with open(journal_temp, "wb") as f:
+                f.write(tail)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            os.replace(journal_temp, self.journal_path)
+            self._journal_bytes = len(tail)
+
+    def close(self) -> None:
+        self.compact()
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
@@ -9,7 +9,7 @@ from datetime import datetime
 print("Testing imports...")
 try:
     from src.models import Task, TaskCategory, DiaryEntry, Person, FocusSession
-    from src.utils import DataManager
+    from src.utils import DataManager, DataMetrics, FocusAnalytics, MentionIndex
     from src.agents import AnxietyKillerAgent, AskMeAgent
     print("[OK] All imports successful")
 except Exception as e:
@@ -32,6 +32,7 @@ try:
     dm.save_task(test_task)
     loaded_task = dm.get_task("test1")
     assert loaded_task.title == "Test Task"
+    assert dm.get_task("test1") is loaded_task  # identity map
     print("[OK] Task operations work")
     
     # Test diary operations
@@ -42,6 +43,7 @@ try:
     dm.save_diary_entry(test_entry)
     loaded_entry = dm.get_diary_entry(test_entry.date)
     assert loaded_entry.content == "Test diary entry"
+    assert test_entry.date in dm.get_diary_dates()
     print("[OK] Diary operations work")
     
     # Test social operations
@@ -55,12 +57,236 @@ try:
     assert loaded_person.name == "Test Person"
     print("[OK] Social book operations work")
     
+    # Test mention search
+    mention_index = MentionIndex(dm)
+    assert mention_index.search("test per")[0]["id"] == "person1"
+    test_task.title = "Renamed Test Task"
+    dm.save_task(test_task)
+    assert mention_index.search("renamed")[0]["id"] == "test1"
+    dm.save_task(Task(id="mention1", title="Buy groceries", description="", category=TaskCategory.TODAY_MUST))
+    assert "mention1" in [item["id"] for item in mention_index.search("buy")]
+    edited_task = dm.get_task("mention1")  # shared with the index, edited in place
+    edited_task.title = "Call plumber"
+    dm.save_task(edited_task)
+    assert "mention1" not in [item["id"] for item in mention_index.search("buy")]
+    assert mention_index.search("call plumber")[0]["id"] == "mention1"
+    assert [name for name, key in mention_index._names if key == ("task", "mention1")] == ["call plumber"]
+    assert not any(("task", "mention1") in mention_index._trigram_postings.get(t, ()) for t in ("buy", "gro"))
+    dm.delete_task("mention1")
+    mention_index.close()
+    print("[OK] Mention search works")
+    
+    # Test focus operations
+    stats_before = dm.get_focus_stats()
+    test_session = FocusSession(
+        id="focus1",
+        start_time=datetime.now().isoformat(),
+        duration_minutes=25
+    )
+    test_session.complete(25 * 60)
+    dm.save_focus_session(test_session)
+    stats = dm.get_focus_stats()
+    assert stats.total_sessions == stats_before.total_sessions + 1
+    assert stats.total_minutes == stats_before.total_minutes + 25
+    today = datetime.now().strftime("%Y-%m-%d")
+    assert FocusAnalytics(dm).range_totals(today, today)["minutes"] >= 25
+    print("[OK] Focus operations work")
+    
     # Test settings
     dm.save_setting("test_key", "test_value")
     value = dm.get_setting("test_key")
     assert value == "test_value"
     print("[OK] Settings operations work")
     
+    # Test data metrics
+    metrics = dm.enable_metrics(DataMetrics())
+    dm.save_setting("test_key", "other_value")
+    dm.get_task("test1")
+    dm.disable_metrics()
+    snapshot = metrics.snapshot()
+    assert snapshot["methods"]["save_setting"]["count"] == 1
+    assert snapshot["stores"]["settings.json"]["bytes_written"] > 0
+    print("[OK] Data metrics work")
+    
+    # Test agent telemetry
+    import asyncio
+    from src.utils.agent_telemetry import AgentTelemetry
+    telemetry = AgentTelemetry()
+    
+    async def tracked_call():
+        async with telemetry.track("test_agent", "test_feature"):
+            pass
+    
+    asyncio.run(tracked_call())
+    assert telemetry.rollup()["test_feature"]["calls"] == 1
+    print("[OK] Agent telemetry works")
+    
+    # Test session log maintenance
+    import json, os, tempfile, time
+    from src.utils import SessionLogManager
+    with tempfile.TemporaryDirectory() as log_dir:
+        session = {"session_id": "s1", "start_time": 1700000000.0, "end_time": 1700000002.0,
+                   "runs": [{"name": "Ask Me", "status": "Completed", "nodes": [{"details": {"internals": {
+                       "llm_details": [{"input": [{"role": "system", "content": "Be kind"}],
+                                        "input_tokens": 12, "output_tokens": 5}]}}}]}]}
+        with open(os.path.join(log_dir, "s1.json"), "w") as f:
+            json.dump(session, f)
+        os.utime(os.path.join(log_dir, "s1.json"), (time.time() - 3600, time.time() - 3600))
+        logs = SessionLogManager(log_dir)
+        assert logs.maintain() == {"indexed": 1, "archived": 1, "expired_archives": 0}
+        assert logs.sessions(agent="Ask Me")[0]["input_tokens"] == 12
+        assert logs.load_session("s1") == session
+        session2 = dict(session, session_id="s2")
+        with open(os.path.join(log_dir, "s2.json"), "w") as f:
+            json.dump(session2, f)
+        os.utime(os.path.join(log_dir, "s2.json"), (time.time() - 3600, time.time() - 3600))
+        assert logs.maintain()["archived"] == 1
+        assert len(os.listdir(os.path.join(log_dir, "archive"))) == 2  # same second, separate archives
+        assert logs.load_session("s1") == session and logs.load_session("s2") == session2
+        
+        # The default root follows railtracks: RAILTRACKS_HOME, then the nearest .railtracks upwards
+        from pathlib import Path
+        from unittest.mock import patch
+        os.makedirs(os.path.join(log_dir, ".railtracks"))
+        os.makedirs(os.path.join(log_dir, "project", "src"))
+        cwd = os.getcwd()
+        os.chdir(os.path.join(log_dir, "project", "src"))
+        try:
+            with patch.dict(os.environ):
+                os.environ.pop("RAILTRACKS_HOME", None)
+                assert SessionLogManager().root.resolve() == Path(log_dir, ".railtracks").resolve()
+                os.environ["RAILTRACKS_HOME"] = os.path.join(log_dir, "project")
+                assert SessionLogManager().root == Path(log_dir, "project", ".railtracks")
+        finally:
+            os.chdir(cwd)
+    print("[OK] Session log maintenance works")
+    
+    # Test journal storage
+    from tinydb import TinyDB
+    from src.utils.storage import JournalStorage
+    with tempfile.TemporaryDirectory() as journal_dir:
+        store_path = os.path.join(journal_dir, "store.json")
+        journal_path = store_path + ".journal"
+        open_store = lambda: TinyDB(store_path, storage=JournalStorage, fsync=False)
+        db = open_store()
+        db.insert({"name": "a"})
+        db.insert({"name": "b"})
+        db.update({"name": "a2"}, doc_ids=[1])
+        db.remove(doc_ids=[2])
+        assert open_store().all() == [{"name": "a2"}]  # replayed from the journal
+        db.close()
+        assert open_store().all() == [{"name": "a2"}] and os.path.getsize(journal_path) == 0
+    
+        # A torn last line is dropped and truncated away
+        put_line = json.dumps({"op": "put", "t": "_default", "id": "3", "doc": {"name": "c"}}) + "\n"
+        with open(journal_path, "a") as f:
+            f.write(put_line + '{"op": "put", "t": "_def')
+        db = open_store()
+        assert db.all() == [{"name": "a2"}, {"name": "c"}]
+        assert os.path.getsize(journal_path) == len(put_line)
+    
+        # Records appended while the snapshot is written survive compaction
+        class AppendDuringCompaction:
+            def record_write(self, store, nbytes, kind="full_writes"):
+                if kind == "compactions":
+                    db.insert({"name": "late"})
+        db.storage.metrics = AppendDuringCompaction()
+        db.storage.compact()
+        db.storage.metrics = None
+        with open(store_path) as f:
+            assert len(json.load(f)["_default"]) == 2
+        assert [doc["name"] for doc in open_store().all()] == ["a2", "c", "late"]
+        # Compaction ignores documents TinyDB is still editing between read() and write()
+        db.storage.read()["_default"]["1"]["name"] = "unsaved"
+        db.storage.compact()
+        with open(store_path) as f:
+            assert [doc["name"] for doc in json.load(f)["_default"].values()] == ["a2", "c", "late"]
+        db.close()
+    
+        # clear_all_data is journaled as a table drop followed by new puts
+        journal_dm = DataManager(journal_dir, fsync=False, storage_engine="journal")
+        for i in range(3):
+            journal_dm.save_task(Task(id=f"old{i}", title="Old", description="", category=TaskCategory.TODAY_MUST))
+        journal_dm.clear_all_data()
+        journal_dm.save_task(Task(id="new", title="New", description="", category=TaskCategory.TODAY_MUST))
+        reopened_dm = DataManager(journal_dir, fsync=False, storage_engine="journal")
+        assert [t.id for t in reopened_dm.get_all_tasks()] == ["new"]
+        reopened_dm.close()
+        journal_dm.close()
+        assert not journal_dm._compactor._thread.is_alive()
+    print("[OK] Journal storage works")
+    
+    # Test recovery of interrupted writes
+    from src.utils.storage import AtomicJSONStorage, recover_storage
+    with tempfile.TemporaryDirectory() as recover_dir:
+        store_path = os.path.join(recover_dir, "tasks.json")
+        with open(store_path, "w") as f:
+            f.write('{"_default": {"1": {"ti')
+        with open(store_path + ".tmp", "w") as f:
+            json.dump({"_default": {"1": {"title": "Saved"}}}, f)
+        assert recover_storage(recover_dir) == ["Restored tasks.json from an unfinished write"]
+        assert AtomicJSONStorage(store_path).read() == {"_default": {"1": {"title": "Saved"}}}
+        assert not os.path.exists(store_path + ".tmp")
+    
+        # Without a temp file a corrupt store is quarantined and starts empty
+        with open(store_path, "w") as f:
+            f.write('{"_default": {"1": {"ti')
+        assert recover_storage(recover_dir) == []
+        assert AtomicJSONStorage(store_path).read() is None
+        quarantined = [name for name in os.listdir(recover_dir) if name.startswith("tasks.json.corrupt-")]
+        assert len(quarantined) == 1 and os.path.getsize(store_path) == 0
+    print("[OK] Storage recovery works")
+    
+    # Test the ordered focus session index
+    with tempfile.TemporaryDirectory() as focus_dir:
+        focus_dm = DataManager(focus_dir, fsync=False)
+        for session_id, start in (("d1", "2024-03-04T09:00:00"), ("d2a", "2024-03-05T10:00:00"),
+                                  ("d2b", "2024-03-05T12:00:00"), ("d3", "2024-03-06T09:00:00")):
+            focus_dm.save_focus_session(FocusSession(id=session_id, start_time=start, duration_minutes=25))
+        assert [s.id for s in focus_dm.get_recent_focus_sessions(3)] == ["d3", "d2b", "d2a"]
+        # Saved after the index was built and out of start order: inserted in place
+        focus_dm.save_focus_session(FocusSession(id="d2early", start_time="2024-03-05T08:00:00",
+                                                 duration_minutes=25))
+        assert [s.id for s in focus_dm.get_focus_sessions_by_date("2024-03-05")] == ["d2early", "d2a", "d2b"]
+        assert [s.id for s in focus_dm.get_recent_focus_sessions(10)] == ["d3", "d2b", "d2a", "d2early", "d1"]
+        assert focus_dm.get_recent_focus_sessions(0) == []
+        assert focus_dm.get_focus_sessions_by_date("2024-03-07") == []
+        focus_dm.get_focus_daily_rollups()["2024-03-05"]["sessions"] = 0  # callers get a copy
+        assert focus_dm.get_focus_daily_rollups()["2024-03-05"]["sessions"] == 3
+        completed_session = FocusSession(id="d3b", start_time="2024-03-06T11:00:00", duration_minutes=25)
+        completed_session.complete(25 * 60)
+        focus_dm.save_focus_session(completed_session)
+        focus_dm.close()
+        
+        # One rollup document per day, summed into the totals when reopened
+        focus_path = os.path.join(focus_dir, "focus.json")
+        with open(focus_path) as f:
+            stored = json.load(f)
+        assert sorted((doc["date"], doc["sessions"]) for doc in stored["daily"].values()) == [
+            ("2024-03-04", 1), ("2024-03-05", 3), ("2024-03-06", 2)]
+        focus_dm = DataManager(focus_dir, fsync=False)
+        stats = focus_dm.get_focus_stats()
+        assert (stats.total_sessions, stats.total_minutes, stats.completion_rate) == (1, 25, 1 / 6)
+        assert list(focus_dm.get_focus_daily_rollups("2024-03-05", "2024-03-06")) == ["2024-03-05", "2024-03-06"]
+        assert focus_dm.get_focus_day_rollup("2024-03-07") is None
+        focus_analytics = FocusAnalytics(focus_dm)
+        assert focus_analytics.day("2024-03-06")["completed"] == 1
+        assert focus_analytics.range_totals("2024-03-01", "2024-03-05")["sessions"] == 4
+        assert [day["sessions"] for day in focus_analytics.daily("2024-03-03", "2024-03-05")] == [0, 1, 3]
+        focus_dm.close()
+        
+        # The older single aggregate document is replaced by rebuilt day rollups
+        stored.pop("daily")
+        stored["aggregates"] = {"1": {"recorded_sessions": 6, "daily": {}}}
+        with open(focus_path, "w") as f:
+            json.dump(stored, f)
+        focus_dm = DataManager(focus_dir, fsync=False)
+        assert focus_dm.get_focus_stats().total_minutes == 25
+        assert focus_dm.get_focus_daily_rollups()["2024-03-05"]["sessions"] == 3
+        assert "aggregates" not in focus_dm.focus_db.tables()
+        focus_dm.close()
+    print("[OK] Focus session index works")
+    
     print("\n[OK] DataManager tests passed!")
     
 except Exception as e:
@@ -87,6 +313,47 @@ try:
     from PyQt6.QtWidgets import QApplication
     from src.ui import MainWindow
     print("[OK] UI components can be imported")
+    
+    # Test the focus timer engine with a fake clock
+    import os
+    from unittest.mock import patch
+    from src.ui.focus_timer import FocusTimerEngine
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance() or QApplication(sys.argv)
+    clock = [100.0]
+    with patch("time.monotonic", lambda: clock[0]):
+        engine = FocusTimerEngine()
+        ticks, finished = [], []
+        engine.tick.connect(lambda remaining, elapsed: ticks.append((remaining, elapsed)))
+        engine.finished.connect(finished.append)
+        engine.start(5)
+        clock[0] = 100.4
+        engine._on_timeout()  # same second: no tick
+        clock[0] = 103.7
+        engine._on_timeout()  # after a stall: elapsed comes from the start timestamp
+        assert engine.elapsed_seconds() == 3 and not finished
+        clock[0] = 105.0
+        engine._on_timeout()
+        assert ticks == [(5, 0), (2, 3), (0, 5)]
+        assert finished == [5] and not engine.is_running
+    print("[OK] Focus timer engine works")
+    
+    # Chat history loads above the greeting, even when the agent starts before the first paint
+    import tempfile
+    from src.ui.anxiety_killer_widget import AnxietyKillerWidget
+    with tempfile.TemporaryDirectory() as chat_dir:
+        chat_dm = DataManager(chat_dir, fsync=False)
+        chat_dm.save_chat_message("anxiety_killer", "user", "Earlier message")
+        chat_widget = AnxietyKillerWidget(chat_dm)
+        chat_widget.show()  # queues the history load
+        chat_widget.initialize_agent("test_key")
+        app.processEvents()
+        chat_text = chat_widget.chat_display.toPlainText()
+        assert chat_text.count("Earlier message") == 1
+        assert chat_text.index("Earlier message") < chat_text.index("Anxiety Killer is ready")
+        chat_widget.close()
+        chat_dm.close()
+    print("[OK] Chat history loads before the greeting")
 except Exception as e:
     print(f"[ERROR] UI import error: {e}")
     import traceback